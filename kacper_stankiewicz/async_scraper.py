@@ -0,0 +1,259 @@
+import asyncio
+import functools
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit
+
+from web_scraper import WebScrapper, _worker_scraper
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None  # Fetches fall back to the scraper's pooled session in worker threads
+
+
+def _parse_in_worker(html_content, max_results, parser_engine, profile):
+    """
+    Parses a search results page inside a worker process.
+
+    Parameters:
+        html_content (str): HTML content of the search results page.
+        max_results (int): Maximum number of products to extract.
+        parser_engine (str): Engine used to parse the page.
+        profile (SelectorProfile): Selector profile of the page (locale, prices, sponsored markers).
+
+    Returns:
+        list: A list of ProductRecord objects.
+    """
+    return _worker_scraper(parser_engine, profile).parse_products(html_content, max_results)
+
+
+class HostRateLimiter:
+    """
+    Spaces out requests to the same host so that no host receives more than a given rate.
+    """
+
+    def __init__(self, requests_per_second):
+        """
+        Initializes the rate limiter.
+
+        Parameters:
+            requests_per_second (float | dict): Maximum rate for every host, or a mapping of
+                                                host name to rate. Hosts missing from the mapping
+                                                are not limited.
+        """
+        self.requests_per_second = requests_per_second
+        self._next_slot = {}  # Host name -> earliest loop time of the next request
+        self._lock = asyncio.Lock()
+
+    def _rate_for(self, host):
+        if isinstance(self.requests_per_second, dict):
+            return self.requests_per_second.get(host)
+        return self.requests_per_second
+
+    async def acquire(self, url):
+        """
+        Waits until a request to the host of the given URL is allowed.
+
+        Parameters:
+            url (str): URL about to be requested.
+        """
+        host = urlsplit(url).hostname
+        rate = self._rate_for(host)
+
+        if not rate:
+            return
+
+        loop = asyncio.get_running_loop()
+
+        # Reserve the next free slot for this host, then sleep outside the lock
+        async with self._lock:
+            now = loop.time()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + 1.0 / rate
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class AsyncBatchScraper:
+    """
+    Scrapes many search queries concurrently on an asyncio event loop.
+
+    Pages are fetched with aiohttp (or with the scraper's pooled session in threads when
+    aiohttp is not installed) under a bounded semaphore, and parsed in a process pool so
+    BeautifulSoup never blocks the event loop. The aiohttp path only reuses the scraper's URL,
+    headers and timeouts: it does not go through the scraper's response cache nor its retry
+    policy, and a failed fetch is counted as a failure instead of being retried.
+    """
+
+    def __init__(self, scraper=None, concurrency=10, rate_limit=None, parse_workers=None, max_results=10):
+        """
+        Initializes the batch scraper.
+
+        Parameters:
+            scraper (WebScrapper): Scraper providing the URL, headers, timeouts and parser engine (optional).
+            concurrency (int): Maximum number of queries in flight at once (default: 10).
+            rate_limit (float | dict): Requests per second allowed per host, or a mapping of host
+                                       name to rate (default: no limit).
+            parse_workers (int): Number of parsing processes (default: number of CPUs).
+            max_results (int): Maximum number of products to extract per query (default: 10).
+        """
+        self.scraper = scraper or WebScrapper()
+        self.concurrency = concurrency
+        self.rate_limit = rate_limit
+        self.parse_workers = parse_workers
+        self.max_results = max_results
+        self.latencies = []  # Seconds spent on each query (fetch + parse)
+        self.stats = {}  # Aggregate throughput of the last `scrape_many` run
+
+    async def scrape_many(self, queries, concurrency=None, sink=None):
+        """
+        Scrapes the given queries concurrently and yields results as they complete.
+
+        Parameters:
+            queries (iterable): Search terms to scrape.
+            concurrency (int): Overrides the maximum number of queries in flight (optional).
+            sink (ProductExportSink): Export sink the products of every query are written to (optional).
+
+        Yields:
+            tuple: (query, products) for each query, in completion order.
+        """
+        queries = list(queries)
+        concurrency = concurrency or self.concurrency
+        semaphore = asyncio.Semaphore(concurrency)
+        rate_limiter = HostRateLimiter(self.rate_limit) if self.rate_limit else None
+        loop = asyncio.get_running_loop()
+
+        self.latencies = []
+        failures = 0
+        start_time = time.perf_counter()
+
+        parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+        try:
+            async with self._open_http_session(concurrency) as http_session:
+
+                async def scrape_one(query):
+                    async with semaphore:
+                        if rate_limiter:
+                            await rate_limiter.acquire(self.scraper.base_url)
+
+                        query_start = time.perf_counter()
+                        html_content = await self._fetch(http_session, query)
+
+                        products = []
+                        if html_content:
+                            products = await loop.run_in_executor(
+                                parse_pool, _parse_in_worker,
+                                html_content, self.max_results, self.scraper.parser_engine, self.scraper.profile,
+                            )
+
+                        self.latencies.append(time.perf_counter() - query_start)
+                        return query, products, bool(html_content)
+
+                tasks = [asyncio.ensure_future(scrape_one(query)) for query in queries]
+
+                try:
+                    for next_done in asyncio.as_completed(tasks):
+                        query, products, fetched = await next_done
+                        if not fetched:
+                            failures += 1
+                        if sink is not None:
+                            sink.write_many(products, query)
+                        yield query, products
+
+                finally:
+                    # Cancel the remaining queries if the consumer stops iterating early, and let them
+                    # unwind before the HTTP session closes the connections they use
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+
+                    self.stats = self._summarize(time.perf_counter() - start_time, failures)
+
+        finally:
+            # Shutting the pool down waits for its processes: do it in a thread, off the event loop
+            await loop.run_in_executor(None, functools.partial(parse_pool.shutdown, cancel_futures=True))
+
+    # This helper method is intended for internal use within the class.
+    # It opens the aiohttp session, or nothing when falling back to the scraper's session.
+    def _open_http_session(self, concurrency):
+        if aiohttp is None:
+            return _NullAsyncContext()
+
+        connect_timeout, read_timeout = self.scraper.timeout
+        return aiohttp.ClientSession(
+            headers=self.scraper.headers,
+            connector=aiohttp.TCPConnector(limit=concurrency),
+            timeout=aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout),
+        )
+
+    # This helper method is intended for internal use within the class.
+    # It fetches one search results page without blocking the event loop.
+    async def _fetch(self, http_session, query):
+        """
+        Fetches the HTML content of the search results page for the given query.
+
+        Without aiohttp the scraper's `fetch_search_results` is used, with its response cache
+        and retries; with aiohttp the page is requested once, bypassing both.
+
+        Returns:
+            str: HTML content of the search results page, or an empty string on failure.
+        """
+        if http_session is None:
+            return await asyncio.to_thread(self.scraper.fetch_search_results, query)
+
+        try:
+            async with http_session.get(self.scraper.base_url, params={"k": query}) as response:
+                response.raise_for_status()
+                return await response.text()
+
+        except asyncio.TimeoutError:
+            print(f"Request timed out for query {query!r}.")
+
+        except aiohttp.ClientError as e:
+            print(f"Failed to fetch Amazon page for query {query!r}: {e}")
+
+        return ""
+
+    # This helper method is intended for internal use within the class.
+    # It computes the aggregate throughput and latency percentiles of a run.
+    def _summarize(self, elapsed, failures):
+        latencies = sorted(self.latencies)
+        completed = len(latencies)
+
+        return {
+            "queries": completed,
+            "failures": failures,
+            "elapsed": elapsed,
+            "queries_per_second": completed / elapsed if elapsed else 0.0,
+            "p50_latency": statistics.median(latencies) if latencies else None,
+            "p95_latency": latencies[min(completed - 1, int(0.95 * completed))] if latencies else None,
+        }
+
+    def print_summary(self):
+        """
+        Prints the aggregate throughput of the last `scrape_many` run.
+        """
+        if not self.stats or not self.stats["queries"]:
+            print("No queries were scraped.")
+            return
+
+        print(
+            f"Scraped {self.stats['queries']} queries ({self.stats['failures']} failed) "
+            f"in {self.stats['elapsed']:.2f}s: {self.stats['queries_per_second']:.2f} queries/s, "
+            f"p50 {self.stats['p50_latency'] * 1000:.0f} ms, p95 {self.stats['p95_latency'] * 1000:.0f} ms"
+        )
+
+
+class _NullAsyncContext:
+    """
+    Async context manager yielding None, used when aiohttp is not installed.
+    """
+
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
@@ -0,0 +1,147 @@
+from bisect import bisect_right
+
+from PIL import Image
+
+from ocr_backends import PytesseractBackend
+
+# White band between two stitched products, so Tesseract never joins their lines
+STRIP_GAP = 40
+
+
+def product_boxes(width, height):
+    """
+    Splits a product capture into the areas of its image, name, and price.
+
+    Parameters:
+        width (int): Width of the product capture.
+        height (int): Height of the product capture.
+
+    Returns:
+        tuple: (image_box, name_box, price_box), each a (left, top, right, bottom) box.
+    """
+    image_box = (0, 0, width, height // 2)  # Top half for the image
+    name_box = (0, height // 2, width, (3 * height) // 4)  # Middle for name
+    price_box = (0, (3 * height) // 4, width, height)  # Bottom for price
+    return image_box, name_box, price_box
+
+
+def text_area(product_image):
+    """
+    Crops the text part of a product capture: its name and price areas, which are contiguous.
+
+    Parameters:
+        product_image (PIL.Image.Image): The product capture.
+
+    Returns:
+        tuple: (RGB image of the text part, height of its name area).
+    """
+    _, name_box, price_box = product_boxes(*product_image.size)
+    cropped = product_image.crop((0, name_box[1], name_box[2], price_box[3])).convert("RGB")
+    return cropped, price_box[1] - name_box[1]
+
+
+def stitch_text_strips(text_areas, gap=STRIP_GAP):
+    """
+    Stacks the text parts of several product captures in one image.
+
+    Parameters:
+        text_areas (list): (image, name height) pairs returned by `text_area`.
+        gap (int): Height of the white band between two products (default: 40).
+
+    Returns:
+        tuple: (stitched image, strips), where strips holds a (top, price_top) pair per product:
+            the y coordinates in the stitched image where its name area and its price area start.
+    """
+    width = max((area_image.width for area_image, _ in text_areas), default=1)
+    height = sum(area_image.height for area_image, _ in text_areas) + gap * max(len(text_areas) - 1, 0)
+    stitched = Image.new("RGB", (width, max(height, 1)), "white")
+
+    strips = []
+    top = 0
+    for area_image, name_height in text_areas:
+        stitched.paste(area_image, (0, top))
+        strips.append((top, top + name_height))
+        top += area_image.height + gap
+
+    return stitched, strips
+
+
+def split_ocr_data(ocr_data, strips):
+    """
+    Assigns the words recognized on a stitched image to the name or price area of their
+    product, by the vertical center of their bounding box.
+
+    Parameters:
+        ocr_data (dict): Output of an OCR backend's `image_to_data`.
+        strips (list): (top, price_top) pairs returned by `stitch_text_strips`.
+
+    Returns:
+        list: A (name_data, price_data) pair per product, each in the same dict format as
+            `ocr_data` and keeping Tesseract's reading order. Word tops are relative to the
+            top of the product's name area.
+    """
+    strip_tops = [top for top, _ in strips]
+    indexes = [([], []) for _ in strips]
+
+    for i, text in enumerate(ocr_data["text"]):
+        if not text.strip():
+            continue
+
+        center_y = ocr_data["top"][i] + ocr_data["height"][i] / 2
+        product_index = bisect_right(strip_tops, center_y) - 1
+        if product_index < 0:
+            continue
+
+        _, price_top = strips[product_index]
+        name_indexes, price_indexes = indexes[product_index]
+        (name_indexes if center_y < price_top else price_indexes).append(i)
+
+    return [
+        tuple(
+            {key: [values[i] - top if key == "top" else values[i] for i in area] for key, values in ocr_data.items()}
+            for area in product
+        )
+        for (top, _), product in zip(strips, indexes)
+    ]
+
+
+def ocr_products(product_images, backend=None, gap=STRIP_GAP, cache=None):
+    """
+    Recognizes the name and price areas of several product captures with a single Tesseract
+    run, instead of one run per area (each run starts a process and reloads the language data).
+
+    With a cache, products whose text looks the same as in an earlier run are answered from
+    it, and only the others are stitched and recognized.
+
+    Parameters:
+        product_images (list): PIL images of the products, laid out as described by `product_boxes`.
+        backend (PytesseractBackend or TesserocrBackend): OCR backend (default: a new pytesseract backend).
+        gap (int): Height of the white band between two products (default: 40).
+        cache (OCRCache): Cache of the results of each product (optional).
+
+    Returns:
+        list: A (name_data, price_data) pair of OCR dicts per product, in the same order.
+    """
+    backend = backend or PytesseractBackend()
+    text_areas = [text_area(product_image) for product_image in product_images]
+    results = [None] * len(text_areas)
+    keys = []
+
+    if cache is not None:
+        for index, (area_image, name_height) in enumerate(text_areas):
+            keys.append(cache.make_key(area_image, backend.name, backend.language, "ocr_products", name_height))
+            cached = cache.get(keys[index])
+            if cached is not None:
+                results[index] = tuple(cached)
+
+    missing = [index for index, result in enumerate(results) if result is None]
+    if missing:
+        stitched, strips = stitch_text_strips([text_areas[index] for index in missing], gap)
+        ocr_data = backend.image_to_data(stitched)
+
+        for index, result in zip(missing, split_ocr_data(ocr_data, strips)):
+            results[index] = result
+            if cache is not None:
+                cache.put(keys[index], result)
+
+    return results
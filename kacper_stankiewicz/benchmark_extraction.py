@@ -0,0 +1,77 @@
+import argparse
+import re
+import time
+
+from bs4 import BeautifulSoup
+
+from selector_profiles import PROFILES, get_profile
+
+
+def _legacy_extract(product_html):
+    """
+    Extracts the image URL and name the way the scraper originally did: two uncompiled,
+    unanchored lazy patterns, each scanning the whole serialized card.
+    """
+    image_match = re.search(r'<img.*?src="(.*?)"', product_html)
+    name_match = re.search(r'<img.*?alt="(.*?)"', product_html)
+    return (
+        image_match.group(1) if image_match else "",
+        name_match.group(1) if name_match else "",
+    )
+
+
+def _load_cards(paths, profile):
+    """
+    Serializes the product cards of the given saved result pages, as `parse_products` does.
+    """
+    cards = []
+
+    for path in paths:
+        with open(path, encoding="utf-8") as html_file:
+            soup = BeautifulSoup(html_file.read(), "html.parser")
+        cards.extend(str(element) for element in soup.select(profile.result_selector))
+
+    return cards
+
+
+def _time_per_card(extract, cards, rounds):
+    """
+    Returns the best average extraction time per card over several rounds, in microseconds.
+    """
+    best = float("inf")
+
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for card in cards:
+            extract(card)
+        best = min(best, (time.perf_counter() - start) / len(cards))
+
+    return best * 1_000_000
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Per-card extraction time: legacy RegEx helpers vs selector profile.")
+    arg_parser.add_argument("pages", nargs="+", help="Saved Amazon search results pages (.html).")
+    arg_parser.add_argument("--profile", default="amazon.es", choices=sorted(PROFILES), help="Selector profile to use.")
+    arg_parser.add_argument("--rounds", type=int, default=5, help="Number of timed rounds (default: 5).")
+    args = arg_parser.parse_args()
+
+    profile = get_profile(args.profile)
+    cards = _load_cards(args.pages, profile)
+
+    if not cards:
+        print("No product cards found in the given pages.")
+        return
+
+    legacy = _time_per_card(_legacy_extract, cards, args.rounds)
+    compiled = _time_per_card(profile.extract_image_and_name, cards, args.rounds)
+    mismatches = sum(_legacy_extract(card) != profile.extract_image_and_name(card) for card in cards)
+
+    print(f"{len(cards)} cards from {len(args.pages)} page(s)")
+    print(f"legacy helpers    {legacy:8.2f} us/card")
+    print(f"selector profile  {compiled:8.2f} us/card ({legacy / compiled:.1f}x faster)")
+    print(f"cards with different output: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import argparse
+import glob
+import os
+import tempfile
+import time
+
+from PIL import Image
+
+from batch_ocr import ocr_products, product_boxes
+from ocr_backends import BACKENDS, TESSEROCR_AVAILABLE, create_ocr_backend
+from ocr_cache import OCRCache
+
+
+def _per_region_ocr(product_images, backend):
+    """
+    The former fetch_products path: one OCR call for the name and one for the price of each product.
+    """
+    results = []
+    for product_image in product_images:
+        _, name_box, price_box = product_boxes(*product_image.size)
+        results.append(tuple(backend.image_to_data(product_image.crop(box)) for box in (name_box, price_box)))
+    return results
+
+
+def _words(ocr_data):
+    return " ".join(text.strip() for text in ocr_data["text"] if text.strip())
+
+
+def _best_seconds(ocr, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = ocr()
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+
+def _compare_paths(product_images, paths, backend, repeat):
+    """
+    Per-region OCR (8 calls for 4 captures) against one call on the stitched text strips.
+    """
+    before, before_results = _best_seconds(lambda: _per_region_ocr(product_images, backend), repeat)
+    after, after_results = _best_seconds(lambda: ocr_products(product_images, backend), repeat)
+
+    print(f"Per region ({2 * len(paths)} calls): {before:.2f} s")
+    print(f"Batched (1 call):      {after:.2f} s ({before / after:.1f}x)")
+
+    # Repeated run over the same captures: the first run fills the cache, the next ones hit it
+    with tempfile.TemporaryDirectory() as cache_directory:
+        cache = OCRCache(cache_directory)
+        cold, _ = _best_seconds(lambda: ocr_products(product_images, backend, cache=cache), 1)
+        warm, warm_results = _best_seconds(lambda: ocr_products(product_images, backend, cache=cache), repeat)
+        print(f"Batched, cold cache:   {cold:.2f} s")
+        print(f"Batched, warm cache:   {warm * 1000:.1f} ms ({before / warm:.0f}x), "
+              f"hit rate {cache.stats()['hit_rate']:.0%}")
+        if [[_words(data) for data in areas] for areas in warm_results] != \
+                [[_words(data) for data in areas] for areas in after_results]:
+            print("Warning: cached results differ from the batched OCR")
+
+    for path, before_areas, after_areas in zip(paths, before_results, after_results):
+        for area, before_data, after_data in zip(("name", "price"), before_areas, after_areas):
+            before_words, after_words = _words(before_data), _words(after_data)
+            status = "same" if before_words == after_words else f"differs (per region: {before_words!r})"
+            print(f"{os.path.basename(path)} {area}: {after_words!r} {status}")
+
+
+def _backend_latency(product_images, name, repeat):
+    """
+    Milliseconds to create a backend, and per image_to_data call on a product capture.
+    """
+    start = time.perf_counter()
+    backend = create_ocr_backend(name)
+    setup_ms = (time.perf_counter() - start) * 1000
+
+    latencies = []
+    try:
+        for _ in range(repeat):
+            for product_image in product_images:
+                start = time.perf_counter()
+                backend.image_to_data(product_image)
+                latencies.append((time.perf_counter() - start) * 1000)
+    finally:
+        backend.close()
+
+    latencies.sort()
+    print(f"{backend.name:<14}{setup_ms:>10.0f}{latencies[0]:>10.0f}{latencies[len(latencies) // 2]:>10.0f}"
+          f"{latencies[-1]:>10.0f}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OCR time of the RPA product captures, per region vs batched.")
+    arg_parser.add_argument("--captures", default=os.path.join("screenshots", "product_*_full.png"),
+                            help="Glob of the product captures (default: screenshots/product_*_full.png).")
+    arg_parser.add_argument("--backend", choices=BACKENDS, default="pytesseract",
+                            help="Backend for the per-region vs batched comparison (default: pytesseract).")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Runs per case (default: 3).")
+    args = arg_parser.parse_args()
+
+    paths = sorted(glob.glob(args.captures))
+    if not paths:
+        print(f"No captures match {args.captures}")
+        return
+
+    product_images = [Image.open(path) for path in paths]
+    for product_image in product_images:
+        product_image.load()  # Decode the PNGs before timing
+
+    backend = create_ocr_backend(args.backend)
+    print(f"{len(paths)} captures, {backend.name} backend")
+    try:
+        _compare_paths(product_images, paths, backend, args.repeat)
+    finally:
+        backend.close()
+
+    # Per-image latency of each installed backend, on whole captures
+    print(f"\n{'backend':<14}{'setup ms':>10}{'min ms':>10}{'median ms':>10}{'max ms':>10}")
+    for name in ("pytesseract", "tesserocr") if TESSEROCR_AVAILABLE else ("pytesseract",):
+        _backend_latency(product_images, name, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+import tracemalloc
+
+from corpus import FIXTURES_FOLDER, load_corpus
+from lxml_parser import LXML_AVAILABLE
+from web_scraper import WebScrapper
+
+try:
+    import resource
+except ImportError:
+    resource = None  # Not available on Windows; peak RSS is then not reported
+
+DEFAULT_BASELINE = os.path.join(FIXTURES_FOLDER, "benchmark_baseline.json")
+
+
+def _peak_rss_mb():
+    """
+    Returns the peak resident set size of the current process in MB, or None if unknown.
+    """
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _benchmark_engine(engine, fixtures_folder, rounds, max_results):
+    """
+    Benchmarks one parser engine over the corpus. Runs in a fresh process so that the peak
+    RSS of each engine is measured independently.
+
+    Returns:
+        dict: Per-page timings and peak Python heap allocations, plus the peak RSS of the process.
+    """
+    _, corpus = load_corpus(fixtures_folder)
+    pages = {}
+
+    for file_name, profile, html_content in corpus:
+        scraper = WebScrapper(engine, profile=profile)
+
+        # Best of several rounds, to filter out scheduling noise
+        best_seconds = float("inf")
+        for _ in range(rounds):
+            start = time.perf_counter()
+            products = scraper.parse_products(html_content, max_results)
+            best_seconds = min(best_seconds, time.perf_counter() - start)
+
+        # Allocations are traced in a separate, untimed run because tracing slows parsing down
+        tracemalloc.start()
+        scraper.parse_products(html_content, max_results)
+        allocated_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        pages[file_name] = {
+            "seconds": best_seconds,
+            "products": len(products),
+            "peak_allocated_kb": allocated_bytes / 1024,
+        }
+
+    return {"pages": pages, "peak_rss_mb": _peak_rss_mb()}
+
+
+def _summarize(result):
+    """
+    Computes the aggregate throughput of an engine over the whole corpus.
+    """
+    total_seconds = sum(page["seconds"] for page in result["pages"].values())
+    total_products = sum(page["products"] for page in result["pages"].values())
+
+    return {
+        "pages_per_second": len(result["pages"]) / total_seconds,
+        "products_per_second": total_products / total_seconds,
+    }
+
+
+def _print_report(engine, result, summary):
+    print(f"\n[{engine}]")
+    print(f"  {'page':<22}{'ms/page':>10}{'products':>10}{'peak alloc KB':>15}")
+
+    for file_name, page in result["pages"].items():
+        print(f"  {file_name:<22}{page['seconds'] * 1000:>10.2f}{page['products']:>10}"
+              f"{page['peak_allocated_kb']:>15.0f}")
+
+    peak_rss = f"{result['peak_rss_mb']:.1f} MB" if result["peak_rss_mb"] is not None else "n/a"
+    print(f"  {summary['pages_per_second']:.1f} pages/s, {summary['products_per_second']:.0f} products/s, "
+          f"peak RSS {peak_rss}")
+
+
+def _check_regressions(summaries, baseline_path, corpus_version, threshold):
+    """
+    Compares the throughput of each engine with the stored baseline.
+
+    Returns:
+        list: Descriptions of the engines that regressed by more than the threshold.
+    """
+    if not os.path.exists(baseline_path):
+        print(f"\nNo baseline at {baseline_path}; run with --save-baseline to create one.")
+        return []
+
+    with open(baseline_path, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+
+    if baseline.get("corpus_version") != corpus_version:
+        print(f"\nBaseline was recorded on corpus version {baseline.get('corpus_version')}, "
+              f"current corpus is version {corpus_version}; skipping the regression check.")
+        return []
+
+    regressions = []
+    print()
+
+    for engine, summary in summaries.items():
+        expected = baseline["engines"].get(engine)
+        if not expected:
+            continue
+
+        change = summary["pages_per_second"] / expected["pages_per_second"] - 1
+        print(f"{engine}: {change:+.1%} pages/s versus baseline")
+
+        if change < -threshold:
+            regressions.append(f"{engine} is {-change:.1%} slower than the baseline")
+
+    return regressions
+
+
+def main():
+    available_engines = ["soup", "stream"] + (["lxml"] if LXML_AVAILABLE else [])
+
+    arg_parser = argparse.ArgumentParser(description="Benchmarks the parser engines over the saved page corpus.")
+    arg_parser.add_argument("--engines", nargs="+", default=available_engines, choices=available_engines,
+                            help="Engines to benchmark (default: all available).")
+    arg_parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per page (default: 5).")
+    arg_parser.add_argument("--max-results", type=int, default=1000,
+                            help="max_results passed to parse_products (default: 1000, i.e. every product).")
+    arg_parser.add_argument("--fixtures", default=FIXTURES_FOLDER, help="Folder with corpus.json and saved pages.")
+    arg_parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline file to compare against.")
+    arg_parser.add_argument("--threshold", type=float, default=0.2,
+                            help="Allowed throughput drop versus the baseline before failing (default: 0.2).")
+    arg_parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline.")
+    args = arg_parser.parse_args()
+
+    corpus_version, corpus = load_corpus(args.fixtures)
+    print(f"Corpus version {corpus_version}: {len(corpus)} pages")
+
+    summaries = {}
+    context = multiprocessing.get_context("spawn")
+
+    for engine in args.engines:
+        with context.Pool(1) as pool:
+            result = pool.apply(_benchmark_engine, (engine, args.fixtures, args.rounds, args.max_results))
+
+        summaries[engine] = _summarize(result)
+        _print_report(engine, result, summaries[engine])
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump({"corpus_version": corpus_version, "engines": summaries}, baseline_file, indent=4)
+        print(f"\nBaseline saved to {args.baseline}")
+        return
+
+    regressions = _check_regressions(summaries, args.baseline, corpus_version, args.threshold)
+    if regressions:
+        print("\nPerformance regression: " + "; ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import argparse
+import json
+import os
+import pathlib
+import time
+
+from corpus import FIXTURES_FOLDER
+from web_scraper import WebScrapper
+
+
+def _corpus_paths(fixtures_folder, profile):
+    """
+    Returns the paths of the corpus pages saved for the given selector profile.
+    """
+    with open(os.path.join(fixtures_folder, "corpus.json"), encoding="utf-8") as manifest_file:
+        manifest = json.load(manifest_file)
+
+    return [
+        pathlib.Path(fixtures_folder, page["file"])
+        for page in manifest["pages"]
+        if page["profile"] == profile
+    ]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Measures how parse_many scales with the number of workers.")
+    arg_parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16],
+                            help="Worker counts to measure (default: 1 2 4 8 16).")
+    arg_parser.add_argument("--documents", type=int, default=400, help="Number of pages to parse (default: 400).")
+    arg_parser.add_argument("--engine", default="auto", choices=WebScrapper.PARSER_ENGINES, help="Parser engine.")
+    arg_parser.add_argument("--profile", default="amazon.es", help="Profile of the corpus pages to use.")
+    arg_parser.add_argument("--fixtures", default=FIXTURES_FOLDER, help="Folder with corpus.json and saved pages.")
+    args = arg_parser.parse_args()
+
+    paths = _corpus_paths(args.fixtures, args.profile)
+    if not paths:
+        print(f"No corpus pages for profile {args.profile}.")
+        return
+
+    # Paths are sent instead of HTML so the benchmark measures parsing, not pickling
+    documents = [paths[index % len(paths)] for index in range(args.documents)]
+    scraper = WebScrapper(args.engine, profile=args.profile)
+
+    print(f"{len(documents)} pages, engine {scraper.parser_engine}, {os.cpu_count()} CPUs")
+    baseline = None
+
+    for workers in args.workers:
+        start = time.perf_counter()
+        parsed = sum(1 for _ in scraper.parse_many(documents, max_results=1000, workers=workers))
+        elapsed = time.perf_counter() - start
+
+        baseline = baseline or elapsed
+        print(f"{workers:>3} workers: {parsed / elapsed:8.1f} pages/s, speedup {baseline / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import argparse
+import random
+import time
+
+from price_normalizer import LOCALES, MISSING_CENTS, normalize_price, normalize_prices
+
+# Texts the batch path must convert exactly like the scalar parser: words around the price,
+# currency codes glued to other letters or digits, several symbols and other locales' separators
+EDGE_CASES = [
+    "12,99 EURO", "USD12", "EUR 12,99", "12 EURUSD", "€ 12 USD", "$5 £3", "1.299,99 GBP",
+    "£1,299.99", "12,9", "12,999", "1.2,3", "Precio: 12,99 €", "", "sin precio",
+]
+
+
+def _sample_prices(count, seed=0):
+    """
+    Builds raw price strings the way they come out of a crawl of amazon.es: with and without
+    thousands separators, with and without a space before the currency symbol.
+    """
+    generator = random.Random(seed)
+    prices = []
+
+    for _ in range(count):
+        cents = generator.randrange(100, 400_000)
+        whole = f"{cents // 100:,}".replace(",", ".")
+        space = " " if generator.random() < 0.5 else ""
+        prices.append(f"{whole},{cents % 100:02d}{space}€")
+
+    return prices
+
+
+def _mismatches(texts, locale):
+    """
+    Returns the texts whose batch conversion (cents or currency) differs from the scalar one.
+    """
+    batch_cents, batch_currencies = normalize_prices(texts, locale)
+    mismatches = []
+
+    for text, batch_result in zip(texts, zip(batch_cents, batch_currencies)):
+        cents, currency = normalize_price(text, locale)
+        if (MISSING_CENTS if cents is None else cents, currency or "") != batch_result:
+            mismatches.append(text)
+
+    return mismatches
+
+
+def _time(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Price normalization: one string at a time vs whole column.")
+    arg_parser.add_argument("--prices", type=int, default=1_000_000, help="Number of price strings (default: 1000000).")
+    args = arg_parser.parse_args()
+
+    prices = _sample_prices(args.prices)
+    normalize_prices(prices[:1], "es")  # Warm up: loads NumPy outside the timed run
+
+    for locale in LOCALES:
+        mismatches = _mismatches(EDGE_CASES, locale)
+        if mismatches:
+            print(f"Warning: scalar and batch conversion disagree ({locale}): {mismatches}")
+
+    scalar_seconds, scalar_results = _time(lambda texts: [normalize_price(text, "es") for text in texts], prices)
+    batch_seconds, batch_results = _time(normalize_prices, prices, "es")
+
+    if [(cents, currency) for cents, currency in scalar_results] != list(zip(*batch_results)):
+        print("Warning: scalar and batch conversion disagree")
+
+    print(f"{args.prices} prices")
+    print(f"{'scalar':<10}{scalar_seconds:>8.2f} s{args.prices / scalar_seconds:>14,.0f} prices/s")
+    print(f"{'batch':<10}{batch_seconds:>8.2f} s{args.prices / batch_seconds:>14,.0f} prices/s")
+    print(f"Speedup: {scalar_seconds / batch_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import argparse
+import gc
+import tracemalloc
+
+from product_record import ProductBatch, ProductRecord
+
+
+def _sample_products(count, distinct):
+    """
+    Builds product fields the way a crawl produces them: fresh strings for every product,
+    with the same `distinct` products showing up again across pages and queries.
+    """
+    for index in range(count):
+        product_id = index % distinct
+        yield (
+            "".join(["Portátil HP 15s-fq5000ns ", str(product_id), " 16GB RAM, 512GB SSD, Windows 11"]),
+            "".join(["https://m.media-amazon.com/images/I/", str(product_id), "L._AC_UY218_.jpg"]),
+            "".join([str(300 + product_id % 900), ",99€"]),
+            "".join(["B0", str(product_id).zfill(8)]),
+        )
+
+
+def _bytes_per_product(build, count, distinct):
+    """
+    Measures the memory retained by a container of products, per product.
+    """
+    gc.collect()
+    tracemalloc.start()
+    container = build(_sample_products(count, distinct))
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del container
+    return retained / count
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Memory retained per product by each product representation.")
+    arg_parser.add_argument("--products", type=int, default=200_000, help="Number of products (default: 200000).")
+    arg_parser.add_argument("--distinct", type=int, default=20_000,
+                            help="Number of distinct products among them (default: 20000).")
+    args = arg_parser.parse_args()
+
+    representations = {
+        "dict": lambda rows: [
+            {"name": name, "image": image, "price": price, "asin": asin} for name, image, price, asin in rows
+        ],
+        "ProductRecord": lambda rows: [ProductRecord(name, image, price, asin) for name, image, price, asin in rows],
+        "ProductBatch": lambda rows: ProductBatch(ProductRecord(name, image, price, asin) for name, image, price, asin in rows),
+    }
+
+    print(f"{args.products} products, {args.distinct} distinct")
+    for label, build in representations.items():
+        print(f"{label:<15}{_bytes_per_product(build, args.products, args.distinct):>10.0f} bytes/product")
+
+
+if __name__ == "__main__":
+    main()
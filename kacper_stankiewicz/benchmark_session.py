@@ -0,0 +1,84 @@
+import argparse
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from http_session import create_session
+
+
+class _SearchPageHandler(BaseHTTPRequestHandler):
+    """
+    Local stand-in for the Amazon search endpoint that serves a fixed page over keep-alive connections.
+    """
+
+    protocol_version = "HTTP/1.1"  # Required for the server to keep connections alive
+    disable_nagle_algorithm = True  # Headers and body are written separately
+    body = b"<html><body><div class='s-main-slot'></div></body></html>"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass  # Keep the benchmark output clean
+
+
+def _measure(fetch, url, requests_count):
+    """
+    Measures the latency of each request made with the given fetch function.
+
+    Parameters:
+        fetch (callable): Function performing a GET request for a URL.
+        url (str): URL to request.
+        requests_count (int): Number of requests to make.
+
+    Returns:
+        list: Latencies of the requests, in milliseconds.
+    """
+    latencies = []
+
+    for _ in range(requests_count):
+        start = time.perf_counter()
+        response = fetch(url, params={"k": "portatil"}, timeout=(5, 15))
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return latencies
+
+
+def _report(label, latencies):
+    """
+    Prints the mean, median and p95 latency of a run.
+    """
+    p95 = statistics.quantiles(latencies, n=20)[-1]
+    print(f"{label:<22} mean {statistics.mean(latencies):7.3f} ms | "
+          f"p50 {statistics.median(latencies):7.3f} ms | p95 {p95:7.3f} ms")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Per-request latency with and without connection reuse.")
+    arg_parser.add_argument("--requests", type=int, default=500, help="Number of requests per run (default: 500).")
+    args = arg_parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SearchPageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/s"
+
+    try:
+        _report("requests.get (no reuse)", _measure(requests.get, url, args.requests))
+
+        with create_session() as session:
+            _report("pooled session", _measure(session.get, url, args.requests))
+
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import argparse
+import time
+
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice, Qt
+from PyQt5.QtGui import QColor, QImage, QLinearGradient, QPainter
+
+from image_pipeline import load_thumbnail
+
+THUMBNAIL_SIZE = 200
+
+
+def _sample_jpeg(width, height):
+    """
+    Encodes a product-photo-like JPEG (gradient with a few shapes) of the given size.
+    """
+    image = QImage(width, height, QImage.Format_RGB32)
+    painter = QPainter(image)
+
+    gradient = QLinearGradient(0, 0, width, height)
+    gradient.setColorAt(0, QColor("#f0f0f0"))
+    gradient.setColorAt(1, QColor("#2a4d8f"))
+    painter.fillRect(image.rect(), gradient)
+    painter.setBrush(QColor("#d9822b"))
+    painter.drawEllipse(width // 4, height // 4, width // 2, height // 2)
+    painter.end()
+
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, "JPEG", 85)
+    return bytes(data)
+
+
+def _previous_pipeline(image_data, size):
+    """
+    The former per-product path: full decode, new canvas, smooth scaling and compositing.
+    """
+    white_canvas = QImage(size, size, QImage.Format_RGB32)
+    white_canvas.fill(Qt.white)
+
+    original_image = QImage.fromData(image_data)
+    scaled_image = original_image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    painter = QPainter(white_canvas)
+    painter.drawImage((size - scaled_image.width()) // 2, (size - scaled_image.height()) // 2, scaled_image)
+    painter.end()
+
+    return white_canvas
+
+
+def _ms_per_thumbnail(pipeline, image_data, repeat):
+    pipeline(image_data, THUMBNAIL_SIZE)  # Warm up: loads the image format plugins
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        pipeline(image_data, THUMBNAIL_SIZE)
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Milliseconds per 200x200 product thumbnail.")
+    arg_parser.add_argument("--repeat", type=int, default=50, help="Thumbnails decoded per case (default: 50).")
+    args = arg_parser.parse_args()
+
+    # Full-size product image (what the search page links by default at high density),
+    # the search results variant, and the variant requested through thumbnail_url()
+    cases = {
+        "full 1500x1500": _sample_jpeg(1500, 1500),
+        "search 320x320": _sample_jpeg(320, 320),
+        "UL200 200x200": _sample_jpeg(200, 200),
+    }
+
+    print(f"{'image':<18}{'bytes':>10}{'before ms':>12}{'after ms':>12}")
+    for label, image_data in cases.items():
+        before = _ms_per_thumbnail(_previous_pipeline, image_data, args.repeat)
+        after = _ms_per_thumbnail(load_thumbnail, image_data, args.repeat)
+        print(f"{label:<18}{len(image_data):>10}{before:>12.2f}{after:>12.2f}")
+
+    # End to end: the former path decoded the full image, the new one fetches the 200px variant
+    full_before = _ms_per_thumbnail(_previous_pipeline, cases["full 1500x1500"], args.repeat)
+    variant_after = _ms_per_thumbnail(load_thumbnail, cases["UL200 200x200"], args.repeat)
+    print(f"Full image, previous pipeline vs 200px variant, new pipeline: "
+          f"{full_before:.2f} ms -> {variant_after:.2f} ms ({full_before / variant_after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import os
+import threading
+
+
+def write_atomic(path, data):
+    """
+    Writes a cache file so that concurrent readers see either the old or the new content.
+
+    Parameters:
+        path (str): Path of the file to write.
+        data (bytes): Content of the file.
+
+    Raises:
+        OSError: If the file could not be written; no temporary file is left behind.
+    """
+    # Write to a temporary file first so concurrent readers never see a partial entry
+    temporary_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temporary_path, "wb") as output_file:
+            output_file.write(data)
+        os.replace(temporary_path, path)
+    except OSError:
+        remove_file(temporary_path)
+        raise
+
+
+def remove_file(path):
+    """
+    Removes a cache file, ignoring files that are already gone or cannot be removed.
+
+    Parameters:
+        path (str): Path of the file to remove.
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def evict_lru(directory, suffix, max_bytes, remove=remove_file):
+    """
+    Removes the least recently used cache entries until the directory fits in `max_bytes`.
+
+    Entries are the files ending in `suffix`; their modification time is the time of their
+    last use, so readers refresh it with `os.utime` on every hit.
+
+    Parameters:
+        directory (str): Folder of the cache.
+        suffix (str): File name suffix of the entries whose sizes are counted.
+        max_bytes (int): Maximum total size of the entries.
+        remove (callable): Called with the path of each evicted entry (default: `remove_file`).
+
+    Returns:
+        int: Number of entries evicted.
+    """
+    entries = []
+    total_size = 0
+
+    with os.scandir(directory) as directory_entries:
+        for directory_entry in directory_entries:
+            if directory_entry.name.endswith(suffix):
+                file_stat = directory_entry.stat()
+                entries.append((file_stat.st_mtime, file_stat.st_size, directory_entry.path))
+                total_size += file_stat.st_size
+
+    evicted = 0
+    for _, size, path in sorted(entries):
+        if total_size <= max_bytes:
+            break
+
+        remove(path)
+        total_size -= size
+        evicted += 1
+
+    return evicted
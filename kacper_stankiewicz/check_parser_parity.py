@@ -0,0 +1,38 @@
+import argparse
+import sys
+
+from corpus import FIXTURES_FOLDER, load_corpus
+from lxml_parser import LXML_AVAILABLE
+from web_scraper import WebScrapper
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Checks that every parser engine matches the reference engine.")
+    arg_parser.add_argument("--fixtures", default=FIXTURES_FOLDER, help="Folder with corpus.json and saved pages.")
+    args = arg_parser.parse_args()
+
+    engines = ["stream"] + (["lxml"] if LXML_AVAILABLE else [])
+    failures = 0
+
+    _, corpus = load_corpus(args.fixtures)
+
+    for file_name, profile, html_content in corpus:
+        for max_results in (1, 10, 1000):
+            expected = WebScrapper("soup", profile=profile).parse_products(html_content, max_results)
+
+            for engine in engines:
+                actual = WebScrapper(engine, profile=profile).parse_products(html_content, max_results)
+                if actual != expected:
+                    failures += 1
+                    print(f"MISMATCH {file_name} engine={engine} max_results={max_results}: "
+                          f"{len(actual)} products vs {len(expected)} expected")
+
+    if not LXML_AVAILABLE:
+        print("lxml is not installed; only the stream engine was checked.")
+
+    print("All engines match the reference output." if not failures else f"{failures} mismatch(es) found.")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
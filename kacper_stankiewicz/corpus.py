@@ -0,0 +1,25 @@
+import json
+import os
+
+FIXTURES_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def load_corpus(fixtures_folder=FIXTURES_FOLDER):
+    """
+    Loads the saved result pages listed in the corpus manifest of the fixtures folder.
+
+    Parameters:
+        fixtures_folder (str): Folder containing `corpus.json` and the saved pages.
+
+    Returns:
+        tuple: (corpus version, list of (file name, selector profile name, HTML content) tuples).
+    """
+    with open(os.path.join(fixtures_folder, "corpus.json"), encoding="utf-8") as manifest_file:
+        manifest = json.load(manifest_file)
+
+    pages = []
+    for page in manifest["pages"]:
+        with open(os.path.join(fixtures_folder, page["file"]), encoding="utf-8") as html_file:
+            pages.append((page["file"], page["profile"], html_file.read()))
+
+    return manifest["version"], pages
@@ -0,0 +1,201 @@
+import csv
+import importlib.util
+import json
+import os
+import threading
+import time
+
+from product_record import ProductRecord
+
+# pyarrow is only imported once a Parquet or Arrow file is opened: importing it costs
+# ~150 ms, which CSV/JSONL exports and headless startup should not pay
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+
+class ProductExportSink:
+    """
+    A streaming export stage that writes scraped products to disk in batches.
+
+    Products are buffered and written out every `batch_size` products or every
+    `flush_interval` seconds, whichever comes first, so memory stays bounded by one batch
+    whatever the size of the crawl. Each flush becomes one row group in Parquet, one record
+    batch in Arrow IPC, or a block of appended lines in CSV/JSONL.
+
+    Parquet and Arrow output require the optional 'pyarrow' package. CSV and JSONL files
+    are opened in append mode, so several runs can feed the same file; Parquet and Arrow
+    files are rewritten by every run.
+    """
+
+    FORMATS = ("jsonl", "csv", "parquet", "arrow")
+
+    # Columns written for every product: the query it was scraped for, then the record fields
+    COLUMNS = ("query",) + ProductRecord.FIELDS
+
+    def __init__(self, path, export_format=None, batch_size=1000, flush_interval=5.0):
+        """
+        Initializes the sink and opens the output file.
+
+        Parameters:
+            path (str): Output file.
+            export_format (str): One of FORMATS (default: taken from the file extension).
+            batch_size (int): Number of buffered products that triggers a flush (default: 1000).
+            flush_interval (float): Maximum seconds a product stays buffered (default: 5.0).
+        """
+        self.path = os.fspath(path)
+        self.export_format = export_format or self._format_from_extension(self.path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.rows_written = 0
+        self.batches_written = 0
+
+        if self.export_format not in self.FORMATS:
+            raise ValueError(f"Unknown export format: {self.export_format!r}. Expected one of {self.FORMATS}.")
+
+        if self.export_format in ("parquet", "arrow") and not PYARROW_AVAILABLE:
+            raise ImportError(f"The {self.export_format} export format requires the 'pyarrow' package.")
+
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._file = None
+        self._writer = None
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._open()
+
+    def write(self, product, query=""):
+        """
+        Buffers a product, flushing the buffer when it is full or old enough.
+
+        Parameters:
+            product (ProductRecord | dict): The product to export.
+            query (str): Search term the product was found for (optional).
+        """
+        if isinstance(product, dict):
+            product = ProductRecord.from_dict(product)
+
+        row = {"query": query}
+        row.update((field, getattr(product, field)) for field in ProductRecord.FIELDS)
+
+        with self._lock:
+            self._buffer.append(row)
+
+            if (len(self._buffer) >= self.batch_size
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._flush_buffer()
+
+    def write_many(self, products, query=""):
+        """
+        Buffers several products found for the same query.
+
+        Parameters:
+            products (iterable): Products to export.
+            query (str): Search term the products were found for (optional).
+        """
+        for product in products:
+            self.write(product, query)
+
+    def flush(self):
+        """
+        Writes all buffered products to disk.
+        """
+        with self._lock:
+            self._flush_buffer()
+
+    def close(self):
+        """
+        Flushes the remaining products and closes the output file.
+        """
+        with self._lock:
+            if self._file is None and self._writer is None:
+                return
+
+            self._flush_buffer()
+
+            if self._writer is not None and self.export_format in ("parquet", "arrow"):
+                self._writer.close()
+            if self._file is not None:
+                self._file.close()
+
+            self._file = None
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @classmethod
+    def _format_from_extension(cls, path):
+        extension = os.path.splitext(path)[1].lower().lstrip(".")
+        return {"ndjson": "jsonl", "pq": "parquet", "feather": "arrow", "ipc": "arrow"}.get(extension, extension)
+
+    # This helper method is intended for internal use within the class.
+    # It opens the output file and the writer of its format.
+    def _open(self):
+        if self.export_format == "jsonl":
+            self._file = open(self.path, "a", encoding="utf-8")
+
+        elif self.export_format == "csv":
+            write_header = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+            self._file = open(self.path, "a", encoding="utf-8", newline="")
+            self._writer = csv.DictWriter(self._file, fieldnames=self.COLUMNS)
+            if write_header:
+                self._writer.writeheader()
+
+        else:
+            import pyarrow as pa
+            import pyarrow.ipc as pa_ipc
+            import pyarrow.parquet as pa_parquet
+
+            self._pyarrow = pa
+            self._schema = pa.schema([
+                ("query", pa.string()),
+                ("name", pa.string()),
+                ("image", pa.string()),
+                ("price", pa.string()),
+                ("asin", pa.string()),
+                ("price_cents", pa.int64()),
+                ("currency", pa.string()),
+            ])
+
+            if self.export_format == "parquet":
+                self._writer = pa_parquet.ParquetWriter(self.path, self._schema, compression="zstd")
+            else:
+                self._file = pa.OSFile(self.path, "wb")
+                self._writer = pa_ipc.new_file(self._file, self._schema)
+
+    # This helper method is intended for internal use within the class.
+    # It writes the buffered rows as one batch. Must be called with the lock held.
+    def _flush_buffer(self):
+        self._last_flush = time.monotonic()
+
+        if not self._buffer:
+            return
+
+        rows, self._buffer = self._buffer, []
+
+        if self.export_format == "jsonl":
+            self._file.writelines(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+            self._file.flush()
+
+        elif self.export_format == "csv":
+            self._writer.writerows(rows)
+            self._file.flush()
+
+        else:
+            pa = self._pyarrow
+            columns = {column: [row[column] for row in rows] for column in self.COLUMNS}
+            batch = pa.RecordBatch.from_pydict(columns, schema=self._schema)
+
+            if self.export_format == "parquet":
+                self._writer.write_table(pa.Table.from_batches([batch]))
+            else:
+                self._writer.write_batch(batch)
+
+        self.rows_written += len(rows)
+        self.batches_written += 1
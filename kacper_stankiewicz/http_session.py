@@ -0,0 +1,65 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # urllib3 only decodes Brotli responses when one of these packages is installed
+    import brotli  # noqa: F401
+    BROTLI_SUPPORTED = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_SUPPORTED = True
+    except ImportError:
+        BROTLI_SUPPORTED = False
+
+
+# Status codes that are retried with backoff (Amazon answers 503 when it throttles clients).
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def accept_encoding():
+    """
+    Builds the Accept-Encoding header value for the compression formats this client can decode.
+
+    Returns:
+        str: The Accept-Encoding header value.
+    """
+    return "gzip, deflate, br" if BROTLI_SUPPORTED else "gzip, deflate"
+
+
+def create_session(pool_size=10, max_retries=3, backoff_factor=0.5, headers=None):
+    """
+    Creates a pooled HTTP session that keeps connections alive and retries throttled requests.
+
+    Parameters:
+        pool_size (int): Maximum number of connections kept alive per host (default: 10).
+        max_retries (int): Number of retries on connection errors and 5xx/429 responses (default: 3).
+        backoff_factor (float): Exponential backoff factor between retries, in seconds (default: 0.5).
+        headers (dict): Default headers sent with every request (optional).
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Accept-Encoding": accept_encoding(),
+        "Connection": "keep-alive",
+    })
+
+    if headers:
+        session.headers.update(headers)
+
+    return session
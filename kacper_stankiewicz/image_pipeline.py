@@ -0,0 +1,105 @@
+import re
+
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice, QSize, Qt
+from PyQt5.QtGui import QImage, QImageReader, QPainter
+
+
+# Amazon product image URL, with the optional block of size/format modifiers before the
+# extension (e.g. ".../images/I/71abc._AC_UY218_.jpg" or ".../images/I/71abc.jpg").
+AMAZON_IMAGE_PATTERN = re.compile(
+    r"^(?P<base>https?://[^/]*(?:media-amazon|ssl-images-amazon)\.com/images/I/[^./]+)"
+    r"(?:\.[^./]*_)?(?P<extension>\.[A-Za-z]+)$"
+)
+
+
+def thumbnail_url(url, size):
+    """
+    Rewrites an Amazon product image URL to request a variant whose longest side is `size`,
+    so the CDN sends a small thumbnail instead of the full-resolution image.
+
+    Parameters:
+        url (str): Image URL.
+        size (int): Longest side of the requested image, in pixels.
+
+    Returns:
+        str: The thumbnail URL, or `url` unchanged if it is not an Amazon product image.
+    """
+    match = AMAZON_IMAGE_PATTERN.match(url)
+    if not match:
+        return url
+    return f"{match.group('base')}._AC_UL{size}_{match.group('extension')}"
+
+
+def decode_scaled(image_data, width, height):
+    """
+    Decodes an image directly at the size it will be displayed, keeping its aspect ratio.
+
+    The decoder is told the target size up front, which lets the JPEG decoder skip most of
+    the work (DCT scaling) instead of decoding the full image and scaling it afterwards.
+
+    Parameters:
+        image_data (bytes): Encoded image (JPEG, PNG...).
+        width (int): Maximum width.
+        height (int): Maximum height.
+
+    Returns:
+        QImage: The decoded image, or None if the data could not be decoded.
+    """
+    buffer = QBuffer()
+    buffer.setData(QByteArray(image_data))
+    buffer.open(QIODevice.ReadOnly)
+
+    reader = QImageReader(buffer)
+    original_size = reader.size()
+
+    if original_size.isValid() and (original_size.width() > width or original_size.height() > height):
+        reader.setScaledSize(original_size.scaled(QSize(width, height), Qt.KeepAspectRatio))
+
+    image = reader.read()
+    return None if image.isNull() else image
+
+
+def compose_on_canvas(image, width, height):
+    """
+    Centers an image on a new white canvas of a fixed size.
+
+    An image that already has the canvas size is only converted, without painting.
+
+    Parameters:
+        image (QImage): Image no larger than the canvas.
+        width (int): Width of the canvas.
+        height (int): Height of the canvas.
+
+    Returns:
+        QImage: The composed image.
+    """
+    if image.width() == width and image.height() == height:
+        return image.convertToFormat(QImage.Format_RGB32)
+
+    canvas = QImage(width, height, QImage.Format_RGB32)
+    canvas.fill(Qt.white)
+
+    painter = QPainter(canvas)
+    painter.drawImage((width - image.width()) // 2, (height - image.height()) // 2, image)
+    painter.end()
+
+    return canvas
+
+
+def load_thumbnail(image_data, size):
+    """
+    Decodes an image straight to thumbnail size and centers it on a square white canvas.
+
+    Safe to call from worker threads (it only uses QImage, never QPixmap).
+
+    Parameters:
+        image_data (bytes): Encoded image (JPEG, PNG...).
+        size (int): Side of the square canvas.
+
+    Returns:
+        QImage: The thumbnail, or None if the data could not be decoded.
+    """
+    image = decode_scaled(image_data, size, size)
+    if image is None:
+        return None
+    return compose_on_canvas(image, size, size)
@@ -0,0 +1,95 @@
+from product_record import ProductRecord
+from stream_parser import escape_attribute
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    etree = None
+    lxml_html = None
+    LXML_AVAILABLE = False
+
+
+def _has_class(class_name):
+    """
+    Builds the XPath condition equivalent to the CSS class selector `.class_name`.
+    """
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+class LxmlProductParser:
+    """
+    A C-accelerated product parser built on lxml (libxml2).
+
+    The XPath expressions are the equivalents of the CSS selectors of the selector profile
+    (".s-main-slot .s-result-item" and ".a-price" by default) and are compiled once.
+    """
+
+    def __init__(self, profile, is_valid_product):
+        """
+        Initializes the parser and compiles its XPath expressions.
+
+        Parameters:
+            profile (SelectorProfile): Selector profile describing the page layout.
+            is_valid_product (callable): Validation function taking (name, image, price).
+        """
+        if not LXML_AVAILABLE:
+            raise ImportError("The lxml parser engine requires the 'lxml' package.")
+
+        self.profile = profile
+        self.is_valid_product = is_valid_product
+
+        self._results_xpath = etree.XPath(
+            f"//*[{_has_class(profile.container_class)}]//*[{_has_class(profile.result_class)}]"
+        )
+        self._image_xpath = etree.XPath("(.//img)[1]")
+        self._price_xpath = etree.XPath(f"(.//*[{_has_class(profile.price_class)}])[1]")
+
+    def parse(self, html_content, max_results=10):
+        """
+        Parses the HTML content to extract product details.
+
+        Parameters:
+            html_content (str): HTML content of the search results page.
+            max_results (int): Maximum number of products to extract.
+
+        Returns:
+            list: A list of ProductRecord objects.
+        """
+        try:
+            document = lxml_html.document_fromstring(html_content)
+            product_elements = self._results_xpath(document)
+
+        except Exception as e:
+            print(f"Error while parsing product elements: {e}")
+            return []
+
+        products = []
+
+        for product_element in product_elements:
+            try:
+                images = self._image_xpath(product_element)
+                prices = self._price_xpath(product_element)
+
+                # Attribute values are escaped the way BeautifulSoup serializes them,
+                # so the output is identical to the reference engine
+                product_image = escape_attribute(images[0].get("src", "")) if images else ""
+                product_name = escape_attribute(images[0].get("alt", "")) if images else ""
+                product_price = self.profile.format_price(prices[0].text_content() if prices else None)
+
+                # Validate and add product to the list
+                if self.is_valid_product(product_name, product_image, product_price):
+                    products.append(ProductRecord(
+                        product_name, product_image, product_price, product_element.get("data-asin", ""),
+                    ))
+
+                # Stop collecting after reaching the max results limit
+                if len(products) >= max_results:
+                    break
+
+            except Exception as e:
+                print(f"Error processing product: {e}")
+                continue
+
+        return products
@@ -0,0 +1,184 @@
+import importlib.util
+
+# tesserocr binds the Tesseract library directly; it is optional and pytesseract is used without it
+TESSEROCR_AVAILABLE = importlib.util.find_spec("tesserocr") is not None
+
+BACKENDS = ("auto", "tesserocr", "pytesseract")
+
+# Columns of Tesseract's TSV output, as returned by `image_to_data`
+TSV_COLUMNS = ("level", "page_num", "block_num", "par_num", "line_num", "word_num",
+               "left", "top", "width", "height", "conf", "text")
+
+
+class PytesseractBackend:
+    """
+    OCR through pytesseract, which runs the `tesseract` command for every image: each call
+    starts a process, writes the image to a temporary file and loads the language data again.
+    """
+
+    name = "pytesseract"
+
+    def __init__(self, language=None):
+        """
+        Initializes the backend.
+
+        Parameters:
+            language (str): Tesseract language code, e.g. "spa" (default: Tesseract's default, "eng").
+        """
+        import pytesseract
+
+        self._pytesseract = pytesseract
+        self.language = language
+
+    def image_to_data(self, image):
+        """
+        Recognizes the words of an image with their bounding boxes.
+
+        Parameters:
+            image (PIL.Image.Image): The image.
+
+        Returns:
+            dict: One list per TSV column (see `TSV_COLUMNS`), one entry per layout element.
+        """
+        return self._pytesseract.image_to_data(image, lang=self.language, output_type=self._pytesseract.Output.DICT)
+
+    def image_to_string(self, image):
+        """
+        Recognizes the text of an image.
+
+        Parameters:
+            image (PIL.Image.Image): The image.
+
+        Returns:
+            str: The recognized text.
+        """
+        return self._pytesseract.image_to_string(image, lang=self.language)
+
+    def close(self):
+        """
+        Releases the backend (nothing to release: no engine is kept between calls).
+        """
+
+
+class TesserocrBackend:
+    """
+    OCR through tesserocr, which keeps one Tesseract engine loaded in the process and reuses
+    it for every image: no process start, temporary file or model load per call.
+
+    An instance must not be used from several threads at the same time.
+    """
+
+    name = "tesserocr"
+
+    def __init__(self, language=None, tessdata_path=None):
+        """
+        Loads the Tesseract engine.
+
+        Parameters:
+            language (str): Tesseract language code, e.g. "spa" (default: "eng").
+            tessdata_path (str): Folder containing the language data (default: tesserocr's).
+
+        Raises:
+            ImportError: If tesserocr is not installed.
+            RuntimeError: If the engine could not be initialized (e.g. missing language data).
+        """
+        import tesserocr
+
+        options = {"lang": language or "eng"}
+        if tessdata_path:
+            options["path"] = tessdata_path
+
+        self.language = options["lang"]
+        self._api = tesserocr.PyTessBaseAPI(**options)
+
+    def image_to_data(self, image):
+        """
+        Recognizes the words of an image with their bounding boxes.
+
+        Parameters:
+            image (PIL.Image.Image): The image.
+
+        Returns:
+            dict: One list per TSV column (see `TSV_COLUMNS`), in the same format as pytesseract.
+        """
+        self._set_image(image)
+        return parse_tsv(self._api.GetTSVText(0))
+
+    def image_to_string(self, image):
+        """
+        Recognizes the text of an image.
+
+        Parameters:
+            image (PIL.Image.Image): The image.
+
+        Returns:
+            str: The recognized text.
+        """
+        self._set_image(image)
+        return self._api.GetUTF8Text()
+
+    def close(self):
+        """
+        Unloads the Tesseract engine.
+        """
+        self._api.End()
+
+    # This helper method is intended for internal use within the class.
+    def _set_image(self, image):
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")  # Drop the alpha channel of screenshots
+        self._api.SetImage(image)
+
+
+def parse_tsv(tsv_text):
+    """
+    Converts Tesseract's TSV output (without header) to the dict returned by pytesseract.
+
+    Parameters:
+        tsv_text (str): One tab-separated row per layout element.
+
+    Returns:
+        dict: One list per TSV column (see `TSV_COLUMNS`).
+    """
+    data = {column: [] for column in TSV_COLUMNS}
+
+    for row in tsv_text.splitlines():
+        values = row.split("\t")
+        if len(values) < len(TSV_COLUMNS) - 1:
+            continue
+        values += [""] * (len(TSV_COLUMNS) - len(values))  # Layout rows have no text column
+
+        for column, value in zip(TSV_COLUMNS, values):
+            if column == "text":
+                data[column].append(value)
+            elif column == "conf":
+                data[column].append(float(value))
+            else:
+                data[column].append(int(value))
+
+    return data
+
+
+def create_ocr_backend(name="auto", language=None):
+    """
+    Creates an OCR backend.
+
+    Parameters:
+        name (str): "tesserocr", "pytesseract", or "auto" for tesserocr when it is installed
+                    and pytesseract otherwise (default: "auto").
+        language (str): Tesseract language code (default: Tesseract's default, "eng").
+
+    Returns:
+        PytesseractBackend or TesserocrBackend: The backend. If tesserocr was requested but
+        cannot be loaded, the pytesseract backend is returned instead.
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown OCR backend: {name!r}. Expected one of {BACKENDS}.")
+
+    if name == "tesserocr" or (name == "auto" and TESSEROCR_AVAILABLE):
+        try:
+            return TesserocrBackend(language)
+        except (ImportError, RuntimeError) as e:
+            print(f"tesserocr unavailable, falling back to pytesseract: {e}")
+
+    return PytesseractBackend(language)
@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+import threading
+
+from PIL import Image
+
+from cache_files import evict_lru, remove_file, write_atomic
+
+# Side in pixels of the cells an image is reduced to before hashing, and the grey level
+# difference between two neighbouring cells below which they count as equal
+CELL_SIZE = 4
+GRADIENT_TOLERANCE = 8
+
+
+def image_hash(image, cell_size=CELL_SIZE, tolerance=GRADIENT_TOLERANCE):
+    """
+    Computes a difference hash (dHash) of an image: the image is reduced to a grid of
+    `cell_size` pixel cells and each cell is compared with its right neighbour.
+
+    Unlike the usual 8x8 dHash, the grid follows the size of the image: OCR crops must
+    not collide when they differ by a single character (e.g. two prices). Comparisons
+    within `tolerance` count as equal, so small rendering differences (anti-aliasing,
+    colour shifts) usually leave the hash unchanged. Hashes are matched exactly, never by
+    distance: noise flips about as many cells as a changed digit, and a cache miss is
+    cheaper than a wrong price.
+
+    Parameters:
+        image (PIL.Image.Image): The image.
+        cell_size (int): Side of a grid cell, in pixels (default: 4).
+        tolerance (int): Grey level difference treated as no change (default: 8).
+
+    Returns:
+        str: Hex digest of the gradient signs and the image size.
+    """
+    columns = max(image.width // cell_size, 1)
+    rows = max(image.height // cell_size, 1)
+    grid = image.convert("L").resize((columns + 1, rows), Image.BOX).tobytes()
+
+    signs = bytearray()
+    for row_start in range(0, len(grid), columns + 1):
+        row = grid[row_start:row_start + columns + 1]
+        signs.extend(
+            1 if left - right > tolerance else 2 if right - left > tolerance else 0
+            for left, right in zip(row, row[1:])
+        )
+
+    digest = hashlib.sha256(f"{image.width}x{image.height}|".encode("utf-8"))
+    digest.update(signs)
+    return digest.hexdigest()
+
+
+class OCRCache:
+    """
+    A persistent on-disk cache of OCR results, keyed by a perceptual hash of the image
+    together with the OCR engine, language and call, so a crop that looks the same as one
+    recognized before (same product card, same search) skips OCR entirely.
+
+    Results are stored as JSON files. The cache is capped in size and evicts the least
+    recently used entries first. Hit and miss counters show how effective it is on
+    repeated runs.
+    """
+
+    def __init__(self, directory=".cache/ocr", max_bytes=20 * 1024 * 1024):
+        """
+        Initializes the cache and creates its directory if needed.
+
+        Parameters:
+            directory (str): Folder where OCR results are stored (default: ".cache/ocr").
+            max_bytes (int): Maximum total size of the stored results (default: 20 MB).
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(image, *context):
+        """
+        Builds the cache key of an OCR call.
+
+        Parameters:
+            image (PIL.Image.Image): The image to recognize.
+            *context: Anything else the result depends on (engine, language, call, version...).
+
+        Returns:
+            str: Hex digest identifying the call.
+        """
+        canonical = json.dumps([image_hash(image)] + [str(value) for value in context])
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """
+        Looks up a cached OCR result.
+
+        Parameters:
+            key (str): Cache key of the call.
+
+        Returns:
+            The stored result, or None if the call is not cached.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as entry_file:
+                result = json.loads(entry_file.read())
+            os.utime(path)  # The mtime tracks the last access, which drives LRU eviction
+        except (OSError, ValueError):
+            result = None
+
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return result
+
+    def put(self, key, result):
+        """
+        Stores an OCR result and evicts old entries if the cache grew too large.
+        Write errors (e.g. a full disk) are reported and the result is simply not cached.
+
+        Parameters:
+            key (str): Cache key of the call.
+            result: JSON-serializable OCR result (text or image_to_data dict).
+        """
+        try:
+            write_atomic(self._path(key), json.dumps(result).encode("utf-8"))
+            self._evict()
+        except OSError as e:
+            # A full disk or read-only cache folder must not lose text that was already recognized
+            print(f"Failed to write OCR result to cache: {e}")
+
+    def stats(self):
+        """
+        Returns the hit/miss/eviction counters of the cache.
+
+        Returns:
+            dict: Counters and the share of lookups answered without running OCR.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        """
+        Removes every entry from the cache.
+        """
+        for file_name in os.listdir(self.directory):
+            if file_name.endswith(".json"):
+                remove_file(os.path.join(self.directory, file_name))
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _evict(self):
+        """
+        Removes the least recently used entries until the cache fits in `max_bytes`.
+        """
+        evicted = evict_lru(self.directory, ".json", self.max_bytes)
+
+        with self._lock:
+            self.evictions += evicted
+
@@ -0,0 +1,166 @@
+import re
+
+
+# Decimal and thousands separators used to display prices in each locale.
+LOCALES = {
+    "es": {"decimal": ",", "thousands": "."},
+    "de": {"decimal": ",", "thousands": "."},
+    "it": {"decimal": ",", "thousands": "."},
+    "fr": {"decimal": ",", "thousands": " "},
+    "en": {"decimal": ".", "thousands": ","},
+}
+
+# Currency symbols and ISO codes, mapped to the ISO code returned by the normalizer.
+CURRENCIES = {"€": "EUR", "£": "GBP", "$": "USD", "EUR": "EUR", "GBP": "GBP", "USD": "USD"}
+CURRENCY_SYMBOLS = {"EUR": "€", "GBP": "£", "USD": "$"}
+
+# A price number: digits with optional separators (dots, commas, spaces) between them.
+PRICE_NUMBER_PATTERN = re.compile(r"\d(?:[\d.,\s]*\d)?")
+CURRENCY_PATTERN = re.compile(r"€|£|\$|\b(?:EUR|GBP|USD)\b")
+SPACES = " \u00a0\u202f"  # Regular, no-break and narrow no-break spaces
+
+# Value used in batch results for texts that hold no price.
+MISSING_CENTS = -1
+
+
+def _split_number(number, locale):
+    """
+    Splits a price number into its whole and fractional digits.
+
+    With a known locale the locale's decimal separator is used. Without one, the last
+    separator is taken as the decimal separator only when it is followed by one or two
+    digits, so "1.299" and "1,299" are read as thousands and "12,99" / "12.99" as decimals.
+    """
+    if locale:
+        whole, separator, fraction = number.rpartition(LOCALES[locale]["decimal"])
+        return (whole, fraction) if separator else (number, "")
+
+    last_separator = max(number.rfind("."), number.rfind(","))
+    if last_separator != -1 and len(number) - last_separator - 1 in (1, 2):
+        return number[:last_separator], number[last_separator + 1:]
+
+    return number, ""
+
+
+def normalize_price(text, locale=None):
+    """
+    Converts a displayed price into integer cents and a currency code.
+
+    Parameters:
+        text (str): Price as displayed (e.g. "1.299,99 €", "£1,299.99", "12,99€").
+        locale (str): Locale of the text, one of LOCALES (default: guessed from the separators).
+
+    Returns:
+        tuple: (cents, currency). Cents is None if the text holds no price; currency is the
+               ISO code of the symbol found in the text, or None.
+    """
+    text = text or ""
+    currency_match = CURRENCY_PATTERN.search(text)
+    currency = CURRENCIES[currency_match.group()] if currency_match else None
+
+    number_match = PRICE_NUMBER_PATTERN.search(text)
+    if not number_match:
+        return None, currency
+
+    whole, fraction = _split_number(number_match.group(), locale)
+    whole_digits = "".join(character for character in whole if character.isdigit())
+
+    if not whole_digits or (fraction and not fraction.isdigit()):
+        return None, currency
+
+    return int(whole_digits) * 100 + int((fraction + "00")[:2]), currency
+
+
+def format_cents(cents, locale="es", currency="EUR"):
+    """
+    Formats integer cents as a displayed price, with the currency symbol at the end.
+
+    Parameters:
+        cents (int): Price in cents.
+        locale (str): Locale whose separators are used (default: "es").
+        currency (str): ISO code of the currency (default: "EUR").
+
+    Returns:
+        str: The displayed price (e.g. "1.299,99€"), or an empty string if cents is None.
+    """
+    if cents is None:
+        return ""
+
+    separators = LOCALES[locale]
+    whole = f"{cents // 100:,}".replace(",", separators["thousands"])
+    return f"{whole}{separators['decimal']}{cents % 100:02d}{CURRENCY_SYMBOLS.get(currency, currency or '')}"
+
+
+def normalize_prices(texts, locale="es"):
+    """
+    Converts a whole column of displayed prices at once.
+
+    With NumPy installed the column is converted with vectorized string operations; texts
+    the vectorized path cannot read (e.g. with surrounding words) are converted one by one.
+    Without NumPy every text is converted with `normalize_price`.
+
+    Parameters:
+        texts (sequence): Displayed prices.
+        locale (str): Locale of the texts, one of LOCALES (default: "es").
+
+    Returns:
+        tuple: (cents, currencies). With NumPy, an int64 array using MISSING_CENTS for texts
+               without a price and an array of currency codes ("" if unknown); without NumPy,
+               two lists using None for missing values.
+    """
+    # NumPy is imported on first use only: it costs ~100 ms of startup that the
+    # single-price path (used while scraping) does not need
+    try:
+        import numpy as np
+    except ImportError:
+        np = None  # Batch conversion falls back to converting one price at a time
+
+    if np is None:
+        results = [normalize_price(text, locale) for text in texts]
+        return [cents for cents, _ in results], [currency for _, currency in results]
+
+    column = np.asarray(texts, dtype=str)
+    separators = LOCALES[locale]
+
+    # Currency codes, detected from the symbols present in each text. Substring search cannot
+    # tell "EUR" from "EURO" or "USD12", nor which of two symbols comes first, so texts holding
+    # a letter code or several symbols are matched with the scalar parser's regex instead
+    currencies = np.full(column.shape, "", dtype="<U3")
+    symbol_counts = np.zeros(column.shape, dtype=np.int64)
+    needs_pattern = np.zeros(column.shape, dtype=bool)
+    for symbol, code in CURRENCIES.items():
+        present = np.char.find(column, symbol) >= 0
+        currencies[present] = code
+        symbol_counts += present
+        if symbol.isalpha():
+            needs_pattern |= present
+
+    for index in np.flatnonzero(needs_pattern | (symbol_counts > 1)):
+        currency_match = CURRENCY_PATTERN.search(column[index])
+        currencies[index] = CURRENCIES[currency_match.group()] if currency_match else ""
+
+    # Keep only the number, then split it at its last decimal separator like `normalize_price`
+    numbers = np.char.strip(column, "".join(CURRENCY_SYMBOLS.values()) + "EURGBPUSD" + SPACES)
+    parts = np.char.rpartition(numbers, separators["decimal"])
+    has_decimal = parts[..., 1] != ""
+    whole = np.where(has_decimal, parts[..., 0], parts[..., 2])
+    fraction = np.where(has_decimal, parts[..., 2], "")
+
+    # Drop thousands separators and spaces from the whole part only: a fraction holding anything
+    # but digits (e.g. another locale's separators) is rejected, as by the scalar parser
+    for character in {separators["thousands"], *SPACES}:
+        whole = np.char.replace(whole, character, "")
+
+    valid = np.char.isdigit(whole) & (np.char.isdigit(fraction) | (fraction == ""))
+    fraction = np.char.ljust(fraction, 2, "0").astype("<U2")  # Pads "9" to "90", truncates to cents
+
+    cents = np.full(column.shape, MISSING_CENTS, dtype=np.int64)
+    cents[valid] = whole[valid].astype(np.int64) * 100 + fraction[valid].astype(np.int64)
+
+    # Fall back to the scalar parser for the rows the vectorized path could not read
+    for index in np.flatnonzero(~valid):
+        row_cents, _ = normalize_price(column[index], locale)
+        if row_cents is not None:
+            cents[index] = row_cents
+
+    return cents, currencies
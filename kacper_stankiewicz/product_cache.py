@@ -0,0 +1,165 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from cache_files import evict_lru, write_atomic
+from product_record import ProductRecord
+
+
+class ParsedProductCache:
+    """
+    A memoization layer for `WebScrapper.parse_products`.
+
+    Parsed product lists are keyed by a hash of the HTML content together with the parser
+    version, engine and `max_results`, so re-parsing an identical page becomes a lookup.
+    An in-memory LRU sits in front of an optional on-disk store of gzip-compressed JSON files,
+    which is capped in size and evicts its least recently used entries first.
+    Products are stored as plain dictionaries and returned as fresh `ProductRecord` objects,
+    so callers can never mutate a cached entry.
+    """
+
+    def __init__(self, directory=None, max_entries=256, max_bytes=50 * 1024 * 1024):
+        """
+        Initializes the cache.
+
+        Parameters:
+            directory (str): Folder for the on-disk store (default: memory only).
+            max_entries (int): Maximum number of product lists kept in memory (default: 256).
+            max_bytes (int): Maximum total size of the on-disk store (default: 50 MB).
+        """
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(html_content, parser_version, parser_engine, max_results, profile_name):
+        """
+        Builds the cache key of a parse.
+
+        Parameters:
+            html_content (str): HTML content of the search results page.
+            parser_version (int): Version of the parsing logic; bumping it invalidates old entries.
+            parser_engine (str): Engine used to parse the page.
+            max_results (int): Maximum number of products extracted.
+            profile_name (str): Selector profile used, which sets price formatting and sponsored filtering.
+
+        Returns:
+            str: Hex digest identifying the parse.
+        """
+        digest = hashlib.sha256(html_content.encode("utf-8"))
+        digest.update(f"|{parser_version}|{parser_engine}|{max_results}|{profile_name}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Looks up a parsed product list.
+
+        Parameters:
+            key (str): Cache key of the parse.
+
+        Returns:
+            list: A copy of the cached ProductRecord objects, or None if the page was not parsed before.
+        """
+        with self._lock:
+            products = self._entries.get(key)
+            if products is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return [ProductRecord.from_dict(product) for product in products]
+
+        products = self._read_from_disk(key)
+
+        with self._lock:
+            if products is None:
+                self.misses += 1
+                return None
+
+            self.disk_hits += 1
+            self._remember(key, products)
+
+        return [ProductRecord.from_dict(product) for product in products]
+
+    def put(self, key, products):
+        """
+        Stores a parsed product list.
+
+        Parameters:
+            key (str): Cache key of the parse.
+            products (list): The parsed ProductRecord objects.
+        """
+        products = [product.to_dict() for product in products]
+
+        with self._lock:
+            self._remember(key, products)
+
+        self._write_to_disk(key, products)
+
+    def stats(self):
+        """
+        Returns the hit/miss/eviction counters of the cache.
+
+        Returns:
+            dict: Memory hits, disk hits, misses, on-disk evictions and the overall hit rate.
+        """
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+    def _remember(self, key, products):
+        # Must be called with the lock held
+        self._entries[key] = products
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json.gz")
+
+    def _read_from_disk(self, key):
+        if not self.directory:
+            return None
+
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as cache_file:
+                products = json.load(cache_file)
+            os.utime(path)  # The mtime tracks the last access, which drives LRU eviction
+        except (OSError, ValueError, EOFError):
+            return None
+
+        return products
+
+    def _write_to_disk(self, key, products):
+        if not self.directory:
+            return
+
+        data = gzip.compress(json.dumps(products, ensure_ascii=False).encode("utf-8"))
+
+        try:
+            write_atomic(self._path(key), data)
+            evicted = evict_lru(self.directory, ".json.gz", self.max_bytes)
+        except OSError as e:
+            print(f"Failed to write parsed products to cache: {e}")
+            return
+
+        with self._lock:
+            self.evictions += evicted
@@ -0,0 +1,149 @@
+import sys
+from array import array
+
+from price_normalizer import normalize_price
+
+
+class ProductRecord:
+    """
+    A compact record of a scraped product.
+
+    Uses `__slots__` instead of a per-instance dict, which keeps the memory cost per product
+    low when millions of products are held in memory. The price is kept both as displayed
+    and as an integer number of cents with its currency code. Mapping-style access (`record["name"]`,
+    `record.get("price")`) is supported for code written against the former product dicts.
+    """
+
+    __slots__ = ("name", "image", "price", "asin", "price_cents", "currency")
+
+    FIELDS = __slots__
+
+    def __init__(self, name, image, price, asin="", price_cents=None, currency=None):
+        """
+        Initializes the record.
+
+        Parameters:
+            name (str): Product name.
+            image (str): Image URL (or local path for products captured with RPA).
+            price (str): Price as displayed, with the currency symbol.
+            asin (str): Amazon product identifier (optional).
+            price_cents (int): Price in cents (default: parsed from `price`).
+            currency (str): ISO code of the price currency (default: detected in `price`).
+        """
+        self.name = name
+        self.image = image
+        self.price = price
+        self.asin = asin
+        self.price_cents = price_cents
+        self.currency = currency
+
+        if price_cents is None or currency is None:
+            parsed_cents, parsed_currency = normalize_price(price)
+            self.price_cents = parsed_cents if price_cents is None else price_cents
+            self.currency = parsed_currency if currency is None else currency
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Creates a record from a product dictionary.
+
+        Parameters:
+            data (dict): Product details with at least name, image and price.
+
+        Returns:
+            ProductRecord: The new record.
+        """
+        return cls(data["name"], data["image"], data["price"], data.get("asin", ""),
+                   data.get("price_cents"), data.get("currency"))
+
+    def to_dict(self):
+        """
+        Converts the record into a product dictionary.
+
+        Returns:
+            dict: Product details.
+        """
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def copy(self):
+        return ProductRecord(self.name, self.image, self.price, self.asin, self.price_cents, self.currency)
+
+    def get(self, field, default=None):
+        value = getattr(self, field, None) if field in self.FIELDS else None
+        return default if value is None else value
+
+    def __getitem__(self, field):
+        if field not in self.FIELDS:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __eq__(self, other):
+        if not isinstance(other, ProductRecord):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.FIELDS)
+
+    def __repr__(self):
+        return f"ProductRecord(name={self.name!r}, price={self.price!r}, asin={self.asin!r})"
+
+
+class ProductBatch:
+    """
+    A columnar container for large numbers of products.
+
+    Prices in cents are stored in a typed array (8 bytes per product), and names, image URLs,
+    ASINs, displayed prices and currency codes are interned so repeated values (the same product seen across
+    pages and queries) are stored once.
+    """
+
+    # Value stored in the price column for products without a numeric price
+    MISSING_PRICE = -1
+
+    def __init__(self, products=()):
+        """
+        Initializes the batch.
+
+        Parameters:
+            products (iterable): Records (or product dictionaries) to add (optional).
+        """
+        self.names = []
+        self.images = []
+        self.prices = []
+        self.asins = []
+        self.price_cents = array("q")
+        self.currencies = []
+        self.extend(products)
+
+    def append(self, product):
+        """
+        Adds a product to the batch.
+
+        Parameters:
+            product (ProductRecord | dict): The product to add.
+        """
+        if isinstance(product, dict):
+            product = ProductRecord.from_dict(product)
+
+        self.names.append(sys.intern(product.name))
+        self.images.append(sys.intern(product.image))
+        self.prices.append(sys.intern(product.price))
+        self.asins.append(sys.intern(product.asin))
+        self.price_cents.append(self.MISSING_PRICE if product.price_cents is None else product.price_cents)
+        self.currencies.append(sys.intern(product.currency or ""))
+
+    def extend(self, products):
+        for product in products:
+            self.append(product)
+
+    def __len__(self):
+        return len(self.price_cents)
+
+    def __getitem__(self, index):
+        price_cents = self.price_cents[index]
+        return ProductRecord(
+            self.names[index], self.images[index], self.prices[index], self.asins[index],
+            None if price_cents == self.MISSING_PRICE else price_cents, self.currencies[index] or None,
+        )
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
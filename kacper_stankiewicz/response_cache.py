@@ -0,0 +1,220 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+
+from cache_files import evict_lru, remove_file, write_atomic
+
+
+class ResponseCache:
+    """
+    A persistent, content-addressed on-disk cache for search results pages.
+
+    Entries are keyed by URL, query parameters and Accept-Language, stored zlib-compressed
+    and expire after a TTL. Expired entries that carry an ETag or Last-Modified header are
+    revalidated with a conditional request instead of being downloaded again. The cache is
+    capped in size and evicts the least recently used entries first.
+    """
+
+    def __init__(self, directory=".cache/responses", ttl=600, max_bytes=100 * 1024 * 1024, compression_level=6):
+        """
+        Initializes the cache and creates its directory if needed.
+
+        Parameters:
+            directory (str): Folder where cached pages are stored (default: ".cache/responses").
+            ttl (float): Seconds an entry is served without revalidation (default: 600).
+            max_bytes (int): Maximum total size of the compressed entries (default: 100 MB).
+            compression_level (int): zlib compression level, from 1 (fast) to 9 (small) (default: 6).
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(url, params, accept_language):
+        """
+        Builds the cache key of a request.
+
+        Parameters:
+            url (str): Requested URL.
+            params (dict): Query parameters of the request.
+            accept_language (str): Accept-Language header of the request.
+
+        Returns:
+            str: Hex digest identifying the request.
+        """
+        canonical = json.dumps([url, sorted((params or {}).items()), accept_language or ""], default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def lookup(self, key):
+        """
+        Looks up a cached page.
+
+        Parameters:
+            key (str): Cache key of the request.
+
+        Returns:
+            tuple: (entry, is_fresh). The entry is a dict with the metadata and the "body" of the
+                   page, or None if the request is not cached.
+        """
+        metadata = self._read_metadata(key)
+        if metadata is None:
+            return None, False
+
+        try:
+            with open(self._body_path(key), "rb") as body_file:
+                body = zlib.decompress(body_file.read()).decode("utf-8")
+        except (OSError, zlib.error, UnicodeDecodeError):
+            self._remove(key)
+            return None, False
+
+        self._touch(key)
+        entry = dict(metadata, body=body)
+        is_fresh = time.time() - metadata["stored_at"] < self.ttl
+
+        if is_fresh:
+            with self._lock:
+                self.hits += 1
+
+        return entry, is_fresh
+
+    @staticmethod
+    def conditional_headers(entry):
+        """
+        Builds the headers used to revalidate an expired entry.
+
+        Parameters:
+            entry (dict): Cached entry returned by `lookup`.
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since headers (empty if the entry has no validators).
+        """
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def refresh(self, key, entry):
+        """
+        Marks an expired entry as fresh again after the server answered 304 Not Modified.
+
+        Parameters:
+            key (str): Cache key of the request.
+            entry (dict): Cached entry returned by `lookup`.
+        """
+        metadata = {name: value for name, value in entry.items() if name != "body"}
+        metadata["stored_at"] = time.time()
+        try:
+            write_atomic(self._metadata_path(key), json.dumps(metadata).encode("utf-8"))
+        except OSError as e:
+            print(f"Failed to refresh cached page: {e}")  # The page is still served, only not marked fresh
+
+        with self._lock:
+            self.revalidations += 1
+
+    def store(self, key, response, body=None):
+        """
+        Stores a downloaded response (a cache miss) and evicts old entries if the cache grew too large.
+        Write errors (e.g. a full disk) are reported and the response is simply not cached.
+
+        Parameters:
+            key (str): Cache key of the request.
+            response (requests.Response): The response to store.
+            body (str): Decoded page, for streamed responses whose content was already consumed
+                        (default: `response.text`).
+        """
+        body = zlib.compress((response.text if body is None else body).encode("utf-8"), self.compression_level)
+        metadata = {
+            "url": response.url,
+            "stored_at": time.time(),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "size": len(body),
+        }
+
+        try:
+            write_atomic(self._body_path(key), body)
+            write_atomic(self._metadata_path(key), json.dumps(metadata).encode("utf-8"))
+            self._evict()
+        except OSError as e:
+            # A full disk or unusable cache folder must not fail the request: the page is just not cached
+            print(f"Failed to write page to cache: {e}")
+            self._remove(key)
+
+        with self._lock:
+            self.misses += 1
+
+    def stats(self):
+        """
+        Returns the hit/miss/eviction counters of the cache.
+
+        Hits are fresh entries served without a request, revalidations are expired entries
+        confirmed by a 304 response, and misses are pages downloaded in full.
+
+        Returns:
+            dict: Counters and the share of pages served without a full download.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses + self.revalidations
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits + self.revalidations) / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        """
+        Removes every entry from the cache.
+        """
+        for file_name in os.listdir(self.directory):
+            if file_name.endswith((".json", ".zz")):
+                remove_file(os.path.join(self.directory, file_name))
+
+    def _metadata_path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _body_path(self, key):
+        return os.path.join(self.directory, f"{key}.zz")
+
+    def _read_metadata(self, key):
+        try:
+            with open(self._metadata_path(key), "rb") as metadata_file:
+                return json.loads(metadata_file.read())
+        except (OSError, ValueError):
+            return None
+
+    def _touch(self, key):
+        # The access time of the body file is tracked through its mtime, which drives LRU eviction
+        try:
+            os.utime(self._body_path(key))
+        except OSError:
+            pass
+
+    def _remove(self, key):
+        remove_file(self._metadata_path(key))
+        remove_file(self._body_path(key))
+
+    def _evict(self):
+        """
+        Removes the least recently used entries until the cache fits in `max_bytes`.
+        """
+        # Entries are sized and aged by their body file; evicting one removes its metadata too
+        evicted = evict_lru(self.directory, ".zz", self.max_bytes,
+                            remove=lambda body_path: self._remove(os.path.basename(body_path)[:-len(".zz")]))
+
+        with self._lock:
+            self.evictions += evicted
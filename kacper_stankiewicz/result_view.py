@@ -0,0 +1,213 @@
+import os
+from collections import OrderedDict
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QRect, QSize, Qt, pyqtSignal
+from PyQt5.QtGui import QFont, QImage
+from PyQt5.QtWidgets import QListView, QStyle, QStyledItemDelegate
+
+
+class ProductListModel(QAbstractListModel):
+    """
+    A list model holding scraped products as ProductRecord objects.
+
+    No widget is created per product: the view asks the model for the rows it paints. Images
+    are requested lazily, the first time a row is painted, through `image_requested`; loaded
+    images are kept in a bounded LRU, so scrolling back to a row whose image was evicted simply
+    requests it again. Memory therefore depends on `max_images`, not on the number of rows.
+    """
+
+    # Custom data roles read by the delegate
+    ProductRole = Qt.UserRole + 1
+    ImageRole = Qt.UserRole + 2
+
+    # Emitted when a painted row needs its image: (row, image URL)
+    image_requested = pyqtSignal(int, str)
+
+    # States of a row image besides a loaded QImage
+    IMAGE_PENDING = "pending"
+    IMAGE_FAILED = "failed"
+
+    def __init__(self, image_size=200, max_images=256, parent=None):
+        """
+        Initializes the model.
+
+        Parameters:
+            image_size (int): Side of the square images are scaled to (default: 200).
+            max_images (int): Maximum number of images kept in memory (default: 256).
+            parent (QObject): Qt parent (optional).
+        """
+        super().__init__(parent)
+        self.image_size = image_size
+        self.max_images = max_images
+        self.products = []
+        self._images = OrderedDict()  # Row -> QImage, IMAGE_PENDING or IMAGE_FAILED
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.products)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.products):
+            return None
+
+        product = self.products[index.row()]
+
+        if role == Qt.DisplayRole:
+            return product.name
+        if role == Qt.ToolTipRole:
+            return f"{product.name}\n{product.price}"
+        if role == self.ProductRole:
+            return product
+        if role == self.ImageRole:
+            return self._image_for(index.row(), product.image)
+
+        return None
+
+    def append_products(self, products):
+        """
+        Appends products at the end of the list, notifying the view of the inserted rows only.
+
+        Parameters:
+            products (list): ProductRecord objects to append.
+        """
+        if not products:
+            return
+
+        first_row = len(self.products)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(products) - 1)
+        self.products.extend(products)
+        self.endInsertRows()
+
+    def clear(self):
+        """
+        Removes every product and forgets their images.
+        """
+        self.beginResetModel()
+        self.products = []
+        self._images.clear()
+        self.endResetModel()
+
+    def set_image(self, row, image):
+        """
+        Stores the loaded image of a row and repaints the row.
+
+        Parameters:
+            row (int): Row of the product.
+            image (QImage): The image, or None if it could not be loaded.
+        """
+        if row >= len(self.products):
+            return
+
+        self._remember_image(row, image if image is not None else self.IMAGE_FAILED)
+        model_index = self.index(row)
+        self.dataChanged.emit(model_index, model_index, [self.ImageRole])
+
+    # This helper method is intended for internal use within the class.
+    # It returns the image of a row, loading local files directly and requesting URLs once.
+    def _image_for(self, row, image_path):
+        image = self._images.get(row)
+        if image is not None:
+            self._images.move_to_end(row)
+            return image
+
+        if image_path and os.path.exists(image_path):  # Local file captured with RPA
+            image = QImage(image_path)
+            image = self.IMAGE_FAILED if image.isNull() else image.scaled(
+                self.image_size, self.image_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        elif image_path and image_path.startswith("http"):
+            image = self.IMAGE_PENDING
+            self.image_requested.emit(row, image_path)
+        else:
+            image = self.IMAGE_FAILED
+
+        self._remember_image(row, image)
+        return image
+
+    # This helper method is intended for internal use within the class.
+    def _remember_image(self, row, image):
+        self._images[row] = image
+        self._images.move_to_end(row)
+
+        while len(self._images) > self.max_images:
+            self._images.popitem(last=False)
+
+
+class ProductDelegate(QStyledItemDelegate):
+    """
+    Paints a product row: the image on the left, the name and price centered on the right.
+    Only the rows visible in the viewport are ever painted.
+    """
+
+    PADDING = 10
+
+    def __init__(self, image_size=200, parent=None):
+        """
+        Initializes the delegate.
+
+        Parameters:
+            image_size (int): Side of the square image area (default: 200).
+            parent (QObject): Qt parent (optional).
+        """
+        super().__init__(parent)
+        self.image_size = image_size
+        self.name_font = QFont("Arial", 16, QFont.Bold)
+        self.price_font = QFont("Arial", 14)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.image_size + 2 * self.PADDING)
+
+    def paint(self, painter, option, index):
+        painter.save()
+
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+
+        # Product image, centered in its square area
+        image_rect = QRect(option.rect.left() + self.PADDING, option.rect.top() + self.PADDING,
+                           self.image_size, self.image_size)
+        image = index.data(ProductListModel.ImageRole)
+
+        if isinstance(image, QImage):
+            painter.drawImage(image_rect.left() + (self.image_size - image.width()) // 2,
+                              image_rect.top() + (self.image_size - image.height()) // 2, image)
+        else:
+            text = "Loading image..." if image == ProductListModel.IMAGE_PENDING else "Image not available"
+            painter.drawText(image_rect, Qt.AlignCenter, text)
+
+        # Product name and price
+        product = index.data(ProductListModel.ProductRole)
+        details_rect = QRect(image_rect.right() + 2 * self.PADDING, option.rect.top() + self.PADDING,
+                             option.rect.right() - image_rect.right() - 3 * self.PADDING, self.image_size)
+        name_rect = QRect(details_rect.left(), details_rect.top(), details_rect.width(), details_rect.height() * 2 // 3)
+        price_rect = QRect(details_rect.left(), name_rect.bottom(), details_rect.width(), details_rect.height() // 3)
+
+        painter.setFont(self.name_font)
+        painter.drawText(name_rect, Qt.AlignHCenter | Qt.AlignBottom | Qt.TextWordWrap,
+                         product.name or "No name available")
+
+        painter.setFont(self.price_font)
+        painter.drawText(price_rect, Qt.AlignHCenter | Qt.AlignTop, f"Price: {product.price or 'No price available'}")
+
+        painter.restore()
+
+
+class ProductListView(QListView):
+    """
+    A virtualized list of products: rows share one height, so Qt lays out and paints only
+    the visible ones whatever the number of results.
+    """
+
+    def __init__(self, model, image_size=200, parent=None):
+        """
+        Initializes the view.
+
+        Parameters:
+            model (ProductListModel): The products to show.
+            image_size (int): Side of the square image area (default: 200).
+            parent (QWidget): Qt parent (optional).
+        """
+        super().__init__(parent)
+        self.setModel(model)
+        self.setItemDelegate(ProductDelegate(image_size, self))
+        self.setUniformItemSizes(True)  # Lets Qt skip measuring every row
+        self.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.setSelectionMode(QListView.SingleSelection)
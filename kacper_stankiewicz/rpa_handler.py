@@ -1,10 +1,16 @@
 import logging
 import webbrowser
-import pytesseract
 import pyautogui
-import time
 import os
 
+from batch_ocr import ocr_products, product_boxes
+from ocr_backends import create_ocr_backend
+from ocr_cache import OCRCache
+from product_record import ProductRecord
+from wait_conditions import (
+    StepTimer, paste_text, region_changed, region_stable, screen_signature, template_visible, wait_until,
+)
+
 
 class RPAHandler:
     """
@@ -13,9 +19,16 @@ class RPAHandler:
     details (name, price, and image) of the first 4 visible products.
     """
 
-    def __init__(self):
+    def __init__(self, ocr_backend="auto", ocr_cache_directory=".cache/ocr"):
         """
         Initializes the RPAHandler with essential configurations.
+
+        Parameters:
+            ocr_backend (str): OCR backend: "tesserocr" (engine kept loaded between captures),
+                               "pytesseract" (one tesseract process per call), or "auto" (default)
+                               for tesserocr when it is installed.
+            ocr_cache_directory (str): Folder of the OCR cache, which skips OCR for products that
+                                       look the same as in an earlier run (None disables it).
         """
         self.base_url = "https://www.amazon.es"
         self.search_box_image = "search_box.png"  # Image of the search box
@@ -25,6 +38,19 @@ class RPAHandler:
         # Create the screenshots folder if it doesn't exist
         os.makedirs(self.screenshots_folder, exist_ok=True)
 
+        # Maximum seconds to wait for the browser window and for the search results to load
+        self.page_timeout = 15
+
+        # OCR engine, created once and reused for every capture
+        self.ocr_backend = create_ocr_backend(ocr_backend)
+        self.ocr_cache = OCRCache(ocr_cache_directory) if ocr_cache_directory else None
+
+        # Duration of each step of the last run (printed as the steps end)
+        self.timer = StepTimer()
+
+        # PyAutoGUI sleeps 0.1 s after every call by default; the waits below are explicit
+        pyautogui.PAUSE = 0
+
         # Fixed coordinates for the first 4 product regions
         self.product_regions = [
             (545, 712, 1020, 1589),  # First product
@@ -37,45 +63,60 @@ class RPAHandler:
         """
         Opens the browser, navigates to Amazon, and performs a search.
 
+        Instead of fixed pauses, each step waits for its effect on the screen: the search box
+        appearing, then the results page replacing the home page and finishing rendering.
+
         Parameters:
             query (str): The search term.
 
         Returns:
             bool: True if the search was successful, False otherwise.
         """
+        self.timer.reset()
+
         try:
             # Open Amazon in the default web browser
-            webbrowser.open(self.base_url)
-            time.sleep(5)  # Allow the browser to load
+            with self.timer.step("open browser"):
+                webbrowser.open(self.base_url)
 
-            # Locate and interact with the search box
-            if not self._find_and_click(self.search_box_image):
-                logging.error("Search box not found.")
-                return False
+            # Locate and interact with the search box, as soon as the page shows it
+            with self.timer.step("click search box"):
+                if not self._find_and_click(self.search_box_image, timeout=self.page_timeout):
+                    logging.error("Search box not found.")
+                    return False
 
             # Type the query in the search box
-            pyautogui.typewrite(query, interval=0.1)
-
-            # Click the search button
-            if not self._find_and_click(self.search_button_image):
-                logging.error("Search button not found.")
-                return False
+            with self.timer.step("type query"):
+                paste_text(query)
+
+            # Click the search button, remembering how the page looked before
+            with self.timer.step("click search button"):
+                home_page = screen_signature()
+                if not self._find_and_click(self.search_button_image):
+                    logging.error("Search button not found.")
+                    return False
+
+            # Wait for the results page to replace the home page and stop changing
+            with self.timer.step("wait for results"):
+                if not wait_until(region_changed(home_page), timeout=self.page_timeout):
+                    logging.error("Search results did not load.")
+                    return False
+                wait_until(region_stable(), timeout=self.page_timeout)
 
-            time.sleep(5)  # Wait for search results to load
             return True
 
         except Exception as e:
             print(f"Error during browser interaction: {e}")
             return False
 
-    def _find_and_click(self, image_path, confidence=0.7, delay=2, scaling_factor=2):
+    def _find_and_click(self, image_path, confidence=0.7, timeout=5, scaling_factor=2):
         """
         Locate and click on a UI element using an image reference.
 
         Parameters:
             image_path (str): Path to the reference image to locate on the screen.
             confidence (float): Matching confidence level for locating the image (default: 0.7).
-            delay (int): Time in seconds to wait after clicking (default: 2 seconds).
+            timeout (float): Maximum seconds to wait for the element to appear (default: 5 seconds).
             scaling_factor (int): Factor to adjust for screen scaling.
                                   Use 1 for devices with 100% zoom.
                                   Use 2 or higher for higher scaling or resolution.
@@ -84,24 +125,16 @@ class RPAHandler:
             bool: True if the element is located and clicked, False otherwise.
         """
         try:
-            for attempt in range(3):  # Try up to 3 times
-                # Locate the center of the image on the screen
-                location = pyautogui.locateCenterOnScreen(image_path, confidence=confidence)
-                if location:
-                    # Adjust coordinates by the scaling factor
-                    scaled_x = location.x / scaling_factor
-                    scaled_y = location.y / scaling_factor
-
-                    # Move to the adjusted coordinates and click
-                    pyautogui.moveTo(scaled_x, scaled_y, duration=0.5)
-                    pyautogui.click()
-
-                    # Wait after the click to ensure the UI responds
-                    time.sleep(delay)
-                    return True
-
-            # Return False if the image could not be located after 3 attempts
-            return False
+            # Poll the screen until the image appears (or the timeout expires)
+            location = wait_until(template_visible(image_path, confidence=confidence), timeout=timeout)
+            if not location:
+                return False
+
+            # Adjust coordinates by the scaling factor, then move there instantly and click
+            scaled_x = location.x / scaling_factor
+            scaled_y = location.y / scaling_factor
+            pyautogui.click(scaled_x, scaled_y)
+            return True
 
         except Exception as e:
             print(f"Exception during _find_and_click for {image_path}: {e}")
@@ -112,16 +145,21 @@ class RPAHandler:
         Captures data (image, name, price) for the first four visible products.
 
         Returns:
-            list: A list of dictionaries containing product details.
+            list: A list of ProductRecord objects containing product details.
         """
         products = []
 
         try:
-            pyautogui.scroll(-8)
+            # Scroll to the products and wait for the page to settle (smooth scrolling, lazy images)
+            with self.timer.step("scroll"):
+                pyautogui.scroll(-8)
+                wait_until(region_stable(), timeout=self.page_timeout)
 
             # Take a screenshot of the visible browser area
-            screenshot = pyautogui.screenshot()
+            with self.timer.step("screenshot"):
+                screenshot = pyautogui.screenshot()
 
+            captured = []  # (product number, capture, image path) of each product region
             for index, region in enumerate(self.product_regions):
                 try:
                     # Crop the region for the specific product
@@ -132,47 +170,38 @@ class RPAHandler:
                     cropped_product.save(cropped_image_path)
                     print(f"Saved full product screenshot {index + 1} to {cropped_image_path}")
 
-                    # Define sub-regions for the product image, name, and price
-                    width, height = cropped_product.size
-                    image_region = (0, 0, width, height // 2)  # Top half for the image
-                    name_region = (0, height // 2, width, (3 * height) // 4)  # Middle for name
-                    price_region = (0, (3 * height) // 4, width, height)  # Bottom for price
-
-                    # Process and save the product image
+                    # Process and save the product image (top half of the capture)
+                    image_region, _, _ = product_boxes(*cropped_product.size)
                     cropped_image = cropped_product.crop(image_region)
                     cropped_image_path = os.path.join(
                         self.screenshots_folder, f"product_{index + 1}_image.png"
                     )
                     cropped_image.save(cropped_image_path)
 
-                    # Extract product name using OCR
-                    cropped_name = cropped_product.crop(name_region)
-                    # Preparing the cropped image for the OCR engine to extract text:
-                    ocr_product_name_data = pytesseract.image_to_data(
-                        cropped_name, output_type=pytesseract.Output.DICT
-                    )
-                    product_name = self._extract_name_from_ocr_data(ocr_product_name_data)
+                    captured.append((index + 1, cropped_product, cropped_image_path))
 
-                    # Extract product price using OCR
-                    cropped_price = cropped_product.crop(price_region)
-                    # Preparing the cropped image for the OCR engine to extract text:
-                    ocr_product_price_data = pytesseract.image_to_data(
-                        cropped_price, output_type=pytesseract.Output.DICT
-                    )
-                    product_price = self._extract_price_from_ocr_data(ocr_product_price_data)
+                except Exception as product_error:
+                    print(f"Error processing product {index + 1}: {product_error}")
 
-                    # Append the product data to the list
-                    products.append({
-                        "name": product_name,
-                        "price": product_price,
-                        "image": cropped_image_path,
-                    })
+            # Extract the names and prices of all products with a single OCR run
+            with self.timer.step("ocr"):
+                ocr_results = ocr_products(
+                    [cropped_product for _, cropped_product, _ in captured], self.ocr_backend,
+                    cache=self.ocr_cache,
+                )
 
-                    print(f"Product {index + 1}: Name = {product_name}, Price = {product_price}")
+            for (number, _, image_path), (name_data, price_data) in zip(captured, ocr_results):
+                product_name = self._extract_name_from_ocr_data(name_data)
+                product_price = self._extract_price_from_ocr_data(price_data)
 
-                except Exception as product_error:
-                    print(f"Error processing product {index + 1}: {product_error}")
+                # Append the product data to the list
+                products.append(ProductRecord(product_name, image_path, product_price))
+
+                print(f"Product {number}: Name = {product_name}, Price = {product_price}")
 
+            print(f"RPA timings:\n{self.timer.report()}")
+            if self.ocr_cache:
+                print(f"OCR cache: {self.ocr_cache.stats()}")
             return products
 
         except Exception as e:
@@ -0,0 +1,157 @@
+import argparse
+import sys
+import time
+
+from selector_profiles import PROFILES  # Only `re` and the price normalizer: cheap to import
+
+# Start of the command, for the --timings report
+START_TIME = time.perf_counter()
+
+
+def read_queries(path):
+    """
+    Reads search terms from a file, one per line.
+
+    Parameters:
+        path (str): File with the queries, or "-" to read them from standard input.
+
+    Returns:
+        list: The queries, without blank lines and lines starting with "#".
+    """
+    if path == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(path, "r", encoding="utf-8") as queries_file:
+            lines = queries_file.read().splitlines()
+
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+
+
+def run_scrape(args):
+    """
+    Crawls every query and streams the products to the output file.
+
+    Only the HTTP and parsing stack is imported: no Qt, pyautogui or pytesseract.
+
+    Parameters:
+        args (argparse.Namespace): Parsed command-line arguments.
+
+    Returns:
+        int: Process exit code.
+    """
+    import_start = time.perf_counter()
+    from export_sink import ProductExportSink
+    from web_scraper import WebScrapper
+
+    response_cache = None
+    if args.cache:
+        from response_cache import ResponseCache
+        response_cache = ResponseCache(args.cache)
+
+    import_seconds = time.perf_counter() - import_start
+
+    try:
+        queries = read_queries(args.queries)
+    except OSError as e:
+        print(f"Failed to read queries: {e}", file=sys.stderr)
+        return 1
+
+    scraper = WebScrapper(parser_engine=args.engine, profile=args.profile, base_url=args.base_url,
+                          cache=response_cache)
+    setup_seconds = time.perf_counter() - START_TIME
+    crawl_start = time.perf_counter()
+    product_count = 0
+
+    try:
+        with ProductExportSink(args.out, args.format, batch_size=args.batch_size,
+                               flush_interval=args.flush_interval) as sink:
+            for query in queries:
+                query_products = 0
+                for _ in scraper.crawl_search_pages(query, args.max_results, args.max_pages, args.workers, sink=sink):
+                    query_products += 1
+
+                product_count += query_products
+                if not args.quiet:
+                    print(f"{query}: {query_products} products", file=sys.stderr)
+
+    except KeyboardInterrupt:
+        print("Interrupted, products scraped so far were written.", file=sys.stderr)
+        return 130
+
+    finally:
+        scraper.close()
+
+    if args.timings:
+        print(f"Imports: {import_seconds * 1000:.0f} ms, startup: {setup_seconds * 1000:.0f} ms", file=sys.stderr)
+
+    print(f"{product_count} products from {len(queries)} queries written to {args.out} "
+          f"in {time.perf_counter() - crawl_start:.1f} s", file=sys.stderr)
+    return 0
+
+
+def run_gui(args):
+    """
+    Starts the PyQt5 desktop interface. The GUI stack is imported only here.
+
+    Parameters:
+        args (argparse.Namespace): Parsed command-line arguments.
+
+    Returns:
+        int: Process exit code.
+    """
+    import_start = time.perf_counter()
+    from PyQt5.QtWidgets import QApplication
+    from ui_handler import UIHandler
+
+    if args.timings:
+        print(f"GUI imports: {(time.perf_counter() - import_start) * 1000:.0f} ms", file=sys.stderr)
+
+    app = QApplication(sys.argv[:1])
+    window = UIHandler()
+    window.show()
+    return app.exec_()
+
+
+def build_parser():
+    """
+    Builds the command-line parser.
+
+    Returns:
+        argparse.ArgumentParser: The parser with the "scrape" and "gui" commands.
+    """
+    parser = argparse.ArgumentParser(prog="scraper_cli", description="Amazon product scraper.")
+    parser.add_argument("--timings", action="store_true", help="Report import and startup times.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    scrape = commands.add_parser("scrape", help="Scrape queries headlessly and export the products.")
+    scrape.add_argument("--queries", required=True, help="File with one query per line, or - for stdin.")
+    scrape.add_argument("--out", required=True, help="Output file (.jsonl, .csv, .parquet or .arrow).")
+    scrape.add_argument("--format", choices=("jsonl", "csv", "parquet", "arrow"),
+                        help="Output format (default: taken from the file extension).")
+    scrape.add_argument("--profile", default="amazon.es", choices=tuple(PROFILES),
+                        help="Amazon locale profile (default: amazon.es).")
+    scrape.add_argument("--base-url", help="Search endpoint (default: the profile's Amazon search URL).")
+    scrape.add_argument("--engine", default="auto", choices=("auto", "soup", "stream", "lxml"),
+                        help="Parser engine (default: auto).")
+    scrape.add_argument("--max-results", type=int, default=100, help="Products per query (default: 100).")
+    scrape.add_argument("--max-pages", type=int, help="Results pages per query (default: all).")
+    scrape.add_argument("--workers", type=int, default=4, help="Pages fetched in parallel (default: 4).")
+    scrape.add_argument("--batch-size", type=int, default=1000, help="Products per written batch (default: 1000).")
+    scrape.add_argument("--flush-interval", type=float, default=5.0, help="Seconds between flushes (default: 5).")
+    scrape.add_argument("--cache", help="Folder of the HTTP response cache (default: no cache).")
+    scrape.add_argument("--quiet", action="store_true", help="Do not report progress per query.")
+    scrape.set_defaults(handler=run_scrape)
+
+    gui = commands.add_parser("gui", help="Start the desktop interface.")
+    gui.set_defaults(handler=run_gui)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+import re
+
+from price_normalizer import format_cents, normalize_price
+
+
+class SelectorProfile:
+    """
+    A declarative description of where product fields live on an Amazon search results page.
+
+    The CSS selectors and regular expressions of a profile are compiled once when the profile
+    is created, and reused for every product card of every page.
+    """
+
+    # First <img> tag of a serialized product card, and the attributes read from it.
+    # Attribute values may be quoted with either quote style depending on their content.
+    IMAGE_TAG_PATTERN = re.compile(r"<img\b[^>]*>", re.IGNORECASE)
+    SRC_PATTERN = re.compile(r"""\ssrc=(?:"([^"]*)"|'([^']*)')""")
+    ALT_PATTERN = re.compile(r"""\salt=(?:"([^"]*)"|'([^']*)')""")
+
+    def __init__(self, name, base_url, accept_language, locale, currency, sponsored_markers,
+                 container_class="s-main-slot", result_class="s-result-item", price_class="a-price"):
+        """
+        Initializes and compiles the profile.
+
+        Parameters:
+            name (str): Name of the profile (the Amazon domain, e.g. "amazon.es").
+            base_url (str): URL of the search endpoint.
+            accept_language (str): Accept-Language header sent with searches.
+            locale (str): Locale of the displayed prices, one of `price_normalizer.LOCALES`.
+            currency (str): ISO code of the currency prices are shown in.
+            sponsored_markers (tuple): Texts that identify sponsored ads in product names.
+            container_class (str): Class of the element holding the search results.
+            result_class (str): Class of a single product card.
+            price_class (str): Class of the price element inside a card.
+        """
+        self.name = name
+        self.base_url = base_url
+        self.accept_language = accept_language
+        self.locale = locale
+        self.currency = currency
+        self.sponsored_markers = tuple(sponsored_markers)
+        self.container_class = container_class
+        self.result_class = result_class
+        self.price_class = price_class
+
+        # Compiled once, applied to every card
+        self.result_selector = f".{container_class} .{result_class}"
+        self.price_selector = f".{price_class}"
+
+    def extract_image_and_name(self, product_html):
+        """
+        Extracts the image URL and the product name from the first image of a serialized card.
+
+        Only the first <img> tag is scanned for, and its attributes are then read from that
+        short tag instead of rescanning the whole card for each field.
+
+        Parameters:
+            product_html (str): HTML content of a single product.
+
+        Returns:
+            tuple: (image URL, product name), with empty strings for missing values.
+        """
+        image_tag = self.IMAGE_TAG_PATTERN.search(product_html)
+        if not image_tag:
+            return "", ""
+
+        image_tag = image_tag.group()
+        return self._attribute(self.SRC_PATTERN, image_tag), self._attribute(self.ALT_PATTERN, image_tag)
+
+    def format_price(self, price_text):
+        """
+        Formats the text of a price element as the full price followed by the currency symbol
+        (e.g. "1.299,99€"), using the separators of the profile's locale.
+
+        Parameters:
+            price_text (str | None): Text of the price element, or None if it was not found.
+
+        Returns:
+            str: Product price with the currency symbol, or an empty string if not found.
+        """
+        if price_text is None:
+            return ""
+
+        cents, currency = normalize_price(price_text, self.locale)
+        return format_cents(cents, self.locale, currency or self.currency)
+
+    def is_sponsored(self, product_name):
+        """
+        Checks whether a product name belongs to a sponsored ad.
+
+        Parameters:
+            product_name (str): Product name.
+
+        Returns:
+            bool: True if the name contains one of the sponsored markers.
+        """
+        return any(marker in product_name for marker in self.sponsored_markers)
+
+    @staticmethod
+    def _attribute(pattern, tag):
+        match = pattern.search(tag)
+        if not match:
+            return ""
+        return match.group(1) if match.group(1) is not None else match.group(2)
+
+
+# Profiles for the Amazon locales the scraper supports, keyed by domain.
+PROFILES = {
+    profile.name: profile for profile in (
+        SelectorProfile(
+            "amazon.es", "https://www.amazon.es/s", "en-US,en;q=0.9", "es", "EUR",
+            ("Anuncio patrocinado", "Sponsored Ad"),
+        ),
+        SelectorProfile(
+            "amazon.de", "https://www.amazon.de/s", "de-DE,de;q=0.9", "de", "EUR",
+            ("Gesponserte Anzeige", "Sponsored Ad"),
+        ),
+        SelectorProfile(
+            "amazon.fr", "https://www.amazon.fr/s", "fr-FR,fr;q=0.9", "fr", "EUR",
+            ("Annonce sponsorisée", "Sponsored Ad"),
+        ),
+        SelectorProfile(
+            "amazon.it", "https://www.amazon.it/s", "it-IT,it;q=0.9", "it", "EUR",
+            ("Annuncio sponsorizzato", "Sponsored Ad"),
+        ),
+        SelectorProfile(
+            "amazon.co.uk", "https://www.amazon.co.uk/s", "en-GB,en;q=0.9", "en", "GBP",
+            ("Sponsored Ad",),
+        ),
+        SelectorProfile(
+            "amazon.com", "https://www.amazon.com/s", "en-US,en;q=0.9", "en", "USD",
+            ("Sponsored Ad",),
+        ),
+    )
+}
+
+
+def get_profile(profile):
+    """
+    Resolves a selector profile.
+
+    Parameters:
+        profile (str | SelectorProfile): Profile name (e.g. "amazon.de") or a profile instance.
+
+    Returns:
+        SelectorProfile: The resolved profile.
+    """
+    if isinstance(profile, SelectorProfile):
+        return profile
+
+    try:
+        return PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown selector profile: {profile!r}. Expected one of {tuple(PROFILES)}.") from None
@@ -0,0 +1,202 @@
+import html
+from html.parser import HTMLParser
+
+from product_record import ProductRecord
+
+
+# Elements that never have a closing tag, so they must not be pushed onto the tag stack.
+VOID_ELEMENTS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link",
+    "meta", "param", "source", "track", "wbr",
+})
+
+
+class _OpenCard:
+    """
+    Fields collected for a product card that is still open, or waiting for the cards
+    around it to finish so products are emitted in document order.
+    """
+
+    def __init__(self, asin, depth):
+        self.asin = asin
+        self.depth = depth  # Stack depth of the ".s-result-item" element
+        self.image = None
+        self.name = None
+        self.price_depth = None  # Stack depth of the card's first ".a-price" element
+        self.price_parts = None
+        self.price_text = None
+        self.finished = False
+        self.product = None
+
+
+class StreamingProductParser(HTMLParser):
+    """
+    An event-based (SAX-style) parser that extracts products from Amazon search results
+    in a single pass over the document.
+
+    Only the product cards (".s-main-slot .s-result-item" by default) are inspected; everything else
+    is skipped as it streams past. Cards can be nested: like the CSS selector, every card is
+    read from its whole subtree (nested cards included) and products are listed in the order
+    their cards start. Parsing stops as soon as `max_results` valid products have been collected.
+    """
+
+    def __init__(self, profile, is_valid_product, max_results=10, on_product=None):
+        """
+        Initializes the parser.
+
+        Parameters:
+            profile (SelectorProfile): Selector profile describing the page layout.
+            is_valid_product (callable): Validation function taking (name, image, price).
+            max_results (int): Maximum number of products to extract.
+            on_product (callable): Called with each ProductRecord as soon as it is parsed (optional).
+        """
+        super().__init__(convert_charrefs=True)
+        self.profile = profile
+        self.is_valid_product = is_valid_product
+        self.max_results = max_results
+        self.on_product = on_product
+        self.products = []
+        self.done = max_results <= 0
+
+        self._stack = []  # Names of the currently open elements
+        self._main_slot_depth = None  # Stack depth of the ".s-main-slot" element
+        self._cards = []  # Open product cards, outermost first
+        self._pending_cards = []  # Cards in document order whose products were not emitted yet
+
+    def feed(self, data):
+        """
+        Feeds a chunk of HTML to the parser, ignoring it once enough products were found.
+
+        Parameters:
+            data (str): A chunk of HTML content.
+        """
+        if not self.done:
+            super().feed(data)
+
+    def close(self):
+        """
+        Flushes the remaining input and finishes any elements left open at the end of the document.
+        """
+        super().close()
+
+        while self._stack and not self.done:
+            self._stack.pop()
+            self._close_elements_at(len(self._stack))
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+
+        attributes = dict(attrs)
+        classes = (attributes.get("class") or "").split()
+
+        if self._cards:
+            self._handle_card_tag(tag, attributes, classes)
+
+        if self._main_slot_depth is not None and self.profile.result_class in classes:
+            card = _OpenCard(attributes.get("data-asin") or "", len(self._stack))
+            self._cards.append(card)
+            self._pending_cards.append(card)
+        elif self._main_slot_depth is None and self.profile.container_class in classes:
+            self._main_slot_depth = len(self._stack)
+
+        if tag not in VOID_ELEMENTS:
+            self._stack.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+        # Self-closing syntax on a non-void element (e.g. <div/>) still needs to be closed
+        if tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if self.done or tag in VOID_ELEMENTS:
+            return
+
+        # Ignore stray closing tags that do not match any open element
+        if tag not in self._stack:
+            return
+
+        # Pop until the matching element, implicitly closing unclosed children (e.g. <p>, <li>)
+        while self._stack:
+            closed_tag = self._stack.pop()
+            self._close_elements_at(len(self._stack))
+
+            if self.done or closed_tag == tag:
+                break
+
+    def _close_elements_at(self, depth):
+        """
+        Finishes the prices, product cards or main slot element opened at the given stack depth.
+        """
+        for card in self._cards:
+            if card.price_depth is not None and depth <= card.price_depth:
+                card.price_text = "".join(card.price_parts)
+                card.price_depth = None
+
+        while self._cards and depth <= self._cards[-1].depth:
+            self._finish_card(self._cards.pop())
+
+        if self._main_slot_depth is not None and depth <= self._main_slot_depth:
+            self._main_slot_depth = None
+
+    def handle_data(self, data):
+        for card in self._cards:
+            if card.price_depth is not None:
+                card.price_parts.append(data)
+
+    def _handle_card_tag(self, tag, attributes, classes):
+        """
+        Collects product fields from a tag found inside the open product cards.
+        """
+        for card in self._cards:
+            if tag == "img" and card.image is None:
+                card.image = escape_attribute(attributes.get("src") or "")
+                card.name = escape_attribute(attributes.get("alt") or "")
+
+            if self.profile.price_class in classes and card.price_depth is None and card.price_text is None:
+                card.price_depth = len(self._stack)
+                card.price_parts = []
+
+    def _finish_card(self, card):
+        """
+        Validates a closed product card, then emits the finished cards that no earlier card is still waiting on.
+        """
+        product_name = card.name or ""
+        product_image = card.image or ""
+        product_price = self.profile.format_price(card.price_text)
+
+        if self.is_valid_product(product_name, product_image, product_price):
+            card.product = ProductRecord(product_name, product_image, product_price, card.asin)
+        card.finished = True
+
+        # A nested card closes before the card around it, which still comes first in the results
+        while self._pending_cards and self._pending_cards[0].finished and not self.done:
+            product = self._pending_cards.pop(0).product
+            if product is None:
+                continue
+
+            self.products.append(product)
+
+            if self.on_product is not None:
+                self.on_product(product)
+
+            # Stop collecting after reaching the max results limit
+            if len(self.products) >= self.max_results:
+                self.done = True
+
+
+def escape_attribute(value):
+    """
+    Escapes an attribute value the same way BeautifulSoup serializes it, so that the values
+    match those extracted by RegEx from `str(product_element)`.
+
+    Parameters:
+        value (str): The unescaped attribute value.
+
+    Returns:
+        str: The escaped attribute value.
+    """
+    return html.escape(value, quote=False)
+
@@ -1,14 +1,12 @@
 import sys
-import os
-import requests
 from PyQt5.QtWidgets import (
-    QApplication, QLabel, QLineEdit, QPushButton, QVBoxLayout, QHBoxLayout, QWidget, QScrollArea, QSpacerItem,
-    QSizePolicy
+    QApplication, QLabel, QLineEdit, QPushButton, QVBoxLayout, QHBoxLayout, QWidget, QSpacerItem, QSizePolicy
 )
-from PyQt5.QtGui import QPixmap, QImage, QPainter, QFont
+from PyQt5.QtGui import QPixmap, QFont
 from PyQt5.QtCore import Qt
 
-from rpa_handler import RPAHandler
+from result_view import ProductListModel, ProductListView
+from ui_workers import BackgroundSearch
 from web_scraper import WebScrapper
 
 
@@ -19,9 +17,30 @@ class UIHandler(QWidget):
         """
         super().__init__()
         self.scraper = WebScrapper()  # Instance of the WebScrapper class
-        self.rpa_handler = RPAHandler()  # Create an instance of RPAHandler
+        self._rpa_handler = None  # Created on first RPA search, see the rpa_handler property
+
+        # Scraping and image downloads run on a thread pool so the window stays responsive
+        self.background_search = BackgroundSearch(self.scraper, image_size=200, parent=self)
+        self.background_search.product_found.connect(self.on_product_found)
+        self.background_search.search_finished.connect(self.on_search_finished)
+        self.background_search.image_loaded.connect(self.on_image_loaded)
+        self.background_search.image_failed.connect(self.on_image_failed)
+
         self.init_ui()
 
+    @property
+    def rpa_handler(self):
+        """
+        Returns the RPAHandler, importing pyautogui and pytesseract on first use only.
+
+        Returns:
+            RPAHandler: The RPA handler of the window.
+        """
+        if self._rpa_handler is None:
+            from rpa_handler import RPAHandler
+            self._rpa_handler = RPAHandler()
+        return self._rpa_handler
+
     def init_ui(self):
         """
         Initializes the user interface.
@@ -70,185 +89,148 @@ class UIHandler(QWidget):
 
         main_layout.addLayout(search_layout)  # Add the search layout to the main layout
 
-        # Scroll area for displaying product results
-        self.scroll_area = QScrollArea(self)
-        self.scroll_area.setWidgetResizable(True)  # Allow the scroll area to resize dynamically
-        main_layout.addWidget(self.scroll_area)
-
-        # Widget to hold products inside the scroll area
-        self.products_widget = QWidget()
-        self.products_layout = QVBoxLayout(self.products_widget)
-
-        # Add placeholder message
+        # Placeholder and status messages, shown instead of the results list
         self.placeholder_label = QLabel("Results will show up here", self)
         self.placeholder_label.setAlignment(Qt.AlignCenter)
         self.placeholder_label.setFont(QFont("Arial", 16, QFont.Bold))  # Set font size and make it bold
-        self.products_layout.addWidget(self.placeholder_label)
+        main_layout.addWidget(self.placeholder_label, 1)
 
-        self.scroll_area.setWidget(self.products_widget)
+        # Virtualized results list: only the visible rows are painted, and their images
+        # are requested from the background search when first painted
+        self.result_model = ProductListModel(image_size=200, parent=self)
+        self.result_model.image_requested.connect(self.background_search.load_image)
+        self.result_list = ProductListView(self.result_model, image_size=200, parent=self)
+        self.result_list.hide()
+        main_layout.addWidget(self.result_list, 1)
 
         self.setLayout(main_layout)  # Set the main layout for the window
 
     def search_product_scraper(self):
         """
         Triggered when the 'Search with Scraper' button is clicked or Enter key is pressed.
-        Scrapes Amazon and displays up to 10 product details.
+        Starts a background search for up to 10 products; a running search is cancelled.
         """
         product_name = self.search_input.text()
 
         # Handle empty search input
         if not product_name:
-            self.clear_layout(self.products_layout)  # Clear previous results (if any)
-            notice = QLabel("Please enter a product name!", self)
-            notice.setAlignment(Qt.AlignCenter)
-            self.products_layout.addWidget(notice)
+            self.background_search.cancel()
+            self.show_notice("Please enter a product name!")
             return
 
-        # Clear previous results and display a loading message
-        self.clear_layout(self.products_layout)
-        notice = QLabel("Searching with Scraper... Please wait.", self)
-        notice.setAlignment(Qt.AlignCenter)
-        self.products_layout.addWidget(notice)
+        # Clear previous results and display a loading message until the first product arrives
+        self.show_notice("Searching with Scraper... Please wait.")
+        self.background_search.start(product_name)
 
-        # Fetch HTML content for the search query using scraper
-        html_content = self.scraper.fetch_search_results(product_name)
+    def on_product_found(self, product_data):
+        """
+        Displays a product as soon as the background search has parsed it.
 
-        if html_content:
-            products_data = self.scraper.parse_products(html_content)
-            self.clear_layout(self.products_layout)  # Clear loading message
-            if products_data:
-                for product_data in products_data:
-                    self.display_product(product_data)  # Display each product
-            else:
-                notice.setText("No product data found.")
-                self.products_layout.addWidget(notice)
+        Parameters:
+            product_data (ProductRecord): The parsed product.
+        """
+        self.display_product(product_data)
+
+    def on_search_finished(self, product_count, fetched):
+        """
+        Reports searches that ended without any product.
+
+        Parameters:
+            product_count (int): Number of products found.
+            fetched (bool): Whether the search results page was downloaded (or read from the cache).
+        """
+        if product_count or self.result_model.rowCount():
+            return
+
+        if fetched:
+            self.placeholder_label.setText("No product data found.")
         else:
-            notice.setText("Failed to fetch Amazon search results.")
-            self.products_layout.addWidget(notice)
+            self.placeholder_label.setText("Failed to fetch Amazon search results.")
+
+    def on_image_loaded(self, index, image):
+        """
+        Shows a product image downloaded and scaled by the background search.
+
+        Parameters:
+            index (int): Index of the product in the current results.
+            image (QImage): The image, already centered on a 200x200 canvas.
+        """
+        self.result_model.set_image(index, image)
+
+    def on_image_failed(self, index):
+        """
+        Marks a product image that could not be downloaded.
+
+        Parameters:
+            index (int): Index of the product in the current results.
+        """
+        self.result_model.set_image(index, None)
 
     def search_flabelus_with_rpa(self):
         """
         Triggered when the 'Search Flabelus Shoes' button is clicked.
         Uses RPA to fetch and display Flabelus shoe details.
         """
-        # Clear previous results and display a loading message
-        self.clear_layout(self.products_layout)
-        notice = QLabel("Searching for Flabelus shoes with RPA... Please wait.", self)
-        notice.setAlignment(Qt.AlignCenter)
-        self.products_layout.addWidget(notice)
+        # Cancel any running scraper search, clear previous results and display a loading message
+        self.background_search.cancel()
+        notice = self.show_notice("Searching for Flabelus shoes with RPA... Please wait.")
 
         # Perform the fixed RPA search
         success = self.rpa_handler.open_browser_and_search("Flabelus")
         if success:
             products = self.rpa_handler.fetch_products()  # Fetch the first 4 products
-            self.clear_layout(self.products_layout)  # Clear loading message
 
             if products:
                 for product_data in products:
                     self.display_product(product_data)  # Display each product
             else:
                 notice.setText("No product data found.")
-                self.products_layout.addWidget(notice)
         else:
             notice.setText("Failed to perform RPA search.")
-            self.products_layout.addWidget(notice)
 
     def display_product(self, product_data):
         """
-        Displays a single product's details in the UI.
+        Appends a single product to the results list.
+
+        The row is painted by the list delegate; its image is loaded when the row first
+        becomes visible (local files captured with RPA directly, URLs in the background).
 
         Parameters:
-            product_data (dict): A dictionary containing the product's name, image path/URL, and price.
+            product_data (ProductRecord): The product's name, image path/URL, and price.
         """
-        product_widget = QWidget()
-        product_layout = QHBoxLayout(product_widget)
-
-        # Product image
-        product_image_label = QLabel(self)
-        product_image_label.setAlignment(Qt.AlignCenter)
-
-        image_path = product_data['image']
-
-        if os.path.exists(image_path):  # Check if the image is a local file (RPA)
-            product_image_label.setPixmap(
-                QPixmap(image_path).scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-            product_image_label.setFixedSize(200, 200)
-            product_image_label.setScaledContents(True)
-        elif image_path.startswith("http"):  # Check if the image is a URL (web scraper)
-            try:
-                image_response = requests.get(image_path)
-                if image_response.status_code == 200:
-                    # Create a fixed-size canvas with a white background
-                    fixed_width, fixed_height = 200, 200
-                    white_canvas = QImage(fixed_width, fixed_height, QImage.Format_RGB32)
-                    white_canvas.fill(Qt.white)
-
-                    # Load and scale the original image
-                    original_image = QImage.fromData(image_response.content)
-                    scaled_image = original_image.scaled(fixed_width, fixed_height, Qt.KeepAspectRatio,
-                                                         Qt.SmoothTransformation)
-
-                    # Center the scaled image on the canvas
-                    painter = QPainter(white_canvas)
-                    x_offset = (fixed_width - scaled_image.width()) // 2
-                    y_offset = (fixed_height - scaled_image.height()) // 2
-                    painter.drawImage(x_offset, y_offset, scaled_image)
-                    painter.end()
-
-                    # Display the image
-                    product_image_label.setPixmap(QPixmap.fromImage(white_canvas))
-                    product_image_label.setFixedSize(fixed_width, fixed_height)
-                    product_image_label.setScaledContents(True)
-            except Exception as e:
-                print(f"Error loading image from URL: {e}")
-                product_image_label.setText("Image not available")
-        else:
-            # Handle the case where the image is neither a file nor a valid URL
-            product_image_label.setText("Image not available")
-            product_image_label.setAlignment(Qt.AlignCenter)
-
-        # Product details
-        details_widget = QWidget()
-        details_layout = QVBoxLayout(details_widget)
-
-        # Product name
-        product_name_label = QLabel(f"{product_data.get('name', 'No name available')}", self)
-        product_name_label.setFont(QFont("Arial", 16, QFont.Bold))  # Bold, size 16
-        product_name_label.setWordWrap(True)
-        product_name_label.setAlignment(Qt.AlignCenter)
-        details_layout.addWidget(product_name_label)
-
-        # Product price
-        product_price_label = QLabel(f"Price: {product_data.get('price', 'No price available')}", self)
-        product_price_label.setFont(QFont("Arial", 14))
-        product_price_label.setAlignment(Qt.AlignCenter)
-        details_layout.addWidget(product_price_label)
-
-        # Align details vertically
-        container_layout = QVBoxLayout()
-        container_layout.addStretch()
-        container_layout.addWidget(details_widget)
-        container_layout.addStretch()
-
-        # Add image and details to product layout
-        product_layout.addWidget(product_image_label)
-        product_layout.addLayout(container_layout)
-
-        # Add product widget to the results layout
-        self.products_layout.addWidget(product_widget)
-
-    def clear_layout(self, layout):
+        if self.result_list.isHidden():
+            self.placeholder_label.hide()  # Clear loading message
+            self.result_list.show()
+
+        self.result_model.append_products([product_data])
+
+    def show_notice(self, text):
+        """
+        Replaces the results with a centered status message.
+
+        Parameters:
+            text (str): The message to show.
+
+        Returns:
+            QLabel: The label showing the message.
+        """
+        self.result_model.clear()  # Clear previous results (if any)
+        self.result_list.hide()
+
+        self.placeholder_label.setText(text)
+        self.placeholder_label.show()
+        return self.placeholder_label
+
+    def closeEvent(self, event):
         """
-        Clears all widgets from a given layout.
+        Cancels background work when the window is closed.
 
         Parameters:
-            layout (QLayout): The layout to clear.
+            event (QCloseEvent): The close event.
         """
-        if layout is not None:
-            while layout.count():
-                child = layout.takeAt(0)
-                if child.widget() is not None:
-                    child.widget().deleteLater()
+        self.background_search.cancel()
+        self.background_search.thread_pool.waitForDone(2000)
+        super().closeEvent(event)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,192 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QImage
+
+from image_pipeline import load_thumbnail, thumbnail_url
+
+
+class _WorkerSignals(QObject):
+    """
+    Signals emitted by the workers from their pool threads. Each carries the generation of
+    the search that started the work, so results of a superseded search can be dropped.
+    """
+
+    product_found = pyqtSignal(int, object)  # generation, ProductRecord
+    search_finished = pyqtSignal(int, int, bool)  # generation, number of products, page fetched
+    image_loaded = pyqtSignal(int, int, QImage)  # generation, product index, image
+    image_failed = pyqtSignal(int, int)  # generation, product index
+
+
+class _SearchWorker(QRunnable):
+    """
+    Fetches and parses a search results page in a pool thread, reporting each product as
+    soon as it is parsed.
+    """
+
+    def __init__(self, scraper, query, max_results, generation, is_current, signals):
+        super().__init__()
+        self.scraper = scraper
+        self.query = query
+        self.max_results = max_results
+        self.generation = generation
+        self.is_current = is_current
+        self.signals = signals
+
+    def run(self):
+        if not self.is_current(self.generation):
+            return
+
+        # Counters of this search only: the scraper's last_stream_stats may already belong to a newer one
+        stats = {}
+        products = self.scraper.stream_search_results(
+            self.query, self.max_results,
+            on_product=lambda product: self.signals.product_found.emit(self.generation, product),
+            is_cancelled=lambda: not self.is_current(self.generation),
+            stats=stats,
+        )
+        self.signals.search_finished.emit(self.generation, len(products), bool(stats["bytes_decoded"]))
+
+
+class _ImageWorker(QRunnable):
+    """
+    Downloads a product thumbnail and decodes it at display size in a pool thread.
+    """
+
+    def __init__(self, session, timeout, url, index, size, generation, is_current, signals):
+        super().__init__()
+        self.session = session
+        self.timeout = timeout
+        self.url = url
+        self.index = index
+        self.size = size
+        self.generation = generation
+        self.is_current = is_current
+        self.signals = signals
+
+    def run(self):
+        # Skip images of a search that was replaced while this one waited in the queue
+        if not self.is_current(self.generation):
+            return
+
+        image = None
+        try:
+            # Ask the CDN for a variant close to the display size instead of the full image
+            image_response = self.session.get(thumbnail_url(self.url, self.size), timeout=self.timeout)
+
+            # The search may have been replaced (or the window closed) during the download
+            if not self.is_current(self.generation):
+                return
+
+            if image_response.status_code == 200:
+                image = load_thumbnail(image_response.content, self.size)
+        except Exception as e:
+            print(f"Error loading image from URL: {e}")
+
+        if image is None:
+            self.signals.image_failed.emit(self.generation, self.index)
+        else:
+            self.signals.image_loaded.emit(self.generation, self.index, image)
+
+
+class BackgroundSearch(QObject):
+    """
+    Runs scraper searches and image downloads on a thread pool, off the Qt main thread.
+
+    Products are emitted one by one as they are parsed, and their images are downloaded
+    concurrently over the scraper's pooled session and decoded straight to thumbnail size.
+    Starting a new search (or calling `cancel`) bumps a generation counter: queued work of
+    the previous search is dropped, its running download stops at the next chunk, and its
+    late results are never emitted.
+
+    Signals are delivered in the thread this object lives in (normally the GUI thread),
+    so connected slots may update widgets directly.
+    """
+
+    product_found = pyqtSignal(object)  # ProductRecord
+    search_finished = pyqtSignal(int, bool)  # Number of products found, whether the page was fetched
+    image_loaded = pyqtSignal(int, QImage)  # Product index, image
+    image_failed = pyqtSignal(int)  # Product index
+
+    def __init__(self, scraper, image_size=200, max_threads=8, parent=None):
+        """
+        Initializes the background search.
+
+        Parameters:
+            scraper (WebScrapper): Scraper used for searches; its session is shared by image downloads.
+            image_size (int): Side of the square canvas images are scaled onto (default: 200).
+            max_threads (int): Maximum number of pool threads (default: 8).
+            parent (QObject): Qt parent (optional).
+        """
+        super().__init__(parent)
+        self.scraper = scraper
+        self.image_size = image_size
+        self.generation = 0
+
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(max_threads)
+
+        self._signals = _WorkerSignals(self)
+        self._signals.product_found.connect(self._on_product_found)
+        self._signals.search_finished.connect(self._on_search_finished)
+        self._signals.image_loaded.connect(self._on_image_loaded)
+        self._signals.image_failed.connect(self._on_image_failed)
+
+    def start(self, query, max_results=10):
+        """
+        Cancels any running search and starts a new one.
+
+        Parameters:
+            query (str): The search term.
+            max_results (int): Maximum number of products to find (default: 10).
+        """
+        self.cancel()
+        self.thread_pool.start(_SearchWorker(
+            self.scraper, query, max_results, self.generation, self.is_current, self._signals,
+        ))
+
+    def load_image(self, index, url):
+        """
+        Queues the download of a product image for the current search.
+
+        Parameters:
+            index (int): Index of the product, echoed back by `image_loaded`/`image_failed`.
+            url (str): URL of the image.
+        """
+        self.thread_pool.start(_ImageWorker(
+            self.scraper.session, self.scraper.timeout, url, index, self.image_size,
+            self.generation, self.is_current, self._signals,
+        ))
+
+    def cancel(self):
+        """
+        Cancels the current search and its pending image downloads.
+        """
+        self.generation += 1
+        self.thread_pool.clear()  # Drops the work that has not started yet
+
+    def is_current(self, generation):
+        """
+        Checks whether work started for the given generation is still wanted.
+
+        Parameters:
+            generation (int): Generation the work was started for.
+
+        Returns:
+            bool: True if no newer search was started since.
+        """
+        return generation == self.generation
+
+    def _on_product_found(self, generation, product):
+        if self.is_current(generation):
+            self.product_found.emit(product)
+
+    def _on_search_finished(self, generation, product_count, fetched):
+        if self.is_current(generation):
+            self.search_finished.emit(product_count, fetched)
+
+    def _on_image_loaded(self, generation, index, image):
+        if self.is_current(generation):
+            self.image_loaded.emit(index, image)
+
+    def _on_image_failed(self, generation, index):
+        if self.is_current(generation):
+            self.image_failed.emit(index)
@@ -0,0 +1,226 @@
+import sys
+import time
+from contextlib import contextmanager
+
+# Size screenshots are reduced to before two of them are compared, and the grey level
+# difference from which a pixel counts as changed (ignores JPEG noise and font smoothing)
+SIGNATURE_SIZE = (64, 36)
+PIXEL_TOLERANCE = 16
+
+
+class StepTimer:
+    """
+    Records how long each named step of an automation run takes, so slow steps show up.
+    """
+
+    def __init__(self, label="RPA", verbose=True):
+        """
+        Initializes the timer.
+
+        Parameters:
+            label (str): Prefix of the printed timings (default: "RPA").
+            verbose (bool): Print each step when it ends (default: True).
+        """
+        self.label = label
+        self.verbose = verbose
+        self.steps = []  # (step name, seconds) in the order the steps ended
+
+    @contextmanager
+    def step(self, name):
+        """
+        Times the body of a `with` block as one step.
+
+        Parameters:
+            name (str): Name of the step.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self.steps.append((name, seconds))
+            if self.verbose:
+                print(f"[{self.label}] {name}: {seconds:.2f} s")
+
+    def reset(self):
+        """
+        Forgets the recorded steps.
+        """
+        self.steps = []
+
+    def total(self):
+        """
+        Returns:
+            float: Seconds spent in all recorded steps.
+        """
+        return sum(seconds for _, seconds in self.steps)
+
+    def report(self):
+        """
+        Returns:
+            str: One line per step with its share of the total, followed by the total.
+        """
+        total = self.total()
+        lines = [
+            f"{name:<24}{seconds:>8.2f} s{seconds / total * 100 if total else 0:>6.0f}%"
+            for name, seconds in self.steps
+        ]
+        lines.append(f"{'total':<24}{total:>8.2f} s")
+        return "\n".join(lines)
+
+
+def wait_until(condition, timeout=10.0, interval=0.05, max_interval=0.5, backoff=1.5):
+    """
+    Polls a condition until it returns a truthy value or the timeout expires.
+
+    The first polls are close together so fast UI changes are noticed almost immediately;
+    the interval then grows by `backoff` up to `max_interval`, so slow pages are not
+    polled (and screenshotted) more often than needed.
+
+    Parameters:
+        condition (callable): Called without arguments; its first truthy result is returned.
+        timeout (float): Maximum number of seconds to wait (default: 10).
+        interval (float): Seconds between the first two polls (default: 0.05).
+        max_interval (float): Longest pause between two polls (default: 0.5).
+        backoff (float): Factor applied to the interval after each poll (default: 1.5).
+
+    Returns:
+        The truthy value returned by `condition`, or None if the timeout expired.
+    """
+    deadline = time.monotonic() + timeout
+
+    while True:
+        result = condition()
+        if result:
+            return result
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+
+        time.sleep(min(interval, remaining))
+        interval = min(interval * backoff, max_interval)
+
+
+def screen_signature(region=None):
+    """
+    Takes a screenshot and reduces it to a small greyscale thumbnail for cheap comparisons.
+
+    Parameters:
+        region (tuple): (left, top, width, height) of the area to capture, or None for the whole screen.
+
+    Returns:
+        bytes: The grey levels of the thumbnail pixels.
+    """
+    import pyautogui  # Imported on use so wait_until and StepTimer work without a display
+
+    screenshot = pyautogui.screenshot(region=region)
+    return screenshot.convert("L").resize(SIGNATURE_SIZE).tobytes()
+
+
+def changed_fraction(signature, other):
+    """
+    Compares two screen signatures.
+
+    Parameters:
+        signature (bytes): Signature returned by `screen_signature`.
+        other (bytes): Signature of the same region at another moment.
+
+    Returns:
+        float: Fraction (0 to 1) of the pixels whose grey level changed noticeably.
+    """
+    changed = sum(1 for a, b in zip(signature, other) if abs(a - b) > PIXEL_TOLERANCE)
+    return changed / max(len(signature), 1)
+
+
+def region_changed(baseline, region=None, threshold=0.02):
+    """
+    Builds a condition that is met once a screen region differs from a previous capture.
+
+    Parameters:
+        baseline (bytes): Signature of the region before the action that should change it.
+        region (tuple): (left, top, width, height) of the area to watch, or None for the whole screen.
+        threshold (float): Fraction of changed pixels that counts as a change (default: 0.02).
+
+    Returns:
+        callable: Condition for `wait_until`.
+    """
+    return lambda: changed_fraction(baseline, screen_signature(region)) >= threshold
+
+
+def region_stable(region=None, settle=0.3, threshold=0.005):
+    """
+    Builds a condition that is met once a screen region has stopped changing, i.e. it looked
+    the same at every poll for at least `settle` seconds (page rendered, scrolling finished).
+
+    Parameters:
+        region (tuple): (left, top, width, height) of the area to watch, or None for the whole screen.
+        settle (float): Seconds the region must stay unchanged (default: 0.3).
+        threshold (float): Fraction of changed pixels still considered unchanged (default: 0.005).
+
+    Returns:
+        callable: Condition for `wait_until`.
+    """
+    state = {"signature": None, "since": None}
+
+    def condition():
+        signature = screen_signature(region)
+        now = time.monotonic()
+
+        if state["signature"] is None or changed_fraction(state["signature"], signature) > threshold:
+            state["signature"], state["since"] = signature, now
+            return False
+
+        return now - state["since"] >= settle
+
+    return condition
+
+
+def template_visible(image_path, confidence=0.7, region=None):
+    """
+    Builds a condition that is met once a reference image is visible on the screen.
+
+    Parameters:
+        image_path (str): Path to the reference image.
+        confidence (float): Matching confidence level (default: 0.7).
+        region (tuple): (left, top, width, height) of the area to search, or None for the whole screen.
+
+    Returns:
+        callable: Condition for `wait_until`, returning the center of the match or None.
+    """
+    import pyautogui
+
+    def condition():
+        try:
+            return pyautogui.locateCenterOnScreen(image_path, confidence=confidence, region=region)
+        except pyautogui.ImageNotFoundException:  # Raised instead of returning None by recent versions
+            return None
+
+    return condition
+
+
+def paste_text(text):
+    """
+    Types text by pasting it from the clipboard, which takes the same time whatever the
+    length of the text and also works for characters typewrite cannot type (e.g. accents).
+    The previous clipboard content is restored afterwards.
+
+    Falls back to typing the characters without delay if pyperclip is not installed or
+    no clipboard is available.
+
+    Parameters:
+        text (str): The text to type in the focused field.
+    """
+    import pyautogui
+
+    try:
+        import pyperclip
+
+        previous = pyperclip.paste()
+        pyperclip.copy(text)
+        pyautogui.hotkey("command" if sys.platform == "darwin" else "ctrl", "v")
+        time.sleep(0.05)  # Let the target application read the clipboard before restoring it
+        pyperclip.copy(previous)
+    except Exception as e:  # ImportError or pyperclip.PyperclipException
+        print(f"Clipboard unavailable, typing instead: {e}")
+        pyautogui.write(text, interval=0)
@@ -1,6 +1,16 @@
+import codecs
+import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
 import requests
-from bs4 import BeautifulSoup
+
+from http_session import create_session
+from lxml_parser import LXML_AVAILABLE, LxmlProductParser
+from product_record import ProductRecord
+from selector_profiles import get_profile
+from stream_parser import StreamingProductParser
 
 
 class WebScrapper:
@@ -8,33 +18,86 @@ class WebScrapper:
     A class for scraping product details (name, image, price) from Amazon search results.
     """
 
-    def __init__(self):
+    # Available parsing engines: "soup" is the reference BeautifulSoup implementation,
+    # "stream" walks the document once with an event-based parser and stops early,
+    # "lxml" uses the C-accelerated lxml parser, and "auto" picks "lxml" when it is
+    # installed and falls back to "soup" otherwise.
+    PARSER_ENGINES = ("auto", "soup", "stream", "lxml")
+
+    # Version of the product extraction logic. Bump it whenever parsing output changes,
+    # so entries of the parsed-product cache produced by older code are not reused.
+    PARSER_VERSION = 4
+
+    # Size of the chunks fed to the streaming parser between early-termination checks.
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    # Numbered items of the pagination strip at the bottom of the results page.
+    PAGE_NUMBER_PATTERN = re.compile(r'class="[^"]*\bs-pagination-item\b[^"]*"[^>]*>\s*(\d+)\s*<')
+
+    def __init__(self, parser_engine="auto", profile="amazon.es", base_url=None, pool_size=10, connect_timeout=5,
+                 read_timeout=15, max_retries=3, backoff_factor=0.5, cache=None, product_cache=None):
         """
-        Initializes the WebScrapper with the base URL and headers.
+        Initializes the WebScrapper with the base URL, headers and a pooled HTTP session.
+
+        Parameters:
+            parser_engine (str): Engine used by `parse_products`, one of PARSER_ENGINES (default: "auto").
+            profile (str | SelectorProfile): Selector profile of the Amazon locale to scrape (default: "amazon.es").
+            base_url (str): URL of the search endpoint (default: the profile's search URL).
+            pool_size (int): Maximum number of keep-alive connections per host (default: 10).
+            connect_timeout (float): Seconds to wait for a connection to be established (default: 5).
+            read_timeout (float): Seconds to wait between bytes received from the server (default: 15).
+            max_retries (int): Retries on connection errors and 5xx/503 throttling responses (default: 3).
+            backoff_factor (float): Exponential backoff factor between retries, in seconds (default: 0.5).
+            cache (ResponseCache): On-disk cache for search results pages (default: no caching).
+            product_cache (ParsedProductCache): Cache of parsed product lists (default: no caching).
         """
-        self.base_url = "https://www.amazon.es/s"
+        if parser_engine not in self.PARSER_ENGINES:
+            raise ValueError(f"Unknown parser engine: {parser_engine!r}. Expected one of {self.PARSER_ENGINES}.")
+
+        if parser_engine == "auto":
+            parser_engine = "lxml" if LXML_AVAILABLE else "soup"
+        elif parser_engine == "lxml" and not LXML_AVAILABLE:
+            raise ValueError("The lxml parser engine requires the 'lxml' package.")
+
+        self.parser_engine = parser_engine
+        self.profile = get_profile(profile)  # Selectors and patterns, compiled once
+        self._lxml_parser = LxmlProductParser(self.profile, self._is_valid_product) if parser_engine == "lxml" else None
+        self.last_stream_stats = {}  # Counters of the last `stream_search_results` call
+        self.base_url = base_url or self.profile.base_url
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept-Language": "en-US,en;q=0.9",
+            "Accept-Language": self.profile.accept_language,
         }
+        self.timeout = (connect_timeout, read_timeout)
+        self.cache = cache
+        self.product_cache = product_cache
+
+        # Shared session, also used by the UI to download product images over the same connections
+        self.session = create_session(pool_size, max_retries, backoff_factor, headers=self.headers)
 
-    def fetch_search_results(self, query):
+    def close(self):
+        """
+        Closes the pooled HTTP session and its keep-alive connections.
+        """
+        self.session.close()
+
+    def fetch_search_results(self, query, page=1):
         """
         Fetches the HTML content of the Amazon search results page for the given query.
 
         Parameters:
             query (str): The search term.
+            page (int): Number of the results page to fetch (default: 1).
 
         Returns:
             str: HTML content of the search results page, or an empty string on failure.
         """
         params = {"k": query}  # Query parameter for the search
+        if page > 1:
+            params["page"] = page
 
         try:
-            response = requests.get(self.base_url, headers=self.headers, params=params)
-            response.raise_for_status()
-
-            return response.text
+            return self._get_page(params)
 
         except requests.exceptions.Timeout:
             print("Request timed out. Please check your network connection.")
@@ -47,6 +110,253 @@ class WebScrapper:
 
         return ""
 
+    def stream_search_results(self, query, max_results=10, on_product=None, is_cancelled=None, stats=None):
+        """
+        Fetches the search results page for the given query and parses it while it downloads.
+
+        The response body is read in chunks, decoded incrementally and fed to the streaming
+        parser. The connection is closed as soon as `max_results` products have been parsed,
+        so the rest of the page is never transferred. Counters of the call are stored in
+        `last_stream_stats`: bytes_read (bytes received over the network, before HTTP
+        decompression), bytes_decoded (bytes of the decompressed page), time_to_first_product,
+        total_time and closed_early. A page read to the end is stored in the response cache;
+        a page closed early is not, since only part of it was downloaded.
+
+        Parameters:
+            query (str): The search term.
+            max_results (int): Maximum number of products to extract.
+            on_product (callable): Called with each ProductRecord as soon as it is parsed (optional).
+            is_cancelled (callable): Polled between chunks; the download stops when it returns True (optional).
+            stats (dict): Filled with the counters of this call, which a concurrent call may replace
+                          in `last_stream_stats` before the caller reads them (optional).
+
+        Returns:
+            list: A list of ProductRecord objects (name, image, price, price_cents, currency, asin).
+        """
+        params = {"k": query}  # Query parameter for the search
+        parser = StreamingProductParser(self.profile, self._is_valid_product, max_results, on_product)
+        stats = {} if stats is None else stats
+        stats.update({
+            "bytes_read": 0,
+            "bytes_decoded": 0,
+            "time_to_first_product": None,
+            "total_time": None,
+            "closed_early": False,
+        })
+        self.last_stream_stats = stats
+        start_time = time.perf_counter()
+
+        cached_page = self._cached_page(params)
+        if cached_page is not None:
+            products = self._parse_products_stream(cached_page, max_results)
+            stats["bytes_decoded"] = len(cached_page.encode("utf-8"))
+            if on_product is not None:
+                for product in products:
+                    on_product(product)
+            stats["total_time"] = time.perf_counter() - start_time
+            stats["time_to_first_product"] = stats["total_time"] if products else None
+            return products
+
+        try:
+            with self.session.get(self.base_url, params=params, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+
+                decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+                page_parts = [] if self.cache is not None else None  # Kept to cache a fully read page
+
+                for chunk in response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+                    # iter_content yields decompressed data; the raw stream counts the bytes on the wire
+                    stats["bytes_read"] = response.raw.tell()
+                    stats["bytes_decoded"] += len(chunk)
+                    text = decoder.decode(chunk)
+                    parser.feed(text)
+                    if page_parts is not None:
+                        page_parts.append(text)
+
+                    if parser.products and stats["time_to_first_product"] is None:
+                        stats["time_to_first_product"] = time.perf_counter() - start_time
+
+                    # Stop downloading once enough products have been parsed, or the caller gave up
+                    if parser.done or (is_cancelled is not None and is_cancelled()):
+                        stats["closed_early"] = True
+                        break
+                else:
+                    text = decoder.decode(b"", final=True)
+                    parser.feed(text)
+                    parser.close()
+
+                    if page_parts is not None:
+                        page_parts.append(text)
+                        key = self.cache.make_key(self.base_url, params, self.headers.get("Accept-Language"))
+                        self.cache.store(key, response, body="".join(page_parts))
+
+        except requests.exceptions.Timeout:
+            print("Request timed out. Please check your network connection.")
+
+        except requests.exceptions.TooManyRedirects:
+            print("Too many redirects. Check the URL and try again.")
+
+        except requests.exceptions.RequestException as e:
+            print(f"Failed to fetch Amazon page: {e}")
+
+        except Exception as e:
+            print(f"Error while parsing product elements: {e}")
+
+        if parser.products and stats["time_to_first_product"] is None:
+            stats["time_to_first_product"] = time.perf_counter() - start_time
+        stats["total_time"] = time.perf_counter() - start_time
+
+        if not parser.products:
+            print("No valid products found.")
+
+        return parser.products
+
+    # This helper method is intended for internal use within the class.
+    # It downloads a search results page, going through the response cache when one is configured.
+    def _get_page(self, params):
+        """
+        Gets the HTML content of the search results page for the given query parameters.
+
+        Parameters:
+            params (dict): Query parameters of the search.
+
+        Returns:
+            str: HTML content of the search results page.
+
+        Raises:
+            requests.exceptions.RequestException: If the page could not be downloaded.
+        """
+        if self.cache is None:
+            response = self.session.get(self.base_url, params=params, timeout=self.timeout)
+            response.raise_for_status()
+            return response.text
+
+        key = self.cache.make_key(self.base_url, params, self.headers.get("Accept-Language"))
+        entry, is_fresh = self.cache.lookup(key)
+
+        if is_fresh:
+            return entry["body"]
+
+        # Revalidate an expired entry with a conditional request when it has validators
+        conditional_headers = self.cache.conditional_headers(entry) if entry else {}
+        response = self.session.get(self.base_url, params=params, headers=conditional_headers, timeout=self.timeout)
+
+        if response.status_code == 304:
+            if entry:
+                self.cache.refresh(key, entry)
+                return entry["body"]
+
+            # A 304 with nothing cached (e.g. from a misbehaving proxy) has no page to serve: fetch it
+            # again without validators and do not cache the answer
+            response = self.session.get(self.base_url, params=params, timeout=self.timeout)
+            response.raise_for_status()
+            if response.status_code == 304:
+                raise requests.exceptions.HTTPError("304 Not Modified with no cached page", response=response)
+            return response.text
+
+        response.raise_for_status()
+        self.cache.store(key, response)
+        return response.text
+
+    # This helper method is intended for internal use within the class.
+    # It returns a fresh cached page without any request, or None.
+    def _cached_page(self, params):
+        if self.cache is None:
+            return None
+
+        key = self.cache.make_key(self.base_url, params, self.headers.get("Accept-Language"))
+        entry, is_fresh = self.cache.lookup(key)
+        return entry["body"] if is_fresh else None
+
+    def crawl_search_pages(self, query, max_results=100, max_pages=None, workers=4, sink=None):
+        """
+        Crawls every results page for the given query and yields unique products in page order.
+
+        The first page is fetched to discover the number of pages, then pages 2..N are fetched
+        and parsed concurrently. Products are de-duplicated by ASIN across pages and the crawl
+        stops as soon as `max_results` products have been yielded.
+
+        Parameters:
+            query (str): The search term.
+            max_results (int): Maximum number of products to yield across all pages (default: 100).
+            max_pages (int): Maximum number of pages to crawl (default: all pages).
+            workers (int): Number of pages fetched in parallel (default: 4).
+            sink (ProductExportSink): Export sink every yielded product is also written to (optional).
+
+        Yields:
+            ProductRecord: Product details (name, image, price, price_cents, currency, asin).
+        """
+        first_page = self.fetch_search_results(query)
+        if not first_page:
+            return
+
+        page_count = self._extract_page_count(first_page)
+        if max_pages:
+            page_count = min(page_count, max_pages)
+
+        seen_keys = set()
+        yielded = 0
+
+        def unique_products(page_products):
+            nonlocal yielded
+            for product in page_products:
+                key = product.asin or (product.name, product.image)
+                if key in seen_keys:
+                    continue
+
+                seen_keys.add(key)
+                yielded += 1
+
+                if sink is not None:
+                    sink.write(product, query)
+                yield product
+
+                if yielded >= max_results:
+                    return
+
+        yield from unique_products(self.parse_products(first_page, max_results))
+
+        if yielded >= max_results or page_count <= 1:
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._fetch_and_parse_page, query, page, max_results)
+                for page in range(2, page_count + 1)
+            ]
+
+            try:
+                # Consume pages in order so the merged stream keeps Amazon's ranking
+                for future in futures:
+                    yield from unique_products(future.result())
+                    if yielded >= max_results:
+                        break
+
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    # This helper method is intended for internal use within the class.
+    # It fetches and parses a single results page inside a crawler worker thread.
+    def _fetch_and_parse_page(self, query, page, max_results):
+        html_content = self.fetch_search_results(query, page)
+        return self.parse_products(html_content, max_results) if html_content else []
+
+    # This helper method is intended for internal use within the class.
+    # It reads the highest page number from the pagination strip of a results page.
+    def _extract_page_count(self, html_content):
+        """
+        Extracts the number of results pages from the pagination strip.
+
+        Parameters:
+            html_content (str): HTML content of a search results page.
+
+        Returns:
+            int: The number of pages, or 1 if the page has no pagination.
+        """
+        page_numbers = [int(number) for number in self.PAGE_NUMBER_PATTERN.findall(html_content)]
+        return max(page_numbers, default=1)
+
     def parse_products(self, html_content, max_results=10):
         """
         Parses the HTML content to extract product details.
@@ -56,15 +366,94 @@ class WebScrapper:
             max_results (int): Maximum number of products to extract.
 
         Returns:
-            list: A list of dictionaries with product details (name, image, price).
+            list: A list of ProductRecord objects (name, image, price, price_cents, currency, asin).
         """
         if not html_content:
             print("No HTML content provided for parsing.")
             return []
 
+        cache_key = None
+        if self.product_cache is not None:
+            cache_key = self.product_cache.make_key(
+                html_content, self.PARSER_VERSION, self.parser_engine, max_results, self.profile.name
+            )
+            products = self.product_cache.get(cache_key)
+            if products is not None:
+                return products
+
+        if self.parser_engine == "stream":
+            products = self._parse_products_stream(html_content, max_results)
+        elif self.parser_engine == "lxml":
+            products = self._lxml_parser.parse(html_content, max_results)
+        else:
+            products = self._parse_products_soup(html_content, max_results)
+
+        if cache_key is not None:
+            self.product_cache.put(cache_key, products)
+
+        if not products:
+            print("No valid products found.")
+
+        return products
+
+    def parse_many(self, documents, max_results=10, workers=None, chunksize=None, ordered=True):
+        """
+        Parses many search results pages in parallel across processes.
+
+        Documents are sent to a process pool in chunks. Pass file paths (as `pathlib.Path` or
+        other `os.PathLike` objects) instead of HTML strings for large corpora: each worker
+        then reads the file itself, so megabytes of HTML are never pickled between processes.
+
+        Parameters:
+            documents (iterable): HTML strings and/or `os.PathLike` paths to saved pages.
+            max_results (int): Maximum number of products to extract per page.
+            workers (int): Number of worker processes (default: number of CPUs).
+            chunksize (int): Documents sent to a worker at once (default: chosen from the batch size).
+            ordered (bool): Yield results in submission order (True) or as they complete (False).
+
+        Yields:
+            tuple: (index of the document, list of ProductRecord objects).
+        """
+        indexed_documents = list(enumerate(documents))
+        if not indexed_documents:
+            return
+
+        workers = workers or os.cpu_count() or 1
+        if chunksize is None:
+            # A few chunks per worker balances the load without paying per-document IPC
+            chunksize = max(1, len(indexed_documents) // (workers * 4))
+
+        chunks = [
+            indexed_documents[start:start + chunksize]
+            for start in range(0, len(indexed_documents), chunksize)
+        ]
+        job = (max_results, self.parser_engine, self.profile)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_parse_document_chunk, chunk, *job) for chunk in chunks]
+
+            for future in (futures if ordered else as_completed(futures)):
+                yield from future.result()
+
+    # This helper method is intended for internal use within the class.
+    # It is the reference implementation: it builds the full BeautifulSoup tree of the page.
+    def _parse_products_soup(self, html_content, max_results):
+        """
+        Parses the HTML content with BeautifulSoup to extract product details.
+
+        Parameters:
+            html_content (str): HTML content of the search results page.
+            max_results (int): Maximum number of products to extract.
+
+        Returns:
+            list: A list of ProductRecord objects (name, image, price, price_cents, currency, asin).
+        """
         try:
+            # Imported here so startup does not pay for bs4 when another engine is used
+            from bs4 import BeautifulSoup
+
             soup = BeautifulSoup(html_content, "html.parser")
-            product_elements = soup.select(".s-main-slot .s-result-item")
+            product_elements = soup.select(self.profile.result_selector)
 
         except Exception as e:
             print(f"Error while parsing product elements: {e}")
@@ -74,20 +463,17 @@ class WebScrapper:
 
         for product_element in product_elements:
             try:
-                # Extract product details using helper methods
+                # Extract the image and name in a single scan of the serialized card
                 product_html = str(product_element)
 
-                product_image = self._extract_image(product_html)
-                product_name = self._extract_name(product_html)
+                product_image, product_name = self.profile.extract_image_and_name(product_html)
                 product_price = self.extract_price(product_element)
 
                 # Validate and add product to the list
                 if self._is_valid_product(product_name, product_image, product_price):
-                    products.append({
-                        "name": product_name,
-                        "image": product_image,
-                        "price": product_price,
-                    })
+                    products.append(ProductRecord(
+                        product_name, product_image, product_price, product_element.get("data-asin", ""),
+                    ))
 
                 # Stop collecting after reaching the max results limit
                 if len(products) >= max_results:
@@ -97,61 +483,36 @@ class WebScrapper:
                 print(f"Error processing product: {e}")
                 continue
 
-        if not products:
-            print("No valid products found.")
-
         return products
 
     # This helper method is intended for internal use within the class.
-    # It uses RegEx to extract a specific value from the provided text.
-    # Since it doesn't rely on self or instance-specific data, it's defined as static.
-    @staticmethod
-    def _extract_with_regex(pattern, text):
-        """
-        Extracts a value from text using the provided RegEx pattern.
-
-        Parameters:
-            pattern (str): RegEx pattern to match.
-            text (str): The text to search.
-
-        Returns:
-            str: Matched value, or an empty string if no match is found.
-        """
-        try:
-            match = re.search(pattern, text)
-            return match.group(1) if match else ""
-
-        except re.error as e:
-            print(f"RegEx error: {e}")
-            return ""
-
-    # This helper method is intended for internal use within the class.
-    # It extracts the product image URL using RegEx.
-    def _extract_image(self, product_html):
+    # It walks the document once with an event-based parser and stops after `max_results` products.
+    def _parse_products_stream(self, html_content, max_results):
         """
-        Extracts the product image URL using RegEx.
+        Parses the HTML content in a single streaming pass to extract product details.
 
         Parameters:
-            product_html (str): HTML content of a single product.
+            html_content (str): HTML content of the search results page.
+            max_results (int): Maximum number of products to extract.
 
         Returns:
-            str: Image URL, or an empty string if not found.
+            list: A list of ProductRecord objects (name, image, price, price_cents, currency, asin).
         """
-        return self._extract_with_regex(r'<img.*?src="(.*?)"', product_html)
+        parser = StreamingProductParser(self.profile, self._is_valid_product, max_results)
 
-    # This helper method is intended for internal use within the class.
-    # It extracts the product name using RegEx.
-    def _extract_name(self, product_html):
-        """
-        Extracts the product name using RegEx.
+        try:
+            # Feed the document in chunks so parsing can stop as soon as enough products are found
+            for start in range(0, len(html_content), self.STREAM_CHUNK_SIZE):
+                parser.feed(html_content[start:start + self.STREAM_CHUNK_SIZE])
+                if parser.done:
+                    break
+            else:
+                parser.close()
 
-        Parameters:
-            product_html (str): HTML content of a single product.
+        except Exception as e:
+            print(f"Error while parsing product elements: {e}")
 
-        Returns:
-            str: Product name, or an empty string if not found.
-        """
-        return self._extract_with_regex(r'<img.*?alt="(.*?)"', product_html)
+        return parser.products
 
     # This helper method is intended for internal use within the class.
     # It extracts the product price using BeautifulSoup and RegEx.
@@ -165,14 +526,14 @@ class WebScrapper:
         Returns:
             str: Product price with the currency symbol, or an empty string if not found.
         """
-        price_tag = product_element.select_one(".a-price")
+        price_tag = product_element.select_one(self.profile.price_selector)
 
         if not price_tag:
             return ""
 
         try:
             price_text = price_tag.get_text()  # Extract price text
-            return self._extract_with_regex(r"(\d+[.,]?\d*)[€]?", price_text) + "€"
+            return self.profile.format_price(price_text)
 
         except Exception as e:
             print(f"Error extracting price: {e}")
@@ -180,9 +541,7 @@ class WebScrapper:
 
     # This helper method is intended for internal use within the class.
     # It validates a product by ensuring all necessary fields are present.
-    # Since it doesn't rely on self or instance-specific data, it's defined as static.
-    @staticmethod
-    def _is_valid_product(product_name, product_image, product_price):
+    def _is_valid_product(self, product_name, product_image, product_price):
         """
         Validates a product by ensuring it has all required fields and is not a sponsored ad.
 
@@ -198,5 +557,49 @@ class WebScrapper:
             bool(product_name.strip()) and
             bool(product_image.strip()) and
             bool(product_price.strip()) and
-            "Anuncio patrocinado" not in product_name
-        )
\ No newline at end of file
+            not self.profile.is_sponsored(product_name)
+        )
+
+
+# Scrapers of a worker process (`parse_many`, `AsyncScraper`), keyed by (parser engine, profile name).
+_worker_scrapers = {}
+
+
+def _worker_scraper(parser_engine, profile):
+    """
+    Returns the WebScrapper used inside a parsing worker process, created once per process and profile.
+    """
+    key = (parser_engine, profile.name)
+    if key not in _worker_scrapers:
+        _worker_scrapers[key] = WebScrapper(parser_engine, profile=profile)
+    return _worker_scrapers[key]
+
+
+def _parse_document_chunk(chunk, max_results, parser_engine, profile):
+    """
+    Parses a chunk of documents inside a `parse_many` worker process.
+
+    Parameters:
+        chunk (list): Tuples of (index, HTML string or path to a saved page).
+        max_results (int): Maximum number of products to extract per page.
+        parser_engine (str): Engine used to parse the pages.
+        profile (SelectorProfile): Selector profile of the pages.
+
+    Returns:
+        list: Tuples of (index, list of ProductRecord objects).
+    """
+    scraper = _worker_scraper(parser_engine, profile)
+    results = []
+
+    for index, document in chunk:
+        if isinstance(document, os.PathLike):
+            try:
+                with open(document, encoding="utf-8") as html_file:
+                    document = html_file.read()
+            except OSError as e:
+                print(f"Failed to read {document}: {e}")
+                document = ""
+
+        results.append((index, scraper.parse_products(document, max_results)))
+
+    return results
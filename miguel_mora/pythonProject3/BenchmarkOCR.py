@@ -0,0 +1,112 @@
+import argparse
+import glob
+import os
+import tempfile
+import time
+
+from PIL import Image
+import pytesseract
+
+from CacheOCR import CacheOCR
+from MotorOCR import MOTORES, TESSEROCR_DISPONIBLE, crear_motor
+from ProcesadorOCR import IDIOMA, TESSERACT_CMD, ocr_capturas, preprocesar_imagen
+
+
+# El bucle anterior de RPA.realizar_ocr: captura a captura, guardando la imagen mejorada en disco
+# y volviéndola a abrir antes de pasarla a Tesseract
+def bucle_anterior(capturas):
+    if os.path.exists(TESSERACT_CMD):
+        pytesseract.pytesseract.tesseract_cmd = TESSERACT_CMD
+
+    textos = []
+    for captura in capturas:
+        with Image.open(captura) as imagen:
+            ruta_mejorada = captura.replace(".png", "_benchmark.png")
+            preprocesar_imagen(imagen).save(ruta_mejorada)
+        try:
+            textos.append(pytesseract.image_to_string(Image.open(ruta_mejorada), lang=IDIOMA))
+        finally:
+            os.remove(ruta_mejorada)
+    return textos
+
+
+# Devuelve el mejor tiempo de varias ejecuciones y el resultado de la última
+def medir(funcion, repeticiones):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+# Latencia por imagen de un motor: tiempo de creación y tiempo de cada llamada sobre una captura
+def latencia_por_imagen(nombre_motor, capturas, repeticiones):
+    imagenes = []
+    for captura in capturas:
+        with Image.open(captura) as imagen:
+            imagenes.append(preprocesar_imagen(imagen))
+
+    inicio = time.perf_counter()
+    motor = crear_motor(nombre_motor, IDIOMA)
+    creacion_ms = (time.perf_counter() - inicio) * 1000
+
+    latencias = []
+    try:
+        for _ in range(repeticiones):
+            for imagen in imagenes:
+                inicio = time.perf_counter()
+                motor.extraer_texto(imagen)
+                latencias.append((time.perf_counter() - inicio) * 1000)
+    finally:
+        motor.cerrar()
+
+    latencias.sort()
+    print(f"{motor.nombre:<14}{creacion_ms:>12.0f}{latencias[0]:>10.0f}{latencias[len(latencias) // 2]:>12.0f}"
+          f"{latencias[-1]:>10.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tiempo de OCR de las capturas: bucle secuencial frente al pool de procesos.")
+    parser.add_argument("--capturas", default="captura_productos_[0-9].png",
+                        help="Patrón de las capturas (por defecto: captura_productos_[0-9].png).")
+    parser.add_argument("--procesos", type=int, nargs="+", default=[1, 2, os.cpu_count() or 1],
+                        help="Números de procesos a probar (por defecto: 1, 2 y el número de núcleos).")
+    parser.add_argument("--motor", choices=MOTORES, default="auto",
+                        help="Motor OCR del pool de procesos (por defecto: auto, tesserocr si está instalado).")
+    parser.add_argument("--repeticiones", type=int, default=3, help="Ejecuciones por caso, se queda la mejor.")
+    args = parser.parse_args()
+
+    capturas = sorted(glob.glob(args.capturas))
+    if not capturas:
+        print(f"No hay capturas que coincidan con {args.capturas}")
+        return
+
+    print(f"{len(capturas)} capturas, {os.cpu_count()} núcleos")
+
+    referencia, textos_referencia = medir(lambda: bucle_anterior(capturas), args.repeticiones)
+    print(f"{'bucle anterior':<18}{referencia:>8.2f} s")
+
+    for num_procesos in sorted(set(args.procesos)):
+        segundos, textos = medir(lambda: ocr_capturas(capturas, num_procesos, motor=args.motor), args.repeticiones)
+        iguales = "mismo texto" if textos == textos_referencia else "TEXTO DISTINTO"
+        print(f"{f'{num_procesos} procesos':<18}{segundos:>8.2f} s{referencia / segundos:>7.1f}x  {iguales}")
+
+    # Ejecución repetida sobre las mismas capturas: la primera llena la caché y las siguientes aciertan
+    with tempfile.TemporaryDirectory() as carpeta_cache:
+        cache = CacheOCR(carpeta_cache)
+        fria, _ = medir(lambda: ocr_capturas(capturas, motor=args.motor, cache=cache), 1)
+        caliente, textos = medir(lambda: ocr_capturas(capturas, motor=args.motor, cache=cache), args.repeticiones)
+        iguales = "mismo texto" if textos == textos_referencia else "TEXTO DISTINTO"
+        print(f"{'caché vacía':<18}{fria:>8.2f} s")
+        print(f"{'caché llena':<18}{caliente:>8.2f} s{referencia / caliente:>7.0f}x  {iguales}, "
+              f"aciertos {cache.estadisticas()['tasa_aciertos']:.0%}")
+
+    # Latencia por imagen de cada motor instalado, en un solo proceso
+    print(f"\n{'motor':<14}{'creación ms':>12}{'mín ms':>10}{'mediana ms':>12}{'máx ms':>10}")
+    for nombre_motor in ("pytesseract", "tesserocr") if TESSEROCR_DISPONIBLE else ("pytesseract",):
+        latencia_por_imagen(nombre_motor, capturas, args.repeticiones)
+
+
+if __name__ == "__main__":
+    main()
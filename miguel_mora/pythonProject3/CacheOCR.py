@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+import threading
+
+from PIL import Image
+
+from FicherosCache import borrar_fichero, descartar_lru, escribir_atomico
+
+# Lado en píxeles de las celdas a las que se reduce la imagen antes de calcular el hash, y
+# diferencia de gris entre dos celdas vecinas por debajo de la cual se consideran iguales
+TAMANO_CELDA = 4
+TOLERANCIA = 8
+
+
+# Hash de diferencias (dHash) de una imagen: se reduce a una rejilla de celdas de `tamano_celda`
+# píxeles y cada celda se compara con su vecina de la derecha. La rejilla sigue el tamaño de la
+# imagen (no el 8x8 habitual) para que dos capturas que solo cambian en un precio no coincidan,
+# y las diferencias dentro de la tolerancia cuentan como iguales, así pequeñas variaciones de
+# renderizado no cambian el hash. Se compara de forma exacta, nunca por distancia: el ruido
+# cambia tantas celdas como un dígito distinto, y un fallo de caché sale más barato que un precio mal leído
+def hash_imagen(imagen, tamano_celda=TAMANO_CELDA, tolerancia=TOLERANCIA):
+    columnas = max(imagen.width // tamano_celda, 1)
+    filas = max(imagen.height // tamano_celda, 1)
+    rejilla = imagen.convert("L").resize((columnas + 1, filas), Image.BOX).tobytes()
+
+    signos = bytearray()
+    for inicio_fila in range(0, len(rejilla), columnas + 1):
+        fila = rejilla[inicio_fila:inicio_fila + columnas + 1]
+        signos.extend(
+            1 if izquierda - derecha > tolerancia else 2 if derecha - izquierda > tolerancia else 0
+            for izquierda, derecha in zip(fila, fila[1:])
+        )
+
+    resumen = hashlib.sha256(f"{imagen.width}x{imagen.height}|".encode("utf-8"))
+    resumen.update(signos)
+    return resumen.hexdigest()
+
+
+class CacheOCR:
+    # Caché en disco de textos reconocidos por OCR, con el hash perceptual de la captura más el
+    # motor, el idioma y el preprocesado como clave: una captura igual a una ya leída (misma
+    # búsqueda, misma página) no vuelve a pasar por Tesseract. Cada resultado es un fichero JSON;
+    # si la carpeta supera `max_bytes` se borran primero los usados hace más tiempo
+    def __init__(self, carpeta=os.path.join(".cache", "ocr"), max_bytes=20 * 1024 * 1024):
+        self.carpeta = carpeta
+        self.max_bytes = max_bytes
+        self.aciertos = 0
+        self.fallos = 0
+        self.descartes = 0
+        self._bloqueo = threading.Lock()
+
+        os.makedirs(self.carpeta, exist_ok=True)
+
+    # Clave de una llamada de OCR: la imagen y todo aquello de lo que dependa el resultado
+    @staticmethod
+    def clave(imagen, *contexto):
+        canonica = json.dumps([hash_imagen(imagen)] + [str(valor) for valor in contexto])
+        return hashlib.sha256(canonica.encode("utf-8")).hexdigest()
+
+    # Devuelve el resultado guardado para una clave, o None si no está en la caché
+    def obtener(self, clave):
+        ruta = self._ruta(clave)
+        try:
+            with open(ruta, "rb") as fichero:
+                resultado = json.loads(fichero.read())
+            os.utime(ruta)  # La fecha de modificación marca el último uso, para descartar por LRU
+        except (OSError, ValueError):
+            resultado = None
+
+        with self._bloqueo:
+            if resultado is None:
+                self.fallos += 1
+            else:
+                self.aciertos += 1
+
+        return resultado
+
+    # Guarda un resultado y descarta los antiguos si la carpeta supera el límite. Si no se puede
+    # escribir (disco lleno, carpeta de solo lectura) se avisa y el resultado no se guarda: el texto
+    # ya reconocido no se pierde por un fallo de la caché
+    def guardar(self, clave, resultado):
+        try:
+            escribir_atomico(self._ruta(clave), json.dumps(resultado).encode("utf-8"))
+            self._descartar_antiguos()
+        except OSError as e:
+            print(f"No se pudo guardar el resultado del OCR en la caché: {e}")
+
+    # Aciertos, fallos, descartes y porcentaje de consultas resueltas sin hacer OCR
+    def estadisticas(self):
+        with self._bloqueo:
+            consultas = self.aciertos + self.fallos
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "descartes": self.descartes,
+                "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+            }
+
+    # Borra todos los resultados guardados
+    def vaciar(self):
+        for nombre in os.listdir(self.carpeta):
+            if nombre.endswith(".json"):
+                borrar_fichero(os.path.join(self.carpeta, nombre))
+
+    def _ruta(self, clave):
+        return os.path.join(self.carpeta, f"{clave}.json")
+
+    # Borra los resultados usados hace más tiempo hasta que la carpeta quepa en `max_bytes`
+    def _descartar_antiguos(self):
+        descartes = descartar_lru(self.carpeta, ".json", self.max_bytes)
+
+        with self._bloqueo:
+            self.descartes += descartes
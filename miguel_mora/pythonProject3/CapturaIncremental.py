@@ -0,0 +1,129 @@
+import time
+from collections import Counter
+
+# Fracción de las filas solapadas que deben coincidir para aceptar un desplazamiento
+MIN_COINCIDENCIA = 0.9
+
+# Filas de la captura anterior que se añaden por encima de cada franja nueva, para que una línea
+# de texto cortada en el borde inferior de la captura anterior aparezca entera en la siguiente
+MARGEN = 40
+
+
+# Firma de cada fila de píxeles (en gris) de una captura: dos filas con la misma firma son idénticas
+def firmas_filas(imagen):
+    gris = imagen.convert("L")
+    datos = gris.tobytes()
+    return [hash(datos[inicio:inicio + gris.width]) for inicio in range(0, len(datos), gris.width)]
+
+
+# Fila en la que empieza la banda inferior que no se mueve con el scroll (la barra de tareas o la
+# zona de la región que queda fuera de la ventana): las últimas filas iguales en las dos capturas
+def inicio_pie_fijo(firmas_anterior, firmas_actual):
+    fila = min(len(firmas_anterior), len(firmas_actual))
+    while fila > 0 and firmas_anterior[fila - 1] == firmas_actual[fila - 1]:
+        fila -= 1
+    return fila
+
+
+# Fracción de filas que coinciden al superponer la captura actual desplazada `desplazamiento` filas.
+# Solo cuentan las filas que cambiaron respecto a la captura anterior: las cabeceras fijas y los
+# fondos lisos coinciden con cualquier desplazamiento y no dicen nada
+def _coincidencia(firmas_anterior, firmas_actual, desplazamiento):
+    pares = [
+        (firmas_anterior[desplazamiento + fila], firmas_actual[fila])
+        for fila in range(len(firmas_actual) - desplazamiento)
+        if firmas_actual[fila] != firmas_anterior[fila]
+    ]
+    if not pares:
+        return 0.0
+    return sum(anterior == actual for anterior, actual in pares) / len(pares)
+
+
+# Calcula cuántas filas ha subido el contenido entre dos capturas consecutivas. Cada fila única de
+# la captura anterior vota por el desplazamiento que la lleva a su posición en la actual (las filas
+# repetidas, como fondos lisos o separadores, no votan) y el más votado se confirma comparando todo
+# el solape. Devuelve (desplazamiento, fila donde acaba el contenido que se mueve); el desplazamiento
+# es 0 si la página no se ha movido, o None si no hay un solape reconocible
+def detectar_desplazamiento(firmas_anterior, firmas_actual, min_coincidencia=MIN_COINCIDENCIA):
+    iguales = sum(anterior == actual for anterior, actual in zip(firmas_anterior, firmas_actual))
+    if iguales >= min_coincidencia * len(firmas_actual):
+        return 0, len(firmas_actual)
+
+    fin = inicio_pie_fijo(firmas_anterior, firmas_actual)
+    firmas_anterior, firmas_actual = firmas_anterior[:fin], firmas_actual[:fin]
+
+    repeticiones = Counter(firmas_anterior)
+    posiciones = {firma: fila for fila, firma in enumerate(firmas_anterior) if repeticiones[firma] == 1}
+    votos = Counter(
+        posiciones[firma] - fila
+        for fila, firma in enumerate(firmas_actual)
+        if firma in posiciones and posiciones[firma] > fila
+    )
+
+    for desplazamiento, _ in votos.most_common(3):
+        if _coincidencia(firmas_anterior, firmas_actual, desplazamiento) >= min_coincidencia:
+            return desplazamiento, fin
+    return None, fin
+
+
+# Recorta de la captura actual solo el contenido que no se veía en la anterior (más un margen),
+# que está justo encima de la banda inferior fija
+def franja_nueva(captura, desplazamiento, fin_contenido, margen=MARGEN):
+    if desplazamiento is None:
+        return captura
+    return captura.crop((0, max(fin_contenido - desplazamiento - margen, 0), captura.width, fin_contenido))
+
+
+# Hace capturas de la región hasta que dos seguidas son iguales (la página terminó de moverse y
+# de pintarse) o se agota el tiempo. Devuelve la última captura y sus firmas
+def captura_estable(region, espera_max=2.0, intervalo=0.1):
+    import pyautogui  # Solo al capturar: el resto del módulo funciona con imágenes ya guardadas
+
+    limite = time.monotonic() + espera_max
+    captura = pyautogui.screenshot(region=region)
+    firmas = firmas_filas(captura)
+
+    while time.monotonic() < limite:
+        time.sleep(intervalo)
+        siguiente = pyautogui.screenshot(region=region)
+        firmas_siguiente = firmas_filas(siguiente)
+        if firmas_siguiente == firmas:
+            break
+        captura, firmas = siguiente, firmas_siguiente
+
+    return captura, firmas
+
+
+# Captura la región mientras se hace scroll, guardando de cada captura solo la franja nueva. Se deja
+# de hacer scroll en cuanto la página no cambia (final de la página) o tras `max_capturas` capturas.
+# Devuelve las rutas de las imágenes guardadas, listas para el OCR
+def capturar_incremental(region, paso_scroll=-800, max_capturas=3, espera_max=2.0, prefijo="./captura_productos"):
+    import pyautogui
+
+    rutas = []
+    firmas_anterior = None
+
+    for i in range(max_capturas):
+        captura, firmas = captura_estable(region, espera_max)
+
+        if firmas_anterior is None:
+            franja = captura
+        else:
+            desplazamiento, fin_contenido = detectar_desplazamiento(firmas_anterior, firmas)
+            if desplazamiento == 0:
+                print("La página ya no cambia, se termina de capturar.")
+                break
+            franja = franja_nueva(captura, desplazamiento, fin_contenido)
+            print(f"Desplazamiento detectado: {desplazamiento} filas" if desplazamiento is not None
+                  else "Sin solape con la captura anterior, se guarda entera")
+
+        ruta = f"{prefijo}_{i}.png"
+        franja.save(ruta)
+        rutas.append(ruta)
+        print(f"Captura de pantalla guardada como {ruta} ({franja.height} filas)")
+
+        firmas_anterior = firmas
+        if i < max_capturas - 1:
+            pyautogui.scroll(paso_scroll)
+
+    return rutas
@@ -0,0 +1,79 @@
+import csv
+import json
+import os
+import time
+
+
+class ExportadorProductos:
+    # Columnas que se escriben por cada producto
+    COLUMNAS = ("busqueda", "nombre", "precio", "precio_centimos", "moneda", "imagen_url")
+    FORMATOS = ("csv", "jsonl")
+
+    # Exporta productos a disco por lotes: se escriben cada `tamano_lote` productos o cada
+    # `intervalo_volcado` segundos, así la memoria no crece con el tamaño del scraping.
+    # Los ficheros se abren en modo añadir, de forma que varias ejecuciones alimentan el mismo fichero
+    def __init__(self, ruta, formato=None, tamano_lote=500, intervalo_volcado=5.0):
+        self.ruta = ruta
+        self.formato = formato or os.path.splitext(ruta)[1].lower().lstrip(".")
+        self.tamano_lote = tamano_lote
+        self.intervalo_volcado = intervalo_volcado
+        self.filas_escritas = 0
+
+        if self.formato not in self.FORMATOS:
+            raise ValueError(f"Formato de exportación desconocido: {self.formato!r}. Se espera uno de {self.FORMATOS}.")
+
+        self._pendientes = []
+        self._ultimo_volcado = time.monotonic()
+
+        escribir_cabecera = not os.path.exists(ruta) or os.path.getsize(ruta) == 0
+        self._fichero = open(ruta, "a", encoding="utf-8", newline="")
+        self._escritor_csv = None
+
+        if self.formato == "csv":
+            self._escritor_csv = csv.DictWriter(self._fichero, fieldnames=self.COLUMNAS)
+            if escribir_cabecera:
+                self._escritor_csv.writeheader()
+
+    # Añade un producto al lote pendiente y lo vuelca a disco si está lleno o es antiguo
+    def escribir(self, producto, busqueda=""):
+        self._pendientes.append({
+            "busqueda": busqueda,
+            "nombre": producto.nombre,
+            "precio": producto.precio,
+            "precio_centimos": producto.precio_centimos,
+            "moneda": producto.moneda,
+            "imagen_url": producto.imagen_url,
+        })
+
+        if (len(self._pendientes) >= self.tamano_lote
+                or time.monotonic() - self._ultimo_volcado >= self.intervalo_volcado):
+            self.volcar()
+
+    # Escribe en disco todos los productos pendientes
+    def volcar(self):
+        self._ultimo_volcado = time.monotonic()
+        if not self._pendientes:
+            return
+
+        filas, self._pendientes = self._pendientes, []
+
+        if self._escritor_csv:
+            self._escritor_csv.writerows(filas)
+        else:
+            self._fichero.writelines(json.dumps(fila, ensure_ascii=False) + "\n" for fila in filas)
+
+        self._fichero.flush()
+        self.filas_escritas += len(filas)
+
+    # Vuelca lo pendiente y cierra el fichero
+    def cerrar(self):
+        if self._fichero.closed:
+            return
+        self.volcar()
+        self._fichero.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
@@ -0,0 +1,49 @@
+import os
+import threading
+
+
+# Escribe un fichero de caché de forma atómica: primero en un temporal y luego se renombra, para que
+# nadie lea una entrada a medias. Si falla, no deja el temporal y relanza el OSError
+def escribir_atomico(ruta, datos):
+    temporal = f"{ruta}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temporal, "wb") as fichero:
+            fichero.write(datos)
+        os.replace(temporal, ruta)
+    except OSError:
+        borrar_fichero(temporal)
+        raise
+
+
+# Borra un fichero de caché, ignorando los que ya no existen o no se pueden borrar
+def borrar_fichero(ruta):
+    try:
+        os.remove(ruta)
+    except OSError:
+        pass
+
+
+# Borra las entradas usadas hace más tiempo hasta que la carpeta quepa en `max_bytes`. Las entradas
+# son los ficheros que acaban en `extension` y su fecha de modificación marca el último uso (quien
+# las lee la actualiza con os.utime). Devuelve cuántas entradas se han borrado
+def descartar_lru(carpeta, extension, max_bytes, borrar=borrar_fichero):
+    entradas = []
+    total = 0
+
+    with os.scandir(carpeta) as ficheros:
+        for fichero in ficheros:
+            if fichero.name.endswith(extension):
+                datos = fichero.stat()
+                entradas.append((datos.st_mtime, datos.st_size, fichero.path))
+                total += datos.st_size
+
+    descartadas = 0
+    for _, tamano, ruta in sorted(entradas):
+        if total <= max_bytes:
+            break
+
+        borrar(ruta)
+        total -= tamano
+        descartadas += 1
+
+    return descartadas
@@ -1,12 +1,10 @@
-from tkinter import Scale
-
 from PyQt5.QtWidgets import QMainWindow, QWidget, QPushButton, QVBoxLayout, QMessageBox, QDesktopWidget
 from PyQt5.QtCore import Qt
-import pytesseract
-from RPA import RPA
-from Scrape import Scrape
 from view.Vista import Vista
 
+# RPA (pyautogui, pytesseract) y Scrape (playwright) se importan al pulsar su botón,
+# así la ventana arranca sin cargar módulos que quizá no se usen
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -36,6 +34,8 @@ class MainWindow(QMainWindow):
         central_widget.setLayout(layout)
 
     def on_click_RPA(self):
+        from RPA import RPA
+
         rpa = RPA()
 
         # Realizar capturas y OCR
@@ -53,6 +53,8 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Sin datos", "No se encontraron productos en las capturas.")
 
     def on_click_Scrape(self):
+        from Scrape import Scrape
+
         scrape = Scrape()
         data = scrape.abrir_navegador_y_extraer()
 
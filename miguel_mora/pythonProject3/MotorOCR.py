@@ -0,0 +1,75 @@
+import importlib.util
+import os
+
+# tesserocr enlaza directamente con la librería de Tesseract; es opcional y sin él se usa pytesseract
+TESSEROCR_DISPONIBLE = importlib.util.find_spec("tesserocr") is not None
+
+MOTORES = ("auto", "tesserocr", "pytesseract")
+
+# Ruta de Tesseract en Windows; en otros sistemas se usa el que esté en el PATH
+TESSERACT_CMD = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
+
+
+class MotorPytesseract:
+    nombre = "pytesseract"
+
+    # OCR con pytesseract: cada imagen lanza el ejecutable de tesseract, que escribe ficheros
+    # temporales y vuelve a cargar el modelo del idioma
+    def __init__(self, idioma="spa", tesseract_cmd=TESSERACT_CMD):
+        import pytesseract
+
+        if tesseract_cmd and os.path.exists(tesseract_cmd):
+            pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+
+        self._pytesseract = pytesseract
+        self.idioma = idioma
+
+    # Devuelve el texto reconocido en una imagen PIL
+    def extraer_texto(self, imagen):
+        return self._pytesseract.image_to_string(imagen, lang=self.idioma)
+
+    # No hay nada que liberar: no se mantiene ningún motor entre llamadas
+    def cerrar(self):
+        pass
+
+
+class MotorTesserocr:
+    nombre = "tesserocr"
+
+    # OCR con tesserocr: el motor de Tesseract se carga una sola vez en el proceso y se reutiliza
+    # para todas las imágenes. Una instancia no se debe usar desde varios hilos a la vez
+    def __init__(self, idioma="spa", ruta_tessdata=None):
+        import tesserocr
+
+        opciones = {"lang": idioma}
+        if ruta_tessdata:
+            opciones["path"] = ruta_tessdata
+
+        self.idioma = idioma
+        self._api = tesserocr.PyTessBaseAPI(**opciones)
+
+    # Devuelve el texto reconocido en una imagen PIL
+    def extraer_texto(self, imagen):
+        if imagen.mode not in ("RGB", "L"):
+            imagen = imagen.convert("RGB")
+        self._api.SetImage(imagen)
+        return self._api.GetUTF8Text()
+
+    # Libera el motor de Tesseract
+    def cerrar(self):
+        self._api.End()
+
+
+# Crea el motor pedido; "auto" usa tesserocr si está instalado. Si tesserocr no se puede cargar
+# (no instalado o sin los datos del idioma) se usa pytesseract
+def crear_motor(nombre="auto", idioma="spa", tesseract_cmd=TESSERACT_CMD):
+    if nombre not in MOTORES:
+        raise ValueError(f"Motor OCR desconocido: {nombre!r}. Se espera uno de {MOTORES}.")
+
+    if nombre == "tesserocr" or (nombre == "auto" and TESSEROCR_DISPONIBLE):
+        try:
+            return MotorTesserocr(idioma)
+        except (ImportError, RuntimeError) as e:
+            print(f"tesserocr no disponible, se usa pytesseract: {e}")
+
+    return MotorPytesseract(idioma, tesseract_cmd)
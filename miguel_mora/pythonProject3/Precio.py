@@ -0,0 +1,68 @@
+import re
+
+# Separadores decimal y de miles con los que se muestran los precios en cada idioma
+LOCALES = {
+    "es": {"decimal": ",", "miles": "."},
+    "de": {"decimal": ",", "miles": "."},
+    "it": {"decimal": ",", "miles": "."},
+    "fr": {"decimal": ",", "miles": " "},
+    "en": {"decimal": ".", "miles": ","},
+}
+
+# Símbolos y códigos ISO de moneda, asociados al código ISO que se devuelve
+MONEDAS = {"€": "EUR", "£": "GBP", "$": "USD", "EUR": "EUR", "GBP": "GBP", "USD": "USD"}
+SIMBOLOS_MONEDA = {"EUR": "€", "GBP": "£", "USD": "$"}
+
+# Número de un precio: dígitos con separadores opcionales (puntos, comas, espacios) entre ellos
+PATRON_NUMERO_PRECIO = re.compile(r"\d(?:[\d.,\s]*\d)?")
+PATRON_MONEDA = re.compile(r"€|£|\$|\b(?:EUR|GBP|USD)\b")
+
+
+# Separa un número de precio en su parte entera y sus decimales. Con un idioma conocido se usa
+# su separador decimal; sin él, el último separador solo es decimal si le siguen uno o dos dígitos
+def separar_numero(numero, locale=None):
+    if locale:
+        entero, separador, decimales = numero.rpartition(LOCALES[locale]["decimal"])
+        return (entero, decimales) if separador else (numero, "")
+
+    ultimo_separador = max(numero.rfind("."), numero.rfind(","))
+    if ultimo_separador != -1 and len(numero) - ultimo_separador - 1 in (1, 2):
+        return numero[:ultimo_separador], numero[ultimo_separador + 1:]
+
+    return numero, ""
+
+
+# Convierte un precio mostrado ("1.299,99 €", "12,99€", "£1,299.99") en (céntimos, moneda).
+# Los céntimos son None si el texto no contiene un precio; la moneda es None si no aparece
+def normalizar_precio(texto, locale=None):
+    texto = str(texto or "")
+    coincidencia_moneda = PATRON_MONEDA.search(texto)
+    moneda = MONEDAS[coincidencia_moneda.group()] if coincidencia_moneda else None
+
+    coincidencia_numero = PATRON_NUMERO_PRECIO.search(texto)
+    if not coincidencia_numero:
+        return None, moneda
+
+    entero, decimales = separar_numero(coincidencia_numero.group(), locale)
+    digitos_entero = "".join(caracter for caracter in entero if caracter.isdigit())
+
+    if not digitos_entero or (decimales and not decimales.isdigit()):
+        return None, moneda
+
+    return int(digitos_entero) * 100 + int((decimales + "00")[:2]), moneda
+
+
+# Convierte una columna entera de precios mostrados en dos listas: céntimos y monedas
+def normalizar_precios(textos, locale="es"):
+    resultados = [normalizar_precio(texto, locale) for texto in textos]
+    return [centimos for centimos, _ in resultados], [moneda for _, moneda in resultados]
+
+
+# Da formato a unos céntimos como precio mostrado (ej. "1.299,99 €"), o "" si no hay precio
+def formatear_precio(centimos, locale="es", moneda="EUR"):
+    if centimos is None:
+        return ""
+
+    separadores = LOCALES[locale]
+    entero = f"{centimos // 100:,}".replace(",", separadores["miles"])
+    return f"{entero}{separadores['decimal']}{centimos % 100:02d} {SIMBOLOS_MONEDA.get(moneda, moneda or '')}"
@@ -0,0 +1,97 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageEnhance, ImageFilter
+
+from MotorOCR import TESSERACT_CMD, crear_motor
+
+IDIOMA = "spa"
+
+# Versión del preprocesado; forma parte de la clave de la caché, así que cambiarla invalida los resultados guardados
+VERSION_PREPROCESADO = 1
+
+# Motor OCR de cada proceso del pool, creado una sola vez en _iniciar_proceso
+_motor = None
+
+
+# Ayuda a que el OCR pueda obtener mejor los datos (escala de grises, enfoque y más contraste),
+# todo en memoria: no se guarda ni se vuelve a abrir ninguna imagen intermedia
+def preprocesar_imagen(imagen):
+    imagen = imagen.convert('L')
+    imagen = imagen.filter(ImageFilter.SHARPEN)
+    return ImageEnhance.Contrast(imagen).enhance(2)
+
+
+# Prepara cada proceso del pool: crea su motor OCR, que se reutiliza para todas sus capturas.
+# Cada Tesseract usa un solo hilo: los procesos ya reparten las capturas entre los núcleos y más
+# hilos por proceso solo compiten entre sí
+def _iniciar_proceso(nombre_motor, idioma, tesseract_cmd, hilos_tesseract=None):
+    global _motor
+    if hilos_tesseract:
+        os.environ["OMP_THREAD_LIMIT"] = str(hilos_tesseract)
+    _motor = crear_motor(nombre_motor, idioma, tesseract_cmd)
+
+
+# Preprocesa una captura y extrae su texto con el motor indicado o con el del proceso del pool
+def ocr_captura(ruta_captura, motor=None):
+    with Image.open(ruta_captura) as imagen:
+        imagen_mejorada = preprocesar_imagen(imagen)
+    return (motor or _motor).extraer_texto(imagen_mejorada)
+
+
+# Extrae el texto de varias capturas a la vez, una por proceso, y lo devuelve en el orden de las
+# capturas. Con un solo proceso se trabaja en el proceso actual, sin coste de arranque del pool.
+# motor: "tesserocr", "pytesseract" o "auto" (tesserocr si está instalado).
+# Con una CacheOCR, las capturas iguales a otras ya leídas no vuelven a pasar por Tesseract
+def ocr_capturas(capturas, num_procesos=None, idioma=IDIOMA, tesseract_cmd=TESSERACT_CMD, motor="auto", cache=None):
+    capturas = list(capturas)
+    textos = [None] * len(capturas)
+    claves = []
+    motor_local = None
+
+    if cache is not None:
+        # La clave lleva el motor que de verdad lee las capturas: "auto" o "tesserocr" pueden acabar
+        # en pytesseract (p. ej. sin tessdata), así que se crea antes y se usa su nombre. Los procesos
+        # del pool reciben ese nombre en lugar de "auto"
+        motor_local = crear_motor(motor, idioma, tesseract_cmd)
+        motor = motor_local.nombre
+        for indice, captura in enumerate(capturas):
+            with Image.open(captura) as imagen:
+                claves.append(cache.clave(imagen, motor, idioma, VERSION_PREPROCESADO))
+            textos[indice] = cache.obtener(claves[indice])
+
+    try:
+        pendientes = [indice for indice, texto in enumerate(textos) if texto is None]
+        for indice, texto in zip(pendientes, _ocr_pendientes([capturas[i] for i in pendientes], num_procesos,
+                                                            idioma, tesseract_cmd, motor, motor_local)):
+            textos[indice] = texto
+            if cache is not None:
+                cache.guardar(claves[indice], texto)
+    finally:
+        if motor_local is not None:
+            motor_local.cerrar()
+
+    return textos
+
+
+# Pasa por Tesseract las capturas que no estaban en la caché. Con un solo proceso se usa
+# `motor_local` si ya está creado; si no, se crea uno y se cierra al terminar
+def _ocr_pendientes(capturas, num_procesos, idioma, tesseract_cmd, motor, motor_local=None):
+    if not capturas:
+        return []
+
+    num_procesos = min(num_procesos or os.cpu_count() or 1, len(capturas))
+
+    if num_procesos == 1:
+        if motor_local is not None:
+            return [ocr_captura(captura, motor_local) for captura in capturas]
+
+        motor_local = crear_motor(motor, idioma, tesseract_cmd)
+        try:
+            return [ocr_captura(captura, motor_local) for captura in capturas]
+        finally:
+            motor_local.cerrar()
+
+    with ProcessPoolExecutor(max_workers=num_procesos, initializer=_iniciar_proceso,
+                             initargs=(motor, idioma, tesseract_cmd, 1)) as pool:
+        return list(pool.map(ocr_captura, capturas))
@@ -1,8 +1,15 @@
+from Precio import normalizar_precio
+
+
 class Producto:
+    # __slots__ evita el diccionario por instancia: con millones de productos en memoria
+    # el coste por objeto baja considerablemente
+    __slots__ = ("_nombre", "_precio", "_imagen_url", "_precio_centimos", "_moneda")
+
     def __init__(self, nombre, precio, imagen_url=None):
         self._nombre = nombre
-        self._precio = precio
         self._imagen_url = imagen_url
+        self.precio = precio  # Calcula también el precio numérico
 
     # Getters
     @property
@@ -17,6 +24,16 @@ class Producto:
     def imagen_url(self):
         return self._imagen_url
 
+    # Precio numérico en céntimos (None si el precio no está disponible)
+    @property
+    def precio_centimos(self):
+        return self._precio_centimos
+
+    # Código ISO de la moneda del precio (None si no se detecta)
+    @property
+    def moneda(self):
+        return self._moneda
+
     # Setters
     @nombre.setter
     def nombre(self, nombre):
@@ -25,6 +42,7 @@ class Producto:
     @precio.setter
     def precio(self, precio):
         self._precio = precio
+        self._precio_centimos, self._moneda = normalizar_precio(precio)
 
     @imagen_url.setter
     def imagen_url(self, imagen_url):
@@ -33,6 +51,6 @@ class Producto:
     # Método para mostrar información del producto
     def mostrar_informacion(self):
         print(f"Nombre: {self._nombre}")
-        print(f"Precio: {self._precio} €")
+        print(f"Precio: {self._precio}")
         if self._imagen_url:
             print(f"Imagen URL: {self._imagen_url}")
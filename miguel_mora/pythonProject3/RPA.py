@@ -1,14 +1,18 @@
 import pyautogui
 import time
-from PIL import Image, ImageEnhance, ImageFilter
-import pytesseract
+from PIL import Image
 import re
 from Producto import Producto  # Asegúrate de importar la clase Producto
+from CacheOCR import CacheOCR
+from CapturaIncremental import capturar_incremental
+from Precio import formatear_precio, normalizar_precio
+from ProcesadorOCR import ocr_capturas, preprocesar_imagen
 
 
 class RPA:
 #abre el navegador y cuando llega a la web establece el zoom al 100, luego al 80 y hace 3 caps mientras scrollea
-    def abrir_navegador_capturar(self):
+#en modo incremental solo se guarda lo nuevo de cada captura y se para si la página deja de moverse
+    def abrir_navegador_capturar(self, incremental=True):
         pyautogui.PAUSE = 0.1
 
         # Abrir el navegador Opera
@@ -42,9 +46,22 @@ class RPA:
             time.sleep(0.5)
 
         # Capturar múltiples secciones de la página
+        region_productos = (900, 180, 900, 1600)
+        if incremental:
+            capturas = capturar_incremental(region_productos, paso_scroll=-800, max_capturas=3)
+        else:
+            capturas = self._capturar_completas(region_productos)
+
+        # Cerrar el navegador
+        print("Cerrando el navegador...")
+        pyautogui.hotkey('alt', 'f4')
+
+        return capturas
+
+#hace 3 capturas completas de la región con desplazamiento, sin quitar lo que se repite entre ellas
+    def _capturar_completas(self, region_productos):
         capturas = []
         for i in range(3):  # Realizar 3 capturas con desplazamiento
-            region_productos = (900, 180, 900, 1600)
             screenshot = pyautogui.screenshot(region=region_productos)
             file_name = f"./captura_productos_{i}.png"
             screenshot.save(file_name)
@@ -53,35 +70,25 @@ class RPA:
             pyautogui.scroll(-800)  # Scroll
             time.sleep(2)
 
-        # Cerrar el navegador
-        print("Cerrando el navegador...")
-        pyautogui.hotkey('alt', 'f4')
-
         return capturas
-#ayuda a que el ocr pueda obtener mejor los datos (sube contraste, blanco y negro...etc)
+#ayuda a que el ocr pueda obtener mejor los datos (sube contraste, blanco y negro...etc) y guarda la imagen mejorada
     def preprocesar_imagen(self, ruta_imagen):
         try:
-            imagen = Image.open(ruta_imagen)
-            imagen = imagen.convert('L')
-            imagen = imagen.filter(ImageFilter.SHARPEN)
-            enhancer = ImageEnhance.Contrast(imagen)
-            imagen = enhancer.enhance(2)
-            imagen.save(ruta_imagen.replace(".png", "_mejorada.png"))
+            with Image.open(ruta_imagen) as imagen:
+                imagen_mejorada = preprocesar_imagen(imagen)
+            imagen_mejorada.save(ruta_imagen.replace(".png", "_mejorada.png"))
             return ruta_imagen.replace(".png", "_mejorada.png")
         except Exception as e:
             print(f"Error al preprocesar la imagen: {e}")
             return ruta_imagen
 
-#extrae el texto de las capturas realizadas
-    def realizar_ocr(self, capturas):
+#extrae el texto de las capturas realizadas, varias a la vez (num_procesos=None usa todos los núcleos)
+#motor: "tesserocr" (modelo cargado una vez por proceso), "pytesseract" o "auto" (tesserocr si está instalado)
+#cache: CacheOCR opcional, para no repetir el OCR de capturas iguales a las de otra ejecución
+    def realizar_ocr(self, capturas, num_procesos=None, motor="auto", cache=None):
         try:
-            pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
-            texto_extraido = ""
-
-            for captura in capturas:
-                captura_mejorada = self.preprocesar_imagen(captura)
-                imagen = Image.open(captura_mejorada)
-                texto_extraido += pytesseract.image_to_string(imagen, lang='spa') + "\n"
+            textos = ocr_capturas(capturas, num_procesos, motor=motor, cache=cache)
+            texto_extraido = "".join(texto + "\n" for texto in textos)
 
             if not texto_extraido.strip():
                 print("Advertencia: No se detectó texto en las imágenes.")
@@ -101,13 +108,19 @@ class RPA:
         marcas = ["HP", "ASUS", "Lenovo", "MSI", "DELL", "Portátil", "Ordenador"]
 
         productos = []
+        vistos = set()  # Una línea en el borde de dos capturas puede leerse dos veces
 
         for linea in lineas:
+            if linea in vistos:
+                continue
+            vistos.add(linea)
+
             if any(linea.lower().startswith(marca.lower()) for marca in marcas):
                 # Filtro para detectar precios
                 precio_match = re.search(patron_precio, linea)
                 if precio_match:
-                    precio = precio_match.group().replace('.', '').replace(',', '.')
+                    centimos, _ = normalizar_precio(precio_match.group(), "es")
+                    precio = formatear_precio(centimos)
                 else:
                     precio = "Precio no disponible"
 
@@ -120,7 +133,9 @@ class RPA:
 #ejecuta varios metodos de los antes creados en el orden correcto
     def ejecutar(self):
         capturas = self.abrir_navegador_capturar()
-        texto = self.realizar_ocr(capturas)
+        cache = CacheOCR()
+        texto = self.realizar_ocr(capturas, cache=cache)
+        print(f"Caché OCR: {cache.estadisticas()}")
         if texto:
             productos = self.procesar_texto(texto)
             for producto in productos:
@@ -1,21 +1,27 @@
 from playwright.sync_api import sync_playwright
 import time
 from Producto import Producto
+from Precio import formatear_precio, normalizar_precio
 
 
 class Scrape:
 
+    #headless=True abre el navegador sin ventana, para ejecutarlo en servidores sin pantalla
+    def __init__(self, headless=False):
+        self.headless = headless
+
     #metodo que abre el navegador y obtiene los datos
-    def abrir_navegador_y_extraer(self):
+    #si se pasa un ExportadorProductos, cada producto extraído se escribe también en disco
+    def abrir_navegador_y_extraer(self, exportador=None, busqueda="portátil i5"):
         listado = []
         with sync_playwright() as p:
-            browser = p.chromium.launch(headless=False)
+            browser = p.chromium.launch(headless=self.headless)
             page = browser.new_page()
             page.goto('https://www.amazon.es')
             time.sleep(1)
 
             search_box = page.query_selector("input#twotabsearchtextbox")
-            search_box.fill("portátil i5")
+            search_box.fill(busqueda)
             search_box.press("Enter")
             page.wait_for_timeout(2000)
 
@@ -34,11 +40,17 @@ class Scrape:
 
                     if nombre and precio_entero and precio_decimal and imagen:
                         nombre_completo = nombre.inner_text().strip()
-                        precio = f"{precio_entero.inner_text().strip()},{precio_decimal.inner_text().strip()} €"
+                        # La parte entera puede traer su propia coma decimal ("1.299,"); el normalizador la ignora
+                        centimos, _ = normalizar_precio(
+                            f"{precio_entero.inner_text().strip()},{precio_decimal.inner_text().strip()}", "es"
+                        )
+                        precio = formatear_precio(centimos)
                         url_imagen = imagen.get_attribute("src").strip()
 
                         producto_obj = Producto(nombre_completo, precio, url_imagen)
                         listado.append(producto_obj)
+                        if exportador is not None:
+                            exportador.escribir(producto_obj, busqueda)
                         contador += 1
                 except Exception as e:
                     print(f"Error al procesar producto: {e}")
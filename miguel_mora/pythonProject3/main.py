@@ -1,11 +1,38 @@
 # main.py
+import argparse
 import sys
-from PyQt5.QtWidgets import QApplication
-from MainWindow import MainWindow
+import time
 
-def main():
-    app = QApplication(sys.argv)
+INICIO = time.perf_counter()
+
+
+# Modo sin interfaz: extrae productos con Playwright en headless y los exporta a disco.
+# Solo importa Scrape y el exportador, nunca PyQt5, pyautogui ni pytesseract
+def ejecutar_scrape(args):
+    from Exportador import ExportadorProductos
+    from Scrape import Scrape
+
+    if args.tiempos:
+        print(f"Arranque: {(time.perf_counter() - INICIO) * 1000:.0f} ms", file=sys.stderr)
+
+    with ExportadorProductos(args.salida) as exportador:
+        for busqueda in args.busquedas:
+            productos = Scrape(headless=True).abrir_navegador_y_extraer(exportador, busqueda)
+            print(f"{busqueda}: {len(productos)} productos", file=sys.stderr)
+
+    print(f"{exportador.filas_escritas} productos escritos en {args.salida}", file=sys.stderr)
+    return 0
+
+
+# Modo con interfaz gráfica (el de siempre)
+def ejecutar_interfaz(args):
+    from PyQt5.QtWidgets import QApplication
+    from MainWindow import MainWindow
 
+    if args.tiempos:
+        print(f"Arranque: {(time.perf_counter() - INICIO) * 1000:.0f} ms", file=sys.stderr)
+
+    app = QApplication(sys.argv[:1])
 
     try:
         with open("resources/style.qss", "r") as f:
@@ -15,8 +42,21 @@ def main():
 
     main_window = MainWindow()
     main_window.show()
-    sys.exit(app.exec_())
+    return app.exec_()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extracción de productos de Amazon por RPA o scraping.")
+    parser.add_argument("--tiempos", action="store_true", help="Muestra el tiempo de arranque.")
+    comandos = parser.add_subparsers(dest="comando")
+
+    scrape = comandos.add_parser("scrape", help="Extrae productos sin interfaz y los exporta a CSV/JSONL.")
+    scrape.add_argument("--salida", required=True, help="Fichero de salida (.csv o .jsonl).")
+    scrape.add_argument("busquedas", nargs="*", default=["portátil i5"], help="Términos de búsqueda.")
+    scrape.set_defaults(ejecutar=ejecutar_scrape)
+
+    args = parser.parse_args()
+    sys.exit(getattr(args, "ejecutar", ejecutar_interfaz)(args))
 
 if __name__ == '__main__':
     main()
-
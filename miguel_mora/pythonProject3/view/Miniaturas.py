@@ -0,0 +1,184 @@
+import hashlib
+import os
+from collections import OrderedDict
+
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice, QObject, QRunnable, QSize, QThreadPool, Qt, pyqtSignal
+from PyQt5.QtGui import QImage, QImageReader
+
+from FicherosCache import descartar_lru, escribir_atomico
+
+
+# Codifica una imagen ya escalada como PNG, que es lo que se guarda en las cachés
+def codificar_png(imagen):
+    datos = QByteArray()
+    buffer = QBuffer(datos)
+    buffer.open(QIODevice.WriteOnly)
+    imagen.save(buffer, "PNG")
+    buffer.close()
+    return bytes(datos)
+
+
+# Decodifica una imagen directamente al tamaño de la miniatura: el decodificador JPEG se salta
+# casi todo el trabajo en lugar de decodificar la imagen completa y escalarla después
+def decodificar_escalada(datos, tamano):
+    buffer = QBuffer()
+    buffer.setData(QByteArray(datos))
+    buffer.open(QIODevice.ReadOnly)
+
+    lector = QImageReader(buffer)
+    tamano_original = lector.size()
+    if tamano_original.isValid() and max(tamano_original.width(), tamano_original.height()) > tamano:
+        lector.setScaledSize(tamano_original.scaled(QSize(tamano, tamano), Qt.KeepAspectRatio))
+
+    return lector.read()
+
+
+# Señales que emiten los hilos de descarga; Qt las entrega en el hilo de la interfaz
+class _SenalesDescarga(QObject):
+    descargada = pyqtSignal(str, bytes)  # url, PNG escalado
+    fallida = pyqtSignal(str, str)  # url, motivo
+
+
+# Descarga una imagen, la decodifica y la escala fuera del hilo de la interfaz (QImage, no QPixmap,
+# se puede usar en otros hilos). Antes de descargar mira la caché en disco
+class _TareaMiniatura(QRunnable):
+    def __init__(self, sesion, url, tamano, carpeta_cache, disco_max_bytes, senales):
+        super().__init__()
+        self.sesion = sesion
+        self.url = url
+        self.tamano = tamano
+        self.carpeta_cache = carpeta_cache
+        self.disco_max_bytes = disco_max_bytes
+        self.senales = senales
+
+    def run(self):
+        ruta_cache = ServicioMiniaturas.ruta_en_disco(self.carpeta_cache, self.url)
+
+        try:
+            if ruta_cache and os.path.exists(ruta_cache):
+                with open(ruta_cache, "rb") as fichero:
+                    png = fichero.read()
+                os.utime(ruta_cache)  # La fecha de modificación marca el último uso, para descartar por LRU
+                self.senales.descargada.emit(self.url, png)
+                return
+
+            respuesta = self.sesion.get(self.url, timeout=5)
+            if respuesta.status_code != 200:
+                self.senales.fallida.emit(self.url, f"HTTP {respuesta.status_code}")
+                return
+
+            imagen = decodificar_escalada(respuesta.content, self.tamano)
+            if imagen.isNull():
+                self.senales.fallida.emit(self.url, "Formato de imagen no válido")
+                return
+
+            png = codificar_png(imagen)
+
+            if ruta_cache:
+                try:
+                    escribir_atomico(ruta_cache, png)
+                    descartar_lru(self.carpeta_cache, ".png", self.disco_max_bytes)
+                except OSError:
+                    pass  # Sin caché en disco la miniatura se muestra igual, solo no se guarda
+
+            self.senales.descargada.emit(self.url, png)
+
+        except Exception as e:
+            self.senales.fallida.emit(self.url, str(e))
+
+
+class ServicioMiniaturas(QObject):
+    # Se emiten en el hilo de la interfaz cuando una miniatura está lista o no se ha podido cargar
+    miniatura_lista = pyqtSignal(str, QImage)  # url, miniatura
+    miniatura_fallida = pyqtSignal(str, str)  # url, motivo
+
+    # Descarga miniaturas en paralelo con una sesión compartida y las escala a `tamano` píxeles.
+    # Las miniaturas escaladas (PNG) se guardan en una caché LRU en memoria limitada a
+    # `memoria_max_bytes` y en una caché en disco con el sha256 de la URL como nombre, que también
+    # descarta primero las menos usadas cuando supera `disco_max_bytes`
+    def __init__(self, sesion, tamano=100, max_hilos=8, memoria_max_bytes=16 * 1024 * 1024,
+                 carpeta_cache=os.path.join(".cache", "miniaturas"), disco_max_bytes=64 * 1024 * 1024, parent=None):
+        super().__init__(parent)
+        self.sesion = sesion
+        self.tamano = tamano
+        self.memoria_max_bytes = memoria_max_bytes
+        self.carpeta_cache = carpeta_cache
+        self.disco_max_bytes = disco_max_bytes
+        self.aciertos_memoria = 0
+        self.descargas = 0
+
+        self._memoria = OrderedDict()  # url -> PNG escalado, del menos al más reciente
+        self._bytes_en_memoria = 0
+        self._pendientes = set()  # URLs que ya se están descargando
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_hilos)
+
+        self._senales = _SenalesDescarga(self)
+        self._senales.descargada.connect(self._al_descargar)
+        self._senales.fallida.connect(self._al_fallar)
+
+        if self.carpeta_cache:
+            os.makedirs(self.carpeta_cache, exist_ok=True)
+
+    # Ruta del fichero de caché en disco de una URL (None si no hay caché en disco)
+    @staticmethod
+    def ruta_en_disco(carpeta_cache, url):
+        if not carpeta_cache:
+            return None
+        return os.path.join(carpeta_cache, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".png")
+
+    # Pide la miniatura de una URL; la respuesta llega por miniatura_lista o miniatura_fallida.
+    # Si está en memoria se emite inmediatamente, sin pasar por ningún hilo
+    def solicitar(self, url):
+        png = self._memoria.get(url)
+        if png is not None:
+            self._memoria.move_to_end(url)
+            self.aciertos_memoria += 1
+            self.miniatura_lista.emit(url, QImage.fromData(png))
+            return
+
+        if url in self._pendientes:
+            return  # Ya se está descargando; se avisará al terminar
+
+        self._pendientes.add(url)
+        self.descargas += 1
+        self.pool.start(_TareaMiniatura(self.sesion, url, self.tamano, self.carpeta_cache,
+                                        self.disco_max_bytes, self._senales))
+
+    # Descarta las descargas que aún no han empezado
+    def cancelar(self):
+        self.pool.clear()
+        self._pendientes.clear()
+
+    def _al_descargar(self, url, png):
+        self._pendientes.discard(url)
+        self._guardar_en_memoria(url, png)
+        self.miniatura_lista.emit(url, QImage.fromData(png))
+
+    def _al_fallar(self, url, motivo):
+        self._pendientes.discard(url)
+        self.miniatura_fallida.emit(url, motivo)
+
+    # Guarda una miniatura en la caché en memoria y expulsa las menos usadas si se supera el límite
+    def _guardar_en_memoria(self, url, png):
+        if url in self._memoria:
+            self._bytes_en_memoria -= len(self._memoria.pop(url))
+
+        self._memoria[url] = png
+        self._bytes_en_memoria += len(png)
+
+        while self._bytes_en_memoria > self.memoria_max_bytes and len(self._memoria) > 1:
+            _, expulsada = self._memoria.popitem(last=False)
+            self._bytes_en_memoria -= len(expulsada)
+
+
+# Servicio compartido entre todas las vistas, para que la caché en memoria sobreviva entre ventanas
+_servicio = None
+
+
+def obtener_servicio_miniaturas(sesion):
+    global _servicio
+    if _servicio is None:
+        _servicio = ServicioMiniaturas(sesion)
+    return _servicio
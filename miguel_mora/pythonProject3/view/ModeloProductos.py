@@ -0,0 +1,147 @@
+from collections import OrderedDict
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt5.QtGui import QIcon, QPixmap
+from PyQt5.QtWidgets import QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+
+class ModeloProductos(QAbstractTableModel):
+    COLUMNAS = ["Imagen", "Nombre", "Precio"]
+    COLUMNA_IMAGEN = 0
+
+    # Estados de una miniatura que aún no es un QPixmap
+    CARGANDO = "Cargando..."
+    NO_DISPONIBLE = "No imágenes disponibles"
+
+    # Modelo de la tabla de productos: la vista solo pide los datos de las filas visibles, así que
+    # las miniaturas se solicitan al servicio la primera vez que se pinta su fila. Se guardan como
+    # mucho `max_miniaturas` en memoria; si una se descarta, se vuelve a pedir al volver a verla
+    def __init__(self, productos, servicio_miniaturas, max_miniaturas=256, parent=None):
+        super().__init__(parent)
+        self.productos = []
+        self.servicio_miniaturas = servicio_miniaturas
+        self.max_miniaturas = max_miniaturas
+
+        self._miniaturas = OrderedDict()  # url -> QPixmap, CARGANDO o NO_DISPONIBLE
+        self._filas_por_url = {}  # url -> filas que muestran esa imagen
+
+        self.servicio_miniaturas.miniatura_lista.connect(self._al_recibir_miniatura)
+        self.servicio_miniaturas.miniatura_fallida.connect(self._al_fallar_miniatura)
+
+        self.agregar_productos(productos)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.productos)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNAS)
+
+    def headerData(self, seccion, orientacion, rol=Qt.DisplayRole):
+        if rol == Qt.DisplayRole and orientacion == Qt.Horizontal:
+            return self.COLUMNAS[seccion]
+        return super().headerData(seccion, orientacion, rol)
+
+    def data(self, indice, rol=Qt.DisplayRole):
+        if not indice.isValid():
+            return None
+
+        producto = self.productos[indice.row()]
+        columna = indice.column()
+
+        if columna == self.COLUMNA_IMAGEN:
+            if rol in (Qt.DecorationRole, Qt.DisplayRole):
+                miniatura = self._miniatura(producto.imagen_url)
+                if rol == Qt.DecorationRole:
+                    return miniatura if isinstance(miniatura, QPixmap) else None
+                return None if isinstance(miniatura, QPixmap) else miniatura
+            return None
+
+        if rol == Qt.DisplayRole:
+            return producto.nombre if columna == 1 else producto.precio
+        if rol == Qt.ToolTipRole and columna == 1:
+            return producto.nombre
+
+        return None
+
+    # Añade productos al final de la tabla avisando a la vista solo de las filas nuevas
+    def agregar_productos(self, productos):
+        productos = list(productos)
+        if not productos:
+            return
+
+        primera_fila = len(self.productos)
+        self.beginInsertRows(QModelIndex(), primera_fila, primera_fila + len(productos) - 1)
+
+        for fila, producto in enumerate(productos, start=primera_fila):
+            self.productos.append(producto)
+            if producto.imagen_url:
+                self._filas_por_url.setdefault(producto.imagen_url, []).append(fila)
+
+        self.endInsertRows()
+
+    # Deja de recibir miniaturas del servicio compartido (al cerrar la ventana)
+    def desconectar(self):
+        try:
+            self.servicio_miniaturas.miniatura_lista.disconnect(self._al_recibir_miniatura)
+            self.servicio_miniaturas.miniatura_fallida.disconnect(self._al_fallar_miniatura)
+        except TypeError:
+            pass  # Ya estaban desconectadas
+
+    # Devuelve la miniatura de una URL y la pide al servicio la primera vez que se necesita
+    def _miniatura(self, url):
+        if not url:
+            return self.NO_DISPONIBLE
+
+        miniatura = self._miniaturas.get(url)
+        if miniatura is not None:
+            self._miniaturas.move_to_end(url)
+            return miniatura
+
+        self._recordar(url, self.CARGANDO)
+        self.servicio_miniaturas.solicitar(url)
+        return self.CARGANDO
+
+    def _al_recibir_miniatura(self, url, imagen):
+        if url in self._filas_por_url:
+            self._recordar(url, QPixmap.fromImage(imagen))
+            self._repintar(url)
+
+    def _al_fallar_miniatura(self, url, motivo):
+        if url in self._filas_por_url:
+            print(f"Error al cargar la imagen {url}: {motivo}")
+            self._recordar(url, self.NO_DISPONIBLE)
+            self._repintar(url)
+
+    def _recordar(self, url, miniatura):
+        self._miniaturas[url] = miniatura
+        self._miniaturas.move_to_end(url)
+
+        while len(self._miniaturas) > self.max_miniaturas:
+            self._miniaturas.popitem(last=False)
+
+    def _repintar(self, url):
+        for fila in self._filas_por_url.get(url, ()):
+            indice = self.index(fila, self.COLUMNA_IMAGEN)
+            self.dataChanged.emit(indice, indice, [Qt.DecorationRole, Qt.DisplayRole])
+
+
+class DelegadoMiniatura(QStyledItemDelegate):
+    # Pinta la miniatura centrada en su celda, o el texto de estado si aún no hay imagen
+    def paint(self, painter, opcion, indice):
+        opcion = QStyleOptionViewItem(opcion)  # Copia: la opción que pasa Qt se reutiliza en otras celdas
+        self.initStyleOption(opcion, indice)
+        estilo = opcion.widget.style() if opcion.widget else None
+
+        # Fondo de la celda (selección incluida) sin el contenido por defecto
+        opcion.text = ""
+        opcion.icon = QIcon()
+        if estilo:
+            estilo.drawControl(QStyle.CE_ItemViewItem, opcion, painter, opcion.widget)
+
+        pixmap = indice.data(Qt.DecorationRole)
+        if isinstance(pixmap, QPixmap):
+            x = opcion.rect.x() + (opcion.rect.width() - pixmap.width()) // 2
+            y = opcion.rect.y() + (opcion.rect.height() - pixmap.height()) // 2
+            painter.drawPixmap(x, y, pixmap)
+        else:
+            painter.drawText(opcion.rect, Qt.AlignCenter, indice.data(Qt.DisplayRole) or "")
@@ -1,13 +1,35 @@
-from PyQt5.QtGui import QPixmap
-from PyQt5.QtWidgets import QMainWindow, QTableWidget, QTableWidgetItem, QLabel, QVBoxLayout, QPushButton, QWidget, QMessageBox
+from PyQt5.QtWidgets import QMainWindow, QTableView, QHeaderView, QLabel, QVBoxLayout, QPushButton, QWidget, QMessageBox
 from PyQt5.QtCore import Qt
 import requests
+from requests.adapters import HTTPAdapter
+
+from view.Miniaturas import obtener_servicio_miniaturas
+from view.ModeloProductos import DelegadoMiniatura, ModeloProductos
+
+
+# Sesión HTTP compartida entre todas las vistas para reutilizar las conexiones (keep-alive)
+_sesion = None
+
+
+def obtener_sesion():
+    global _sesion
+    if _sesion is None:
+        _sesion = requests.Session()
+        adaptador = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=2)
+        _sesion.mount("https://", adaptador)
+        _sesion.mount("http://", adaptador)
+    return _sesion
 
 
 class Vista(QMainWindow):
-    def __init__(self, data):
+    def __init__(self, data, session=None, miniaturas=None):
         super().__init__()
         self.data = data
+        self.session = session or obtener_sesion()
+
+        # Las imágenes se descargan en segundo plano y el modelo las pide solo para las filas visibles
+        self.miniaturas = miniaturas or obtener_servicio_miniaturas(self.session)
+
         self.initUI()
 
     def initUI(self):
@@ -25,59 +47,32 @@ class Vista(QMainWindow):
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
 
-        # Configuración de la tabla
-        self.tableWidget = QTableWidget()
-        self.tableWidget.setRowCount(len(self.data))
-        self.tableWidget.setColumnCount(3)
-        self.tableWidget.setHorizontalHeaderLabels(["Imagen", "Nombre", "Precio"])
-        self.tableWidget.setColumnWidth(0, 150)  # Ancho para las imágenes
-        self.tableWidget.setColumnWidth(1, 1220)  # Ancho para los nombres
-        self.tableWidget.setColumnWidth(2, 150)  # Ancho para los precios
+        # Configuración de la tabla: una QTableView sobre un modelo, que solo pinta las filas visibles
+        # en lugar de crear un widget por producto
+        self.modelo = ModeloProductos(self.data, self.miniaturas, parent=self)
+        self.tabla = QTableView()
+        self.tabla.setModel(self.modelo)
+        self.tabla.setItemDelegateForColumn(ModeloProductos.COLUMNA_IMAGEN, DelegadoMiniatura(self.tabla))
+        self.tabla.setColumnWidth(0, 150)  # Ancho para las imágenes
+        self.tabla.setColumnWidth(1, 1220)  # Ancho para los nombres
+        self.tabla.setColumnWidth(2, 150)  # Ancho para los precios
+
+        # Todas las filas miden lo mismo, así Qt no tiene que medirlas una a una
+        self.tabla.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.tabla.verticalHeader().setDefaultSectionSize(120)
+        self.tabla.setWordWrap(True)
 
         # Mostrar solo 4 filas visibles
-        self.tableWidget.setFixedWidth(1600)
-        self.tableWidget.setFixedHeight(4 * 133)  # Altura ajustada para 4 filas
-
-        for row in range(len(self.data)):
-            self.tableWidget.setRowHeight(row, 120)
-
-        layout.addWidget(self.tableWidget, alignment=Qt.AlignCenter)
-
-        # Insertar datos en la tabla
-        for row, producto in enumerate(self.data):
-            # Cargar la imagen
-            image_label = QLabel()
-            pixmap = QPixmap()
-            try:
-                if producto.imagen_url:  # Verificar si la URL de la imagen no está vacía
-                    response = requests.get(producto.imagen_url, timeout=5)
-                    if response.status_code == 200:
-                        pixmap.loadFromData(response.content)
-                    else:
-                        image_label.setText("No imágenes disponibles")
-                else:
-                    image_label.setText("No imágenes disponibles")
-            except Exception as e:
-                self.show_error_message("Error al cargar la imagen", str(e))
-                image_label.setText("No imágenes disponibles")
-
-            pixmap = pixmap.scaled(100, 100, Qt.KeepAspectRatio)
-            if not pixmap.isNull():
-                image_label.setPixmap(pixmap)
-            image_label.setAlignment(Qt.AlignCenter)
-            self.tableWidget.setCellWidget(row, 0, image_label)
-
-            # Nombre del producto
-            self.tableWidget.setItem(row, 1, QTableWidgetItem(producto.nombre))
-
-            # Precio del producto
-            self.tableWidget.setItem(row, 2, QTableWidgetItem(producto.precio))
-
-        self.tableWidget.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
-        self.tableWidget.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.tabla.setFixedWidth(1600)
+        self.tabla.setFixedHeight(4 * 133)  # Altura ajustada para 4 filas
+
+        layout.addWidget(self.tabla, alignment=Qt.AlignCenter)
+
+        self.tabla.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+        self.tabla.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
         # Etiqueta de total de productos
-        total_label = QLabel(f"Total productos: {len(self.data)}")
+        self.total_label = total_label = QLabel(f"Total productos: {len(self.data)}")
         total_label.setAlignment(Qt.AlignCenter)
         total_label.setStyleSheet("""
         font-size: 16px;
@@ -91,6 +86,16 @@ class Vista(QMainWindow):
         back_button.clicked.connect(self.return_to_menu)
         layout.addWidget(back_button, alignment=Qt.AlignCenter)
 
+    # Añade productos a la tabla sin reconstruirla (por ejemplo, según llegan de un scraping)
+    def agregar_productos(self, productos):
+        self.modelo.agregar_productos(productos)
+        self.total_label.setText(f"Total productos: {self.modelo.rowCount()}")
+
+    # Al cerrar la ventana deja de recibir miniaturas del servicio compartido
+    def closeEvent(self, event):
+        self.modelo.desconectar()
+        super().closeEvent(event)
+
     def return_to_menu(self):
         try:
             from MainWindow import MainWindow